@@ -0,0 +1,190 @@
+# ======================================================================================================================
+#      File:  /benchmarks/common.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Timing and reporting helpers shared by the benchmark scripts."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import json
+import platform
+import statistics
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Isolation
+# ----------------------------------------------------------------------------------------------------------------------
+def isolate(folder: str) -> None:
+    """Keep a benchmark run of the GUI away from the user's own Bine files.
+
+    Journals, the document cache and the restored session are all turned off, so a run neither writes anything there
+    nor stops to offer to recover a journal left by the user.  The configuration, state and cache directories are also
+    pointed into the provided folder for anything that is written all the same.  Must be called before the first
+    MainWindow is created.
+    """
+    for variable in ('XDG_CONFIG_HOME', 'XDG_STATE_HOME', 'XDG_CACHE_HOME', 'APPDATA', 'LOCALAPPDATA'):
+        os.environ[variable] = os.path.join(folder, variable.lower())
+    settings.journal_changes = False
+    settings.cache_documents = False
+    settings.restore_session = False
+
+
+
+
+# ======================================================================================================================
+# Measurement
+# ----------------------------------------------------------------------------------------------------------------------
+def measure(function: Callable[[Any], Any], repeat: int = 5, setup: Callable[[], Any] = None) -> List[float]:
+    """Time a function a number of times.
+
+    Arguments:
+        function: The function to be timed.  It is passed the result of setup, when setup is provided.
+        repeat: The number of times to run the function.
+        setup: Optional function, run before each call but not timed, to prepare the state for the function.
+
+    Returns:
+        The time of each run in seconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is None:
+            start = perf_counter()
+            function()
+        else:
+            state = setup()
+            start = perf_counter()
+            function(state)
+        samples.append(perf_counter() - start)
+    return samples
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def percentile(samples: List[float], fraction: float) -> float:
+    """Return the sample at the given fraction (0 to 1) of the sorted samples, interpolating between neighbours."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Reduce timing samples, in seconds, to statistics in milliseconds."""
+    return {
+        'runs': len(samples),
+        'min_ms': round(min(samples) * 1000, 4),
+        'p50_ms': round(percentile(samples, 0.5) * 1000, 4),
+        'p99_ms': round(percentile(samples, 0.99) * 1000, 4),
+        'mean_ms': round(statistics.fmean(samples) * 1000, 4)
+    }
+
+
+
+
+# ======================================================================================================================
+# Reporting
+# ----------------------------------------------------------------------------------------------------------------------
+def print_table(results: Dict[str, Dict[str, Any]], columns: List[str]) -> None:
+    """Print one row per benchmark with the selected statistics as columns."""
+    width = max([len(name) for name in results] + [9])
+    widths = [max(12, len(column) + 2) for column in columns]
+    print(f"{'benchmark':<{width}}" + ''.join(f'{column:>{size}}' for column, size in zip(columns, widths)))
+    for name, result in results.items():
+        print(f'{name:<{width}}' + ''.join(f'{str(result.get(column, "")):>{size}}'
+                                            for column, size in zip(columns, widths)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def write_json(filename: str, kind: str, results: Dict[str, Dict[str, Any]], parameters: Dict[str, Any]) -> None:
+    """Save benchmark results, along with what they were run with and on, as machine-readable JSON."""
+    document = {
+        'kind': kind,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': parameters,
+        'results': results
+    }
+    with open(filename, 'w', encoding='utf-8') as handle:
+        json.dump(document, handle, indent=2)
+
+
+
+
+# ======================================================================================================================
+# Comparison
+# ----------------------------------------------------------------------------------------------------------------------
+def compare(baseline: str, current: str, threshold: float = 0.2, columns: Tuple[str, ...] = ('p50_ms', 'p99_ms'),
+            floor: float = 0.05) -> int:
+    """Compare two JSON result files and print the change in each benchmark, flagging regressions.
+
+    Arguments:
+        baseline: Results file from the earlier run.
+        current: Results file from the later run.
+        threshold: Fractional slowdown above which a benchmark is flagged as a regression (0.2 is 20% slower).
+        columns: The statistics to compare.
+        floor: Values below this (e.g. times under 0.05 ms) are too noisy to compare and are never flagged.
+
+    Returns:
+        The number of regressions found.
+    """
+    with open(baseline, 'r', encoding='utf-8') as handle:
+        before = json.load(handle)['results']
+    with open(current, 'r', encoding='utf-8') as handle:
+        after = json.load(handle)['results']
+
+    regressions = 0
+    width = max([len(name) for name in after] + [9]) + 2
+    column = max([len(statistic) for statistic in columns] + [9]) + 2
+    print(f"{'benchmark':<{width}}{'statistic':>{column}}{'before':>14}{'after':>14}{'change':>10}")
+    for name, result in after.items():
+        if name not in before:
+            print(f'{name:<{width}}  (new)')
+            continue
+        for statistic in columns:
+            old, new = before[name].get(statistic), result.get(statistic)
+            if old is None or new is None:
+                continue
+            if old:
+                change = (new - old) / old
+            else:
+                change = float('inf') if new > 0 else 0.0
+            flag = ''
+            if change > threshold and new >= floor:
+                flag = '  REGRESSION'
+                regressions += 1
+            print(f'{name:<{width}}{statistic:>{column}}{old:>14.3f}{new:>14.3f}{change:>+10.1%}{flag}')
+    for name in before:
+        if name not in after:
+            print(f'{name:<{width}}  (missing)')
+
+    print(f'{regressions} regression(s) over {threshold:.0%}')
+    return regressions
+
+
+
+
+# End of File
@@ -0,0 +1,137 @@
+# ======================================================================================================================
+#      File:  /benchmarks/generate.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Generator for synthetic checklist documents of any size and shape, for benchmarking.
+
+    python benchmarks/generate.py --items 10000 --depth 3 --fanout 8 --duplicates 0.1 --checked 0.3 -o big.md
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import sys
+import math
+import random
+from argparse import ArgumentParser
+from typing import List
+
+
+
+
+# ======================================================================================================================
+# Constants
+# ----------------------------------------------------------------------------------------------------------------------
+WORDS = [
+    'apple', 'banana', 'battery', 'blanket', 'boots', 'brush', 'cable', 'camera', 'charger', 'cherry', 'compass',
+    'cooler', 'fuel', 'gloves', 'hammock', 'hat', 'jacket', 'knife', 'lamp', 'lantern', 'laptop', 'map', 'matches',
+    'paste', 'pants', 'passport', 'phone', 'pillow', 'rope', 'sandals', 'shirt', 'snacks', 'soap', 'socks', 'stove',
+    'sunscreen', 'tarp', 'tent', 'towel', 'water', 'wool'
+]
+
+
+
+
+# ======================================================================================================================
+# Generator
+# ----------------------------------------------------------------------------------------------------------------------
+def generate(items: int = 1000,
+             depth: int = 3,
+             fanout: int = 8,
+             duplicates: float = 0.0,
+             checked: float = 0.0,
+             seed: int = 0,
+             title: str = 'Synthetic Checklist') -> str:
+    """Generate the Markdown for a checklist document.
+
+    Arguments:
+        items: The total number of items in the document.
+        depth: The number of levels of items - 1 generates a flat list.
+        fanout: The number of children given to each item that isn't at the deepest level.  The number of top-level
+            items grows as needed to reach the item count.
+        duplicates: The fraction of items that repeat the text of an earlier item.
+        checked: The fraction of leaf items that are checked.
+        seed: Seed for the random choices, the same arguments always produce the same document.
+        title: The title of the document.
+
+    Returns:
+        The Markdown text of the document, in the same format that Bine saves.
+    """
+    rng = random.Random(seed)
+
+    # Work out how many top-level items are needed for the rest of the tree to reach the item count.
+    subtree = sum(fanout ** level for level in range(depth))
+    top = max(1, math.ceil(items / subtree))
+
+    lines: List[str] = [title, '=' * 120, 'Generated for benchmarking.', '']
+    texts: List[str] = []
+    remaining = items
+    stack = [(0, top)]
+    while stack and remaining:
+        level, siblings = stack.pop()
+        if siblings > 1:
+            stack.append((level, siblings - 1))
+
+        if texts and rng.random() < duplicates:
+            text = rng.choice(texts)
+        else:
+            text = f'{rng.choice(WORDS)} {rng.choice(WORDS)} {len(texts)}'
+            texts.append(text)
+        remaining -= 1
+
+        parent = level + 1 < depth and remaining > 0
+        mark = 'x' if not parent and rng.random() < checked else ' '
+        lines.append(f"{'    ' * level}- [{mark}] {text}{':' if parent else ''}")
+        if parent:
+            stack.append((level + 1, fanout))
+
+    return '\n'.join(lines) + '\n'
+
+
+
+
+# ======================================================================================================================
+# Main Function
+# ----------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    parser = ArgumentParser(description='Generate a synthetic checklist document for benchmarking.')
+    parser.add_argument('-n', '--items', type=int, default=1000, help='total number of items')
+    parser.add_argument('-d', '--depth', type=int, default=3, help='number of levels of items')
+    parser.add_argument('-f', '--fanout', type=int, default=8, help='number of children of each parent item')
+    parser.add_argument('--duplicates', type=float, default=0.0, help='fraction of items with repeated text')
+    parser.add_argument('--checked', type=float, default=0.0, help='fraction of leaf items that are checked')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('-o', '--output', help='file to write, defaults to standard output')
+    args = parser.parse_args()
+
+    text = generate(args.items, args.depth, args.fanout, args.duplicates, args.checked, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+
+
+# End of File
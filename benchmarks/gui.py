@@ -0,0 +1,250 @@
+# ======================================================================================================================
+#      File:  /benchmarks/gui.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Latency benchmarks of the real GUI, run offscreen and driven through QTest like a user would.
+
+    python benchmarks/gui.py --items 2000 --json after.json
+    python benchmarks/gui.py --compare before.json after.json
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import tempfile
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore, QtWidgets
+from PySide6.QtTest import QTest
+
+from common import compare, isolate, measure, print_table, summarize, write_json
+from generate import generate
+
+from bine.gui.main import MainWindow
+from bine.gui.tab import TabWidget
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def settle() -> None:
+    """Process everything that the last action queued up, including deferred deletes, before the clock stops."""
+    QtWidgets.QApplication.processEvents()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    QtWidgets.QApplication.processEvents()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def timed(action: Callable[[Any], Any]) -> Callable[[Any], None]:
+    """Wrap an action so that the time measured includes the GUI catching up with it."""
+    def run(state: Any = None) -> None:
+        action(state)
+        settle()
+    return run
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def deepest_leaf(root: ItemModel) -> List[int]:
+    """Return the path of rows to the last item at the deepest level of the tree."""
+    best: List[int] = []
+    stack = [(root, [])]
+    while stack:
+        item, path = stack.pop()
+        if len(path) > len(best):
+            best = path
+        for row, child in enumerate(item.children):
+            stack.append((child, path + [row]))
+    return best
+
+
+
+
+# ======================================================================================================================
+# Benchmarks
+# ----------------------------------------------------------------------------------------------------------------------
+class Scenarios:
+    """Drives a MainWindow through each of the benchmarked interactions."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.window = MainWindow([])
+        self.window.show()
+        settle()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def tab(self) -> TabWidget:
+        return self.window.ui.tabs.currentWidget()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def close_all(self) -> None:
+        """Close every tab, discarding any changes the benchmarks made."""
+        while self.window.ui.tabs.count():
+            tab: TabWidget = self.window.ui.tabs.widget(0)
+            tab.warn = lambda: True
+            self.window.close_tab(0)
+        settle()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def reopen(self) -> TabWidget:
+        self.close_all()
+        tab = self.window.open_file(self.filename)
+        settle()
+        return tab
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def open(self, repeat: int) -> List[float]:
+        return measure(timed(lambda _: self.window.open_file(self.filename)), repeat, self.close_all)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def toggle(self, repeat: int) -> List[float]:
+        """Click the checkbox of an item at the bottom of the deepest branch of the tree."""
+        tab = self.reopen()
+        path = deepest_leaf(tab.document.root)
+        tab.select_path(path)
+        settle()
+
+        def setup():
+            node = tab.document.root
+            for row in path:
+                node = node.children[row]
+            return tab.ui.lists.item_widget(node).ui.checkbox
+        return measure(timed(lambda checkbox: QTest.mouseClick(checkbox, QtCore.Qt.LeftButton)), repeat, setup)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def rename(self, repeat: int) -> List[float]:
+        """Type a new name for an item and time the return key that commits it."""
+        tab = self.reopen()
+        item = tab.document.root.children[-1]
+        tab.select_path([item.row()])
+        settle()
+
+        def setup():
+            widget = tab.ui.lists.item_widget(item)
+            widget.edit()
+            widget.ui.editor.setText(item.text + ' renamed')
+            return widget.ui.editor
+        return measure(timed(lambda editor: QTest.keyClick(editor, QtCore.Qt.Key_Return)), repeat, setup)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def paste(self, repeat: int, lines: int = 1000) -> List[float]:
+        """Paste a block of plain text lines into the top-level list."""
+        text = '\n'.join(f'pasted item {index}' for index in range(lines))
+
+        def setup():
+            tab = self.reopen()
+            tab.ui.lists.ui.items.clearSelection()
+            tab.clipboard.setText(text)
+        return measure(timed(lambda _: self.window.ui.actionPaste.trigger()), repeat, setup)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def settings(self, repeat: int) -> List[float]:
+        """Flip the hide checked setting, which has to refresh every open tab."""
+        self.reopen()
+        return measure(timed(lambda _: self.window.ui.actionHideChecked.trigger()), repeat, lambda: None)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def save(self, repeat: int) -> List[float]:
+        """Save after checking an item, timing how long the window is held up rather than how long the write takes."""
+        tab = self.reopen()
+        item = tab.document.root.children[-1]
+
+        def setup():
+            tab.wait_for_save()
+            item.checked = not item.checked
+        samples = measure(timed(lambda _: self.window.ui.actionSave.trigger()), repeat, setup)
+        tab.wait_for_save()
+        return samples
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def run(self, repeat: int) -> Dict[str, Dict[str, Any]]:
+        samples = {
+            'open file': self.open(repeat),
+            'toggle deep checkbox': self.toggle(repeat),
+            'rename item': self.rename(repeat),
+            'paste 1000 lines': self.paste(repeat),
+            'switch setting': self.settings(repeat),
+            'save': self.save(repeat)
+        }
+        self.close_all()
+        return {name: summarize(times) for name, times in samples.items()}
+
+
+
+
+# ======================================================================================================================
+# Main Function
+# ----------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    parser = ArgumentParser(description='Benchmark the latency of common GUI interactions, offscreen.')
+    parser.add_argument('--items', type=int, nargs='+', default=[2000], help='item counts of the documents to test')
+    parser.add_argument('--depth', type=int, default=3, help='levels of items in the generated documents')
+    parser.add_argument('--fanout', type=int, default=8, help='children of each parent item')
+    parser.add_argument('-r', '--repeat', type=int, default=10, help='number of runs of each interaction')
+    parser.add_argument('--json', metavar='FILE', help='also write the results to FILE as JSON')
+    parser.add_argument('--compare', metavar=('BASELINE', 'CURRENT'), nargs=2,
+                        help='compare two JSON result files instead of running the benchmarks')
+    parser.add_argument('--threshold', type=float, default=0.2, help='slowdown flagged as a regression (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    if args.compare:
+        return 1 if compare(*args.compare, threshold=args.threshold) else 0
+
+    app = QtWidgets.QApplication(sys.argv)
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        isolate(folder)
+        for size in args.items:
+            filename = os.path.join(folder, f'{size}.md')
+            with open(filename, 'w', encoding='utf-8') as handle:
+                handle.write(generate(size, args.depth, args.fanout, duplicates=0.05, checked=0.3))
+            for name, result in Scenarios(filename).run(args.repeat).items():
+                results[f'{name} [{size}]'] = result
+
+    print_table(results, ['min_ms', 'p50_ms', 'p99_ms'])
+    if args.json:
+        write_json(args.json, 'gui', results, vars(args))
+    app.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+
+
+# End of File
@@ -0,0 +1,286 @@
+# ======================================================================================================================
+#      File:  /benchmarks/memory.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Memory footprint of the models and widgets at a range of document sizes, and what is left behind by closed tabs.
+
+Python allocations are measured with tracemalloc while Qt's own allocations, which tracemalloc cannot see, show up in
+the resident set size of the process and in the count of live widgets.
+
+    python benchmarks/memory.py --sizes 100 1000 5000 --json memory.json
+    python benchmarks/memory.py --compare before.json memory.json
+    python benchmarks/memory.py --leak-check 10 --sizes 5000
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+import weakref
+from argparse import ArgumentParser
+from typing import Any, Dict
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore, QtWidgets
+
+from common import compare, isolate, print_table, write_json
+from generate import generate
+
+from bine.gui.main import MainWindow
+from bine.gui.widgets.item.item import ChecklistItemWidget
+from bine.model.document import DocumentModel
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def settle() -> None:
+    """Process pending events and deferred deletes, then collect garbage, so that only live objects are counted."""
+    for _ in range(3):
+        QtWidgets.QApplication.processEvents()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    gc.collect()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def resident() -> int:
+    """Return the resident set size of this process in bytes, or zero where it can't be determined."""
+    try:
+        with open('/proc/self/statm', 'r') as handle:
+            return int(handle.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def traced() -> int:
+    """Return the bytes currently allocated by Python, as seen by tracemalloc."""
+    return tracemalloc.get_traced_memory()[0]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def count(root: ItemModel) -> int:
+    """Count the items below the provided root."""
+    total = 0
+    stack = [root]
+    while stack:
+        children = stack.pop().children
+        total += len(children)
+        stack.extend(children)
+    return total
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def live_items() -> int:
+    """Count the ItemModels still reachable by the garbage collector."""
+    return sum(1 for instance in gc.get_objects() if isinstance(instance, ItemModel))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def per(total: int, count: int) -> int:
+    return round(total / count) if count else 0
+
+
+
+
+# ======================================================================================================================
+# Benchmarks
+# ----------------------------------------------------------------------------------------------------------------------
+def model(filename: str) -> Dict[str, Any]:
+    """Measure the Python memory held by a loaded document, per item."""
+    settle()
+    before = traced()
+    document = DocumentModel()
+    document.load(filename)
+    items = count(document.root)
+    # Include the caches that the GUI fills in as soon as the document is shown.
+    document.root.progress
+    document.dumps()
+    total = traced() - before
+    return {'items': items, 'python_bytes': total, 'bytes_per_item': per(total, items)}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def tab(window: MainWindow, filename: str) -> Dict[str, Dict[str, Any]]:
+    """Open the document in a tab, measure what that costs, then close the tab and measure what was left behind."""
+    settle()
+    python_before, resident_before = traced(), resident()
+    widgets_before = len(QtWidgets.QApplication.allWidgets())
+    items_before = live_items()
+
+    opened = window.open_file(filename)
+    settle()
+    items = count(opened.document.root)
+    item_widgets = len(opened.findChildren(ChecklistItemWidget))
+    widgets = len(QtWidgets.QApplication.allWidgets()) - widgets_before
+    qobjects = len(opened.findChildren(QtCore.QObject)) + 1
+    python_bytes = traced() - python_before
+    resident_bytes = resident() - resident_before
+    results = {
+        'open tab': {
+            'items': items,
+            'item_widgets': item_widgets,
+            'widgets': widgets,
+            'qobjects': qobjects,
+            'python_bytes': python_bytes,
+            'resident_bytes': resident_bytes,
+            'bytes_per_item': per(resident_bytes, items),
+            'bytes_per_item_widget': per(resident_bytes, item_widgets)
+        }
+    }
+
+    # Discard the tab without prompting and see what survives it.
+    reference = weakref.ref(opened)
+    opened.warn = lambda: True
+    window.close_tab(window.ui.tabs.indexOf(opened))
+    del opened
+    settle()
+    results['closed tab'] = {
+        'retained_python_bytes': traced() - python_before,
+        'retained_resident_bytes': resident() - resident_before,
+        'retained_widgets': len(QtWidgets.QApplication.allWidgets()) - widgets_before,
+        'retained_items': live_items() - items_before,
+        'tab_alive': reference() is not None
+    }
+    return results
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def cycle(window: MainWindow, filename: str) -> None:
+    """Open the document in a new tab and close it again, discarding it without prompting."""
+    opened = window.open_file(filename)
+    settle()
+    opened.warn = lambda: True
+    window.close_tab(window.ui.tabs.indexOf(opened))
+    del opened
+    settle()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def leak_check(window: MainWindow, filename: str, cycles: int, tolerance: int) -> Dict[str, Any]:
+    """Repeatedly open and close the document and check that every cycle returns memory to where it started.
+
+    The first cycle is not counted, it fills the caches and lazy imports that are meant to stay around.
+
+    Arguments:
+        window: The window to open the tabs in.
+        filename: The document to be opened.
+        cycles: The number of times to open and close the document.
+        tolerance: Python bytes that may be gained over all of the cycles before it is considered a leak.
+    """
+    cycle(window, filename)
+    python_before, resident_before = traced(), resident()
+    widgets_before = len(QtWidgets.QApplication.allWidgets())
+    items_before = live_items()
+
+    for _ in range(cycles):
+        cycle(window, filename)
+
+    python_bytes = traced() - python_before
+    widgets = len(QtWidgets.QApplication.allWidgets()) - widgets_before
+    items = live_items() - items_before
+    return {
+        'cycles': cycles,
+        'gained_python_bytes': python_bytes,
+        'gained_resident_bytes': resident() - resident_before,
+        'gained_widgets': widgets,
+        'gained_items': items,
+        'leaked': python_bytes > tolerance or widgets > 0 or items > 0
+    }
+
+
+
+
+# ======================================================================================================================
+# Main Function
+# ----------------------------------------------------------------------------------------------------------------------
+COLUMNS = ('bytes_per_item', 'bytes_per_item_widget', 'retained_python_bytes', 'retained_widgets', 'retained_items')
+
+
+def main() -> int:
+    parser = ArgumentParser(description='Measure the memory used by documents and tabs at several document sizes.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000], help='item counts to test')
+    parser.add_argument('--depth', type=int, default=3, help='levels of items in the generated documents')
+    parser.add_argument('--fanout', type=int, default=8, help='children of each parent item')
+    parser.add_argument('--json', metavar='FILE', help='also write the results to FILE as JSON')
+    parser.add_argument('--compare', metavar=('BASELINE', 'CURRENT'), nargs=2,
+                        help='compare two JSON result files instead of running the benchmarks')
+    parser.add_argument('--threshold', type=float, default=0.2, help='growth flagged as a regression (0.2 = 20%%)')
+    parser.add_argument('--leak-check', metavar='CYCLES', type=int,
+                        help='instead open and close each document CYCLES times, failing if memory does not return')
+    parser.add_argument('--tolerance', type=int, default=256 * 1024,
+                        help='python bytes that may be gained during the leak check (default 256 KiB)')
+    args = parser.parse_args()
+
+    if args.compare:
+        return 1 if compare(*args.compare, threshold=args.threshold, columns=COLUMNS, floor=1) else 0
+
+    app = QtWidgets.QApplication(sys.argv)
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        isolate(folder)
+        window = MainWindow([])
+        window.show()
+        tracemalloc.start()
+
+        for size in args.sizes:
+            filename = os.path.join(folder, f'{size}.md')
+            with open(filename, 'w', encoding='utf-8') as handle:
+                handle.write(generate(size, args.depth, args.fanout, duplicates=0.05, checked=0.3))
+            if args.leak_check:
+                results[f'leak check [{size}]'] = leak_check(window, filename, args.leak_check, args.tolerance)
+                continue
+            results[f'model [{size}]'] = model(filename)
+            for name, result in tab(window, filename).items():
+                results[f'{name} [{size}]'] = result
+
+    tracemalloc.stop()
+    app.quit()
+    if args.leak_check:
+        print_table(results, ['cycles', 'gained_python_bytes', 'gained_resident_bytes', 'gained_widgets',
+                              'gained_items', 'leaked'])
+        if args.json:
+            write_json(args.json, 'leaks', results, vars(args))
+        return 1 if any(result['leaked'] for result in results.values()) else 0
+
+    print_table({name: result for name, result in results.items() if 'items' in result},
+                ['items', 'item_widgets', 'qobjects', 'python_bytes', 'bytes_per_item', 'bytes_per_item_widget'])
+    print()
+    print_table({name: result for name, result in results.items() if name.startswith('closed')},
+                ['retained_python_bytes', 'retained_resident_bytes', 'retained_widgets', 'retained_items',
+                 'tab_alive'])
+    if args.json:
+        write_json(args.json, 'memory', results, vars(args))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+
+
+# End of File
@@ -0,0 +1,151 @@
+# ======================================================================================================================
+#      File:  /benchmarks/model.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Benchmarks of the document and item models, without any GUI, at a range of document sizes.
+
+    python benchmarks/model.py --sizes 1000 10000 100000 --json model.json
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import pickle
+import tempfile
+from argparse import ArgumentParser
+from typing import Any, Dict
+
+from common import measure, print_table, summarize, write_json
+from generate import generate
+
+from bine.libraries.cache import DocumentCache
+from bine.model.document import DocumentModel
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Benchmarks
+# ----------------------------------------------------------------------------------------------------------------------
+def benchmark(filename: str, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Run each of the model benchmarks against the document in the provided file."""
+    cache = DocumentCache(os.path.join(os.path.dirname(filename), 'cache'))
+
+    def load(cache: DocumentCache = None) -> DocumentModel:
+        document = DocumentModel()
+        document.load(filename, cache)
+        return document
+
+    def leaf(document: DocumentModel) -> ItemModel:
+        item = document.root
+        while item.children:
+            item = item.children[-1]
+        return item
+
+    def touched(document: DocumentModel) -> DocumentModel:
+        # Renaming an item invalidates the cached duplicate counts for the whole document.
+        item = leaf(document)
+        item.text = item.text
+        return document
+
+    def edited(document: DocumentModel) -> DocumentModel:
+        # Toggling a leaf drops the dumped Markdown of it and its parents, but nothing else.
+        item = leaf(document)
+        item.checked = not item.checked
+        return document
+
+    def warm(document: DocumentModel) -> DocumentModel:
+        # Fill the caches so that the cached benchmarks don't include the first computation.
+        document.root.progress
+        leaf(document).duplicate
+        return document
+
+    def copy(item: ItemModel):
+        return item.dumps(), pickle.dumps(item)
+
+    def paste_text(state):
+        parent, text = state
+        for line in text.split('\n'):
+            parent.add(ItemModel(parent, line.strip()))
+
+    loaded = load(cache)
+    samples = {
+        'load': measure(lambda _: load(), repeat, lambda: None),
+        'load (cached)': measure(lambda _: load(cache), repeat, lambda: None),
+        'dumps': measure(loaded.dumps, repeat),
+        'dumps (cold)': measure(lambda document: document.dumps(), repeat, load),
+        'dumps (after edit)': measure(lambda document: document.dumps(), repeat, lambda: edited(loaded)),
+        'dirty': measure(loaded.dirty, repeat),
+        'dirty (after edit)': measure(lambda document: document.dirty(), repeat, lambda: edited(loaded)),
+        'progress (cold)': measure(lambda document: document.root.progress, repeat, load),
+        'progress (cached)': measure(lambda document: document.root.progress, repeat, lambda: warm(loaded)),
+        'checked': measure(lambda: loaded.root.checked, repeat),
+        'check all': measure(lambda document: setattr(document.root, 'checked', True), repeat, load),
+        'toggle leaf': measure(lambda item: setattr(item, 'checked', not item.checked), repeat,
+                               lambda: leaf(loaded)),
+        'duplicate (cold)': measure(lambda document: leaf(document).duplicate, repeat, lambda: touched(loaded)),
+        'duplicate (cached)': measure(lambda document: leaf(document).duplicate, repeat, lambda: warm(loaded)),
+        'copy': measure(lambda: copy(loaded.root), repeat),
+        'paste': measure(lambda data: ItemModel().add(pickle.loads(data)), repeat,
+                         lambda: copy(loaded.root)[1]),
+        'paste text': measure(paste_text, repeat, lambda: (ItemModel(), loaded.root.dumps()))
+    }
+    return {name: summarize(times) for name, times in samples.items()}
+
+
+
+
+# ======================================================================================================================
+# Main Function
+# ----------------------------------------------------------------------------------------------------------------------
+def main() -> int:
+    parser = ArgumentParser(description='Benchmark the document and item models at several document sizes.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='item counts to test')
+    parser.add_argument('--depth', type=int, default=3, help='levels of items in the generated documents')
+    parser.add_argument('--fanout', type=int, default=8, help='children of each parent item')
+    parser.add_argument('--duplicates', type=float, default=0.05, help='fraction of items with repeated text')
+    parser.add_argument('--checked', type=float, default=0.3, help='fraction of leaf items that are checked')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of runs of each benchmark')
+    parser.add_argument('--json', metavar='FILE', help='also write the results to FILE as JSON')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for size in args.sizes:
+            filename = os.path.join(folder, f'{size}.md')
+            with open(filename, 'w', encoding='utf-8') as handle:
+                handle.write(generate(size, args.depth, args.fanout, args.duplicates, args.checked))
+            for name, result in benchmark(filename, args.repeat).items():
+                results[f'{name} [{size}]'] = result
+
+    print_table(results, ['min_ms', 'p50_ms', 'p99_ms'])
+    if args.json:
+        write_json(args.json, 'model', results, vars(args))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+
+
+# End of File
@@ -0,0 +1,210 @@
+# ======================================================================================================================
+#      File:  /bine/cli.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Headless command line tools for checking, formatting, and reporting on checklists in bulk.
+
+None of these commands touch the GUI - Qt is never imported - so they start quickly and can run in CI.  Files are
+processed in parallel worker processes and the result for each file is printed as soon as it is ready.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from bine.libraries.export import THEMES, batch_export
+from bine.model.document import DocumentModel
+
+
+
+
+# ======================================================================================================================
+# Worker Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def _check(filename: str) -> bool:
+    """Return True if the file is already in the canonical format, raising if it can't be parsed."""
+    document = DocumentModel()
+    document.load(filename)
+    return document.canonical()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _format(filename: str) -> bool:
+    """Rewrite the file in the canonical format, returning True if anything changed."""
+    document = DocumentModel()
+    document.load(filename)
+    if document.canonical():
+        return False
+    document.dump(filename, update_cache=True, preserve=False)
+    return True
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _stats(filename: str) -> Dict[str, Any]:
+    """Count up the items in the file."""
+    document = DocumentModel()
+    document.load(filename)
+    items = leaves = checked = depth = 0
+    stack = [(document.root, 0)]
+    while stack:
+        item, level = stack.pop()
+        for child in item.children:
+            items += 1
+            if child.children:
+                stack.append((child, level + 1))
+            else:
+                leaves += 1
+                checked += child.checked
+        depth = max(depth, level)
+    return {
+        'title': document.title,
+        'items': items,
+        'leaves': leaves,
+        'checked': checked,
+        'depth': depth + 1 if items else 0,
+        'progress': round(document.root.progress, 1) if items else 0
+    }
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _run(function: Callable[[str], Any], files: List[str], jobs: int = None) -> Iterator[Tuple[str, Any, Exception]]:
+    """Run the function for each of the files in worker processes.
+
+    Yields:
+        A tuple of the filename, the result and the exception raised, if any, as each file finishes.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(function, filename): filename for filename in files}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], None if error else future.result(), error
+
+
+
+
+# ======================================================================================================================
+# Commands
+# ----------------------------------------------------------------------------------------------------------------------
+def check(args: Namespace) -> int:
+    """Report files that can't be parsed or that aren't in the canonical format."""
+    failures = 0
+    for filename, clean, error in _run(_check, args.files, args.jobs):
+        if error:
+            print(f'{filename}: error: {error}')
+        elif not clean:
+            print(f'{filename}: would reformat')
+        elif args.verbose:
+            print(f'{filename}: ok')
+        failures += bool(error or not clean)
+    print(f'{len(args.files) - failures} of {len(args.files)} file(s) ok', file=sys.stderr)
+    return 1 if failures else 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def fmt(args: Namespace) -> int:
+    """Rewrite files in the canonical format."""
+    errors = 0
+    for filename, changed, error in _run(_format, args.files, args.jobs):
+        if error:
+            print(f'{filename}: error: {error}')
+            errors += 1
+        elif changed:
+            print(f'{filename}: reformatted')
+        elif args.verbose:
+            print(f'{filename}: unchanged')
+    return 1 if errors else 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def stats(args: Namespace) -> int:
+    """Print the number of items, checked items, and the progress of each file."""
+    errors = 0
+    for filename, result, error in _run(_stats, args.files, args.jobs):
+        if error:
+            print(f'{filename}: error: {error}', file=sys.stderr)
+            errors += 1
+        elif args.json:
+            print(json.dumps({'file': filename, **result}), flush=True)
+        else:
+            print(f"{filename}: {result['items']} items, {result['checked']}/{result['leaves']} checked, "
+                  f"{result['progress']}% complete, {result['depth']} levels deep", flush=True)
+    return 1 if errors else 0
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def export(args: Namespace) -> int:
+    """Export files to themed HTML pages."""
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    errors = 0
+    for source, destination, error in batch_export(args.files, args.output, args.theme, args.jobs):
+        if error:
+            print(f'{source}: error: {error}')
+            errors += 1
+        else:
+            print(f'{source} -> {destination}')
+    return 1 if errors else 0
+
+
+COMMANDS = {
+    'check': check,
+    'fmt': fmt,
+    'stats': stats,
+    'export': export
+}
+
+
+
+
+# ======================================================================================================================
+# Main Function
+# ----------------------------------------------------------------------------------------------------------------------
+def main(argv: List[str] = None) -> int:
+    parser = ArgumentParser(prog='bine', description='Work with Bine checklists from the command line.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    common = ArgumentParser(add_help=False)
+    common.add_argument('files', nargs='+', help='Markdown checklist file(s)')
+    common.add_argument('-j', '--jobs', type=int, help='number of worker processes, defaults to one per CPU')
+    common.add_argument('-v', '--verbose', action='store_true', help='also report files that are fine')
+
+    commands.add_parser('check', parents=[common], help='check that files parse and are formatted')
+    commands.add_parser('fmt', parents=[common], help='rewrite files in the canonical format')
+    command = commands.add_parser('stats', parents=[common], help='report item counts and progress')
+    command.add_argument('--json', action='store_true', help='print one JSON object per file')
+    command = commands.add_parser('export', parents=[common], help='export files to HTML')
+    command.add_argument('-o', '--output', help='folder for the HTML files, defaults to alongside each source file')
+    command.add_argument('-t', '--theme', choices=THEMES, default='white', help='css theme for the pages')
+
+    args = parser.parse_args(argv)
+    return COMMANDS[args.command](args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+
+
+# End of File
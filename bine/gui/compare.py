@@ -0,0 +1,135 @@
+# ======================================================================================================================
+#      File:  /bine/gui/compare.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Side by side comparison of two checklists."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from typing import List
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from bine.libraries import instrument
+from bine.libraries.compare import Row, align
+from bine.model.document import DocumentModel
+
+
+
+
+# ======================================================================================================================
+# Compare Dialog Class
+# ----------------------------------------------------------------------------------------------------------------------
+class CompareDialog(QtWidgets.QDialog):
+    """Shows the items of two checklists side by side, highlighting the items that were added, removed or that are
+    checked on only one side.
+    """
+
+    COLORS = {
+        'added': QtGui.QColor(200, 240, 200),
+        'removed': QtGui.QColor(245, 200, 200),
+        'changed': QtGui.QColor(250, 235, 180)
+    }
+
+    def __init__(self, parent: QtWidgets.QWidget, left: DocumentModel, left_name: str, right: DocumentModel,
+                 right_name: str):
+        super().__init__(parent)
+        self.setWindowTitle(f'Compare {left_name} with {right_name}')
+        self.resize(900, 600)
+
+        self.tree = QtWidgets.QTreeWidget(self)
+        self.tree.setColumnCount(2)
+        self.tree.setHeaderLabels([left_name, right_name])
+        self.tree.setUniformRowHeights(True)
+        self.tree.header().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.only_differences = QtWidgets.QCheckBox('Show only differences', self)
+        self.summary = QtWidgets.QLabel(self)
+        buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Close, self)
+
+        options = QtWidgets.QHBoxLayout()
+        options.addWidget(self.only_differences)
+        options.addStretch()
+        options.addWidget(self.summary)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(3, 3, 3, 3)
+        layout.addLayout(options)
+        layout.addWidget(self.tree)
+        layout.addWidget(buttons)
+
+        self.only_differences.toggled.connect(self._filter)
+        buttons.rejected.connect(self.reject)
+
+        self._nodes: List[QtWidgets.QTreeWidgetItem] = []
+        self._populate(align(left.root, right.root))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('CompareDialog.populate')
+    def _populate(self, rows: List[Row]) -> None:
+        """Build the tree from the aligned rows, expanding the branches that hold differences."""
+        counts = {'added': 0, 'removed': 0, 'changed': 0}
+        brushes = {status: QtGui.QBrush(color) for status, color in self.COLORS.items()}
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        states = {True: QtCore.Qt.Checked, False: QtCore.Qt.Unchecked}
+        top = []
+        parents: List[QtWidgets.QTreeWidgetItem] = []
+        expand = []
+        for row in rows:
+            left, right = row.left, row.right
+            node = QtWidgets.QTreeWidgetItem([left.text if left else '', right.text if right else ''])
+            node.setFlags(flags)
+            if left is not None:
+                node.setCheckState(0, states[left.checked])
+            if right is not None:
+                node.setCheckState(1, states[right.checked])
+            if row.status != 'same':
+                counts[row.status] += 1
+                node.setBackground(0, brushes[row.status])
+                node.setBackground(1, brushes[row.status])
+            node.setData(0, QtCore.Qt.UserRole, row.differs)
+
+            # The rows come depth first, so the parent of each row is the last row seen one level up.
+            del parents[row.level:]
+            if parents:
+                parents[-1].addChild(node)
+            else:
+                top.append(node)
+            parents.append(node)
+            self._nodes.append(node)
+            if row.differs:
+                expand.append(node)
+
+        self.tree.addTopLevelItems(top)
+        for node in expand:
+            node.setExpanded(True)
+        self.summary.setText('{added} added, {removed} removed, {changed} changed'.format(**counts))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _filter(self, only_differences: bool) -> None:
+        """Hide, or show again, the rows that are the same on both sides all of the way down."""
+        self.tree.setUpdatesEnabled(False)
+        for node in self._nodes:
+            node.setHidden(only_differences and not node.data(0, QtCore.Qt.UserRole))
+        self.tree.setUpdatesEnabled(True)
+
+
+
+
+# End of File
@@ -1,325 +1,582 @@
-# ======================================================================================================================
-#      File:  /bine/gui/main.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""Main Window GUI."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-import os
-import ctypes
-from typing import List
-from importlib import metadata
-from datetime import datetime
-
-from PySide6 import QtGui, QtWidgets
-
-from bine.gui.base.main import Ui_MainWindow
-from bine.gui.tab import TabWidget
-from bine.model.item import ItemModel
-from bine.settings import settings
-
-
-
-
-# ======================================================================================================================
-# Main Window Class
-# ----------------------------------------------------------------------------------------------------------------------
-class MainWindow(QtWidgets.QMainWindow):
-    """Extends the generated Qt MainWindow UI to add functionality for the main tool window."""
-
-    def __init__(self, files: List[str]):
-        super().__init__(None)
-        self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
-
-        name = 'bine'
-        version = metadata.version(name)
-        title = f'{name.title()} - {version}'
-        self.setWindowTitle(title)
-
-        # Set a nice icon for the window.
-        icon = QtGui.QIcon()
-        icon.addFile('bine/assets/icons/main.png')
-        self.setWindowIcon(icon)
-
-        # Quirky way of getting Windows to use the above icon for the taskbar too.
-        # https://stackoverflow.com/questions/1551605/how-to-set-applications-taskbar-icon-in-windows-7/1552105#1552105
-        myappid = f'exsystems.{name}.editor.{version}'
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-
-        # TODO: Load these settings from a user's config file.
-        self._show_settings()
-
-        self.ui.actionNew.triggered.connect(self.new)
-        self.ui.actionOpen.triggered.connect(self.open)
-        self.ui.actionSave.triggered.connect(lambda: self.ui.tabs.currentWidget().save())
-        self.ui.actionSave_As.triggered.connect(lambda: self.ui.tabs.currentWidget().save_as())
-        self.ui.actionSave_a_Copy.triggered.connect(lambda: self.ui.tabs.currentWidget().save_copy())
-        self.ui.actionPrint.triggered.connect(lambda: self.ui.tabs.currentWidget().on_print())
-        self.ui.actionPreview.triggered.connect(lambda: self.ui.tabs.currentWidget().preview())
-        self.ui.actionCloseTab.triggered.connect(lambda: self.close_tab(self.ui.tabs.currentIndex()))
-        self.ui.actionExit.triggered.connect(self.close)
-        self.ui.actionUndo.triggered.connect(lambda: self.ui.tabs.currentWidget().undo())
-        self.ui.actionRedo.triggered.connect(lambda: self.ui.tabs.currentWidget().redo())
-        self.ui.actionCut.triggered.connect(lambda: self.ui.tabs.currentWidget().cut())
-        self.ui.actionCopy.triggered.connect(lambda: self.ui.tabs.currentWidget().copy())
-        self.ui.actionPaste.triggered.connect(lambda: self.ui.tabs.currentWidget().paste())
-        self.ui.actionInsert.triggered.connect(lambda: self.ui.tabs.currentWidget().insert())
-        self.ui.actionEdit.triggered.connect(lambda: self.ui.tabs.currentWidget().edit())
-        self.ui.actionDelete.triggered.connect(lambda: self.ui.tabs.currentWidget().delete())
-        self.ui.actionMoveUp.triggered.connect(lambda: self.ui.tabs.currentWidget().move_up())
-        self.ui.actionMoveDown.triggered.connect(lambda: self.ui.tabs.currentWidget().move_down())
-        # self.ui.actionIndent.triggered.connect(lambda: self.ui.tabs.currentWidget().indent())
-        # self.ui.actionDedent.triggered.connect(lambda: self.ui.tabs.currentWidget().dedent())
-        self.ui.actionCheckAll.triggered.connect(lambda: self.ui.tabs.currentWidget().check_all())
-        self.ui.actionUncheckAll.triggered.connect(lambda: self.ui.tabs.currentWidget().uncheck_all())
-        self.ui.actionToggleSelected.triggered.connect(lambda: self.ui.tabs.currentWidget().toggle())
-        self.ui.actionHighlightDuplicates.triggered.connect(self._settings_changed)
-        self.ui.actionAutoCheck.triggered.connect(self._settings_changed)
-        self.ui.actionAutoSort.triggered.connect(self._settings_changed)
-        self.ui.actionHideChecked.triggered.connect(self._settings_changed)
-        self.ui.actionExportHtmlWhite.triggered.connect(lambda: self.ui.tabs.currentWidget().export_html('white'))
-        self.ui.actionExportHtmlSlate.triggered.connect(lambda: self.ui.tabs.currentWidget().export_html('slate'))
-        self.ui.actionAbout.triggered.connect(self.about)
-        self.ui.tabs.tabCloseRequested.connect(self.close_tab)
-        self.ui.tabs.currentChanged.connect(self.tab_changed)
-        self.tab_changed()
-
-        # TODO: What about remembering files that were open last session and reopening them?
-
-        # Open tabs for each of the (optional) command line file arguments.
-        for file in files:
-            tab = self.new()
-            tab.open(file)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
-        """Hook the GUI close event to try to warn the user about unsaved changes to open documents.
-
-        See the docstring for the warn_all method to find out more about what it does.  If it returns False then the
-        close event will be cancelled - leaving the main window open.
-        """
-        if self.warn_all():
-            # TODO: Save the settings to user's config file.
-            event.accept()
-        else:
-            event.ignore()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def close_tab(self, index: int) -> None:
-        """Event fires when the user clicks the tab close button or uses the close tab option in the File menu.
-
-        Arguments:
-            index: The index of the tab to be closed.  If index is less than 0 (indicating there are no tabs left to
-                close) then a request will be made to close the GUI window.
-        """
-        # If no tab was specified, close the GUI.  This should only really happen when there are no tabs left.
-        if index < 0:
-            self.close()
-
-        # Close the specified tab.
-        else:
-            tab = self.ui.tabs.widget(index)
-
-            # Provide the user with the opportunity to save before closing the tab.  Warn will return True if the user
-            # has either elected to discard changes or saved them.  It returns False when the user has aborted.
-            if tab.warn():
-                self.ui.tabs.removeTab(index)
-
-                # If this was the last tab manually fire the change event to disable actions.
-                if self.ui.tabs.count() == 0:
-                    self.tab_changed(None)
-                    self.ui.stack.setCurrentWidget(self.ui.placeholder_page)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def tab_changed(self, index: int = None) -> None:
-        """Fires when the currently selected tab changes.
-
-        Arguments:
-            index: The index of the newly selected tab or None when no tab is selected (e.g. at init).
-        """
-        # Update the actions in the file and edit menus.  Can't save or edit a lack of document.
-        selected = index is not None
-        self.ui.actionSave.setEnabled(selected)
-        self.ui.actionSave_As.setEnabled(selected)
-        self.ui.actionSave_a_Copy.setEnabled(selected)
-        self.ui.actionPrint.setEnabled(selected)
-        self.ui.actionPreview.setEnabled(selected)
-        self.ui.menuEdit.setEnabled(selected)
-        self.ui.menuExport.setEnabled(selected)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def warn_all(self) -> bool:
-        """Warn the user that there are unsaved changes and prompt them to save before continuing.
-
-        This method will loop through all of the open tabs and offer the user the option to save, discard, or abort the
-        close for each file with unsaved changes.
-
-        If the user selects "No to All" then changes to any remaining files will be discarded and the method will return
-        True indicating the user is satisfied.
-
-        If the user selects "Tes to All" then the prompts will stop and `save` will be called on all remaining files.
-        If any of the remaining files do not have a filename then the user will be prompted for where to save the new
-        file and should the user cancel that save dialog the saving operation will be halted and the window will remain
-        open.
-
-        Returns:
-            True if the user has acknowledged the unsaved changes and processing should continue of False if the user
-            has cancelled and the caller should cease what it was doing.
-        """
-        yes_all = False
-
-        for idx in range(self.ui.tabs.count()):
-            self.ui.tabs.setCurrentIndex(idx)
-            tab: TabWidget = self.ui.tabs.widget(idx)
-            if tab.document.dirty():
-                if yes_all:
-                    # Once the user selected "Yes to All" then we can plow through the remainder and just assume save.
-                    result = QtWidgets.QMessageBox.Save
-
-                else:
-                    # Prompt the user for an action on this file.
-                    flags = QtWidgets.QMessageBox.Abort
-                    flags |= QtWidgets.QMessageBox.Yes
-                    flags |= QtWidgets.QMessageBox.YesToAll
-                    flags |= QtWidgets.QMessageBox.No
-                    flags |= QtWidgets.QMessageBox.NoToAll
-                    message = 'Save changes to '
-                    if tab.filename:
-                        message += f'"{os.path.basename(tab.filename)}"?\n\n'
-                        message += os.path.abspath(tab.filename)
-                    else:
-                        message += 'untitled file?'
-                    result = QtWidgets.QMessageBox.critical(self, 'Save changes', message, flags)
-
-                    # "Yes to All" is a special case that will not prompt the user to save any more changes.
-                    if result == QtWidgets.QMessageBox.YesToAll:
-                        result = QtWidgets.QMessageBox.Yes
-                        yes_all = True
-
-                # If they sad "save" then lets try to save them.
-                if result == QtWidgets.QMessageBox.Save:
-                    if not tab.save():
-                        # If the user cancels out of a save then abort the operation to give them another try.
-                        return False
-
-                # If then cancelled then abort the entire operation.
-                elif result == QtWidgets.QMessageBox.Abort:
-                    return False
-
-                # If the user selects "No to All" then break the loop and return True to close the window.
-                elif result == QtWidgets.QMessageBox.NoToAll:
-                    return True
-
-        # If they make it through all of the tabs then we're good to allow closing - everything is clean.
-        return True
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def new(self) -> TabWidget:
-        """Create a new, empty tab and document for editing.
-
-        Returns:
-            The newly created TabWidget instance, primarily intended for the open method to load a document.
-        """
-        self.ui.stack.setCurrentWidget(self.ui.tabs_page)
-
-        tab = TabWidget(self)
-        self.ui.tabs.addTab(tab, 'untitled')
-        self.ui.tabs.setCurrentWidget(tab)
-
-        def content_changed() -> None:
-            """Connected to the contentChanged event of the new tab to update the tab title when the user changes the
-            contents.
-            """
-            dirty = '*' if tab.document.dirty() else ''
-            filename = os.path.splitext(os.path.basename(tab.filename))[0] if tab.filename else 'untitled'
-            index = self.ui.tabs.indexOf(tab)
-            self.ui.tabs.setTabText(index, f'{dirty}{filename}')
-            self.ui.tabs.setTabToolTip(index, os.path.abspath(tab.filename) if tab.filename else '')
-
-        def selection_changed(item: ItemModel) -> None:
-            """Connected to the tree selection changes in the tab.
-
-            Adjusts the availability of the options in the edit menu according to the new selection.
-            """
-            self.ui.actionDelete.setEnabled(item is not None)
-            self.ui.actionEdit.setEnabled(item is not None)
-            # self.ui.actionMoveUp.setEnabled(all(item.childNumber() > 0 for item in selection))
-            # self.ui.actionMoveDown.setEnabled(all(not item.isLastChild() for item in selection))
-            # self.ui.actionIndent.setEnabled(all(item.childNumber() != 0 for item in selection))
-            # self.ui.actionDedent.setEnabled(all(item.level > 1 for item in selection))
-
-        tab.itemSelected.connect(selection_changed)
-        tab.contentChanged.connect(content_changed)
-        tab.undoTextChanged.connect(lambda text: self.ui.actionUndo.setStatusTip('Undo ' + text))
-        tab.redoTextChanged.connect(lambda text: self.ui.actionRedo.setStatusTip('Redo ' + text))
-
-        return tab
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def open(self):
-        """Launch an open file dialog and select a new document to open in a tab."""
-        filters = [
-            'Markdown (*.md *.mkd *.mdwn *.mdown *.markdown *.mdtxt *.mdtext *.workbook)',
-            'XML (*.xml)'
-        ]
-        filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, filter=';;'.join(filters))
-        if filename:
-            tab = self.new()
-            tab.open(filename)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def about(self):
-        """Show an about dialog with information about this tool."""
-        title = 'About Bine Markdown Checklist Editor'
-        description = metadata.metadata('bine')['Summary'] + '\n\n'
-        description += 'Author: ' + metadata.metadata('bine')['Author']
-        description += ' <' + metadata.metadata('bine')['Author-email'] + '>\n'
-        description += f"Copyright: (c) 2022-{datetime.now().strftime('%Y')} " + metadata.metadata('bine')['Author']
-        QtWidgets.QMessageBox.about(self, title, description)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _show_settings(self) -> None:
-        """Updates the settings menu to display the current settings."""
-        self.ui.actionHighlightDuplicates.setChecked(settings.highlight_duplicates)
-        self.ui.actionAutoSort.setChecked(settings.auto_sort)
-        self.ui.actionAutoCheck.setChecked(settings.auto_check)
-        self.ui.actionHideChecked.setChecked(settings.hide_checked)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _settings_changed(self) -> None:
-        settings.highlight_duplicates = self.ui.actionHighlightDuplicates.isChecked()
-        settings.auto_sort = self.ui.actionAutoSort.isChecked()
-        settings.auto_check = self.ui.actionAutoCheck.isChecked()
-        settings.hide_checked = self.ui.actionHideChecked.isChecked()
-        self.ui.tabs.currentWidget().refresh()
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/gui/main.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Main Window GUI."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import ctypes
+import logging
+from typing import List
+from importlib import metadata
+from datetime import datetime
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from bine.gui.base.main import Ui_MainWindow
+from bine.gui.compare import CompareDialog
+from bine.gui.monitor import Change, FileMonitor
+from bine.gui.palette import PaletteDialog, QuickOpenIndex
+from bine.gui.tab import TabWidget
+from bine.libraries.cache import document_cache
+from bine.libraries.journal import untitled
+from bine.model.document import DocumentModel
+from bine.model.item import ItemModel
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Main Window Class
+# ----------------------------------------------------------------------------------------------------------------------
+class MainWindow(QtWidgets.QMainWindow):
+    """Extends the generated Qt MainWindow UI to add functionality for the main tool window."""
+
+    def __init__(self, files: List[str]):
+        super().__init__(None)
+        self.ui = Ui_MainWindow()
+        self.ui.setupUi(self)
+
+        name = 'bine'
+        version = metadata.version(name)
+        title = f'{name.title()} - {version}'
+        self.setWindowTitle(title)
+
+        # Set a nice icon for the window.
+        icon = QtGui.QIcon()
+        icon.addFile('bine/assets/icons/main.png')
+        self.setWindowIcon(icon)
+
+        # Quirky way of getting Windows to use the above icon for the taskbar too.
+        # https://stackoverflow.com/questions/1551605/how-to-set-applications-taskbar-icon-in-windows-7/1552105#1552105
+        # Only applies on Windows, elsewhere (e.g. the offscreen benchmarks) it's skipped.
+        if hasattr(ctypes, 'windll'):
+            myappid = f'exsystems.{name}.editor.{version}'
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+
+        # The settings themselves are loaded from the user's config file before the window is created.
+        self._show_settings()
+        self._restoring = False
+
+        # Index of the items in all open tabs and recent files for the quick-open palette.
+        self._index = QuickOpenIndex(self)
+        self._index.set_recent(settings.recent_files)
+
+        # Watches the files of the open tabs for changes made by other programs.
+        self._monitor = FileMonitor(self)
+        self._monitor.changed.connect(self._file_changed)
+
+        self.ui.actionNew.triggered.connect(self.new)
+        self.ui.actionOpen.triggered.connect(self.open)
+        self.ui.actionQuickOpen.triggered.connect(self.quick_open)
+        self.ui.actionCompare.triggered.connect(self.compare)
+        self.ui.actionSave.triggered.connect(lambda: self.ui.tabs.currentWidget().save())
+        self.ui.actionSave_As.triggered.connect(lambda: self.ui.tabs.currentWidget().save_as())
+        self.ui.actionSave_a_Copy.triggered.connect(lambda: self.ui.tabs.currentWidget().save_copy())
+        self.ui.actionPrint.triggered.connect(lambda: self.ui.tabs.currentWidget().on_print())
+        self.ui.actionPreview.triggered.connect(lambda: self.ui.tabs.currentWidget().preview())
+        self.ui.actionCloseTab.triggered.connect(lambda: self.close_tab(self.ui.tabs.currentIndex()))
+        self.ui.actionExit.triggered.connect(self.close)
+        self.ui.actionUndo.triggered.connect(lambda: self.ui.tabs.currentWidget().undo())
+        self.ui.actionRedo.triggered.connect(lambda: self.ui.tabs.currentWidget().redo())
+        self.ui.actionCut.triggered.connect(lambda: self.ui.tabs.currentWidget().cut())
+        self.ui.actionCopy.triggered.connect(lambda: self.ui.tabs.currentWidget().copy())
+        self.ui.actionPaste.triggered.connect(lambda: self.ui.tabs.currentWidget().paste())
+        self.ui.actionInsert.triggered.connect(lambda: self.ui.tabs.currentWidget().insert())
+        self.ui.actionInsertChild.triggered.connect(lambda: self.ui.tabs.currentWidget().insert_child())
+        self.ui.actionEdit.triggered.connect(lambda: self.ui.tabs.currentWidget().edit())
+        self.ui.actionDelete.triggered.connect(lambda: self.ui.tabs.currentWidget().delete())
+        self.ui.actionMoveUp.triggered.connect(lambda: self.ui.tabs.currentWidget().move_up())
+        self.ui.actionMoveDown.triggered.connect(lambda: self.ui.tabs.currentWidget().move_down())
+        self.ui.actionIndent.triggered.connect(lambda: self.ui.tabs.currentWidget().indent())
+        self.ui.actionDedent.triggered.connect(lambda: self.ui.tabs.currentWidget().dedent())
+        self.ui.actionCheckAll.triggered.connect(lambda: self.ui.tabs.currentWidget().check_all())
+        self.ui.actionUncheckAll.triggered.connect(lambda: self.ui.tabs.currentWidget().uncheck_all())
+        self.ui.actionToggleSelected.triggered.connect(lambda: self.ui.tabs.currentWidget().toggle())
+        self.ui.actionHighlightDuplicates.triggered.connect(self._settings_changed)
+        self.ui.actionAutoCheck.triggered.connect(self._settings_changed)
+        self.ui.actionAutoSort.triggered.connect(self._settings_changed)
+        self.ui.actionHideChecked.triggered.connect(self._settings_changed)
+        self.ui.actionExportHtmlWhite.triggered.connect(lambda: self.ui.tabs.currentWidget().export_html('white'))
+        self.ui.actionExportHtmlSlate.triggered.connect(lambda: self.ui.tabs.currentWidget().export_html('slate'))
+        self.ui.actionAbout.triggered.connect(self.about)
+        self.ui.tabs.tabCloseRequested.connect(self.close_tab)
+        self.ui.tabs.currentChanged.connect(self.tab_changed)
+        self.tab_changed()
+
+        # Bring back the tabs from the last session.  Only the active one is loaded, the rest wait until they're shown.
+        if settings.restore_session:
+            QtCore.QTimer.singleShot(0, self._restore_session)
+
+        # Offer back any untitled documents that were left unsaved when the last session ended without closing them.
+        # They are listed now, before this session has a chance to start journals of its own.
+        names = untitled() if settings.journal_changes else []
+        QtCore.QTimer.singleShot(0, lambda: self._recover_untitled(names))
+
+        # Open tabs for each of the (optional) command line file arguments, once the window is up and showing.
+        QtCore.QTimer.singleShot(0, lambda: self._open_pending(list(files)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _open_pending(self, files: List[str]) -> None:
+        """Open the files from the command line one at a time, letting the GUI update in between each one."""
+        if files:
+            self.open_file(files.pop(0))
+        if files:
+            QtCore.QTimer.singleShot(0, lambda: self._open_pending(files))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _restore_session(self) -> None:
+        """Recreate a tab for each file that was open at the end of the last session.
+
+        The tabs are only placeholders until they are first shown, so restoring many tabs costs about as much as opening
+        just the one that was active.  Files that have since gone missing are skipped.
+        """
+        active = 0
+        self._restoring = True
+        try:
+            for idx, entry in enumerate(settings.session):
+                filename = entry.get('filename') if isinstance(entry, dict) else None
+                if not isinstance(filename, str) or not os.path.isfile(filename):
+                    continue
+                selection = entry.get('selection')
+                if not isinstance(selection, list) or not all(isinstance(row, int) for row in selection):
+                    selection = []
+                if idx == settings.session_active:
+                    active = self.ui.tabs.count()
+                tab = self._create_tab()
+                tab.open_later(filename, selection)
+                index = self.ui.tabs.indexOf(tab)
+                self.ui.tabs.setTabText(index, os.path.splitext(os.path.basename(filename))[0])
+                self.ui.tabs.setTabToolTip(index, filename)
+        finally:
+            self._restoring = False
+
+        if self.ui.tabs.count():
+            self.ui.tabs.setCurrentIndex(active)
+            self.tab_changed(active)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _recover_untitled(self, names: List[str]) -> None:
+        """Offer to recover each of the untitled documents left behind by a session that didn't end properly, each into
+        a tab of its own.  Documents with a file are offered when the file is opened instead.
+
+        Arguments:
+            names: The names of the journals of the untitled documents, see bine.libraries.journal.untitled.
+        """
+        for name in names:
+            tab = self._create_tab()
+            if tab.new(name):
+                self.ui.tabs.setCurrentWidget(tab)
+            else:
+                self._remove_tab(self.ui.tabs.indexOf(tab))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _store_session(self) -> None:
+        """Record the open files, the item selected in each and the active tab in the settings for the next session."""
+        session = []
+        active = 0
+        for idx in range(self.ui.tabs.count()):
+            tab: TabWidget = self.ui.tabs.widget(idx)
+            if not tab.filename:
+                continue
+            if idx == self.ui.tabs.currentIndex():
+                active = len(session)
+            session.append({'filename': os.path.abspath(tab.filename), 'selection': tab.selected_path()})
+        settings.session = session
+        settings.session_active = active
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _load_deferred(self, tab: TabWidget) -> None:
+        """Load the document of a restored tab that is being shown for the first time."""
+        try:
+            tab.ensure_loaded()
+        except (OSError, UnicodeDecodeError, ValueError) as error:
+            logging.warning('Unable to restore %s: %s', tab.filename, error)
+            QtWidgets.QMessageBox.warning(self, 'Unable to open', f'Unable to open "{tab.filename}":\n\n{error}')
+            # Drop the tab once the tab widget has finished switching to it.
+            QtCore.QTimer.singleShot(0, lambda: self._remove_tab(self.ui.tabs.indexOf(tab)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        """Hook the GUI close event to try to warn the user about unsaved changes to open documents.
+
+        See the docstring for the warn_all method to find out more about what it does.  If it returns False then the
+        close event will be cancelled - leaving the main window open.
+        """
+        # Note the session before warning, prompting for each unsaved tab will change the active tab.
+        self._store_session()
+        if self.warn_all():
+            # Everything has been saved or deliberately discarded, so there's nothing left to recover.
+            for idx in range(self.ui.tabs.count()):
+                self.ui.tabs.widget(idx).close_journal()
+            settings.save()
+            event.accept()
+        else:
+            event.ignore()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def close_tab(self, index: int) -> None:
+        """Event fires when the user clicks the tab close button or uses the close tab option in the File menu.
+
+        Arguments:
+            index: The index of the tab to be closed.  If index is less than 0 (indicating there are no tabs left to
+                close) then a request will be made to close the GUI window.
+        """
+        # If no tab was specified, close the GUI.  This should only really happen when there are no tabs left.
+        if index < 0:
+            self.close()
+
+        # Close the specified tab.
+        else:
+            tab = self.ui.tabs.widget(index)
+
+            # Provide the user with the opportunity to save before closing the tab.  Warn will return True if the user
+            # has either elected to discard changes or saved them.  It returns False when the user has aborted.
+            if tab.warn():
+                self._remove_tab(index)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _remove_tab(self, index: int) -> None:
+        """Remove the tab at the specified index, without asking, and dispose of it."""
+        if index < 0:
+            return
+        tab = self.ui.tabs.widget(index)
+        self.ui.tabs.removeTab(index)
+        self._index.forget(tab)
+        self._monitor.forget(tab)
+        tab.dispose()
+        tab.deleteLater()
+
+        # If this was the last tab manually fire the change event to disable actions.
+        if self.ui.tabs.count() == 0:
+            self.tab_changed(None)
+            self.ui.stack.setCurrentWidget(self.ui.placeholder_page)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def tab_changed(self, index: int = None) -> None:
+        """Fires when the currently selected tab changes.
+
+        Arguments:
+            index: The index of the newly selected tab or None when no tab is selected (e.g. at init).
+        """
+        # Tabs restored from the last session load their document the first time that they are shown.
+        if index is not None and index >= 0 and not self._restoring:
+            self._load_deferred(self.ui.tabs.widget(index))
+
+        # Update the actions in the file and edit menus.  Can't save or edit a lack of document.
+        selected = index is not None
+        self.ui.actionSave.setEnabled(selected)
+        self.ui.actionSave_As.setEnabled(selected)
+        self.ui.actionSave_a_Copy.setEnabled(selected)
+        self.ui.actionPrint.setEnabled(selected)
+        self.ui.actionPreview.setEnabled(selected)
+        self.ui.menuEdit.setEnabled(selected)
+        self.ui.menuExport.setEnabled(selected)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def warn_all(self) -> bool:
+        """Warn the user that there are unsaved changes and prompt them to save before continuing.
+
+        This method will loop through all of the open tabs and offer the user the option to save, discard, or abort the
+        close for each file with unsaved changes.
+
+        If the user selects "No to All" then changes to any remaining files will be discarded and the method will return
+        True indicating the user is satisfied.
+
+        If the user selects "Tes to All" then the prompts will stop and `save` will be called on all remaining files.
+        If any of the remaining files do not have a filename then the user will be prompted for where to save the new
+        file and should the user cancel that save dialog the saving operation will be halted and the window will remain
+        open.
+
+        Returns:
+            True if the user has acknowledged the unsaved changes and processing should continue of False if the user
+            has cancelled and the caller should cease what it was doing.
+        """
+        yes_all = False
+
+        for idx in range(self.ui.tabs.count()):
+            tab: TabWidget = self.ui.tabs.widget(idx)
+            # Restored tabs that were never shown haven't been loaded, so there's nothing to save and no need to load.
+            if tab.deferred:
+                continue
+            self.ui.tabs.setCurrentIndex(idx)
+            tab.wait_for_save()
+            if tab.document.dirty():
+                if yes_all:
+                    # Once the user selected "Yes to All" then we can plow through the remainder and just assume save.
+                    result = QtWidgets.QMessageBox.Save
+
+                else:
+                    # Prompt the user for an action on this file.
+                    flags = QtWidgets.QMessageBox.Abort
+                    flags |= QtWidgets.QMessageBox.Yes
+                    flags |= QtWidgets.QMessageBox.YesToAll
+                    flags |= QtWidgets.QMessageBox.No
+                    flags |= QtWidgets.QMessageBox.NoToAll
+                    message = 'Save changes to '
+                    if tab.filename:
+                        message += f'"{os.path.basename(tab.filename)}"?\n\n'
+                        message += os.path.abspath(tab.filename)
+                    else:
+                        message += 'untitled file?'
+                    result = QtWidgets.QMessageBox.critical(self, 'Save changes', message, flags)
+
+                    # "Yes to All" is a special case that will not prompt the user to save any more changes.
+                    if result == QtWidgets.QMessageBox.YesToAll:
+                        result = QtWidgets.QMessageBox.Yes
+                        yes_all = True
+
+                # If they sad "save" then lets try to save them.
+                if result == QtWidgets.QMessageBox.Save:
+                    if not tab.save(wait=True):
+                        # If the user cancels out of a save then abort the operation to give them another try.
+                        return False
+
+                # If then cancelled then abort the entire operation.
+                elif result == QtWidgets.QMessageBox.Abort:
+                    return False
+
+                # If the user selects "No to All" then break the loop and return True to close the window.
+                elif result == QtWidgets.QMessageBox.NoToAll:
+                    return True
+
+        # If they make it through all of the tabs then we're good to allow closing - everything is clean.
+        return True
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def new(self) -> TabWidget:
+        """Create a new, empty tab and document for editing.
+
+        Returns:
+            The newly created TabWidget instance.
+        """
+        tab = self._create_tab()
+        tab.new()
+        self.ui.tabs.setCurrentWidget(tab)
+        return tab
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _create_tab(self) -> TabWidget:
+        """Add a new, empty tab to the end of the tabs and hook it up to the window, without switching to it."""
+        self.ui.stack.setCurrentWidget(self.ui.tabs_page)
+
+        tab = TabWidget(self)
+        self.ui.tabs.addTab(tab, 'untitled')
+
+        def content_changed() -> None:
+            """Connected to the contentChanged event of the new tab to update the tab title when the user changes the
+            contents.
+            """
+            dirty = '*' if tab.document.dirty() else ''
+            filename = os.path.splitext(os.path.basename(tab.filename))[0] if tab.filename else 'untitled'
+            index = self.ui.tabs.indexOf(tab)
+            self.ui.tabs.setTabText(index, f'{dirty}{filename}')
+            self.ui.tabs.setTabToolTip(index, os.path.abspath(tab.filename) if tab.filename else '')
+
+        def selection_changed(item: ItemModel) -> None:
+            """Connected to the tree selection changes in the tab.
+
+            Adjusts the availability of the options in the edit menu according to the new selection.
+            """
+            self.ui.actionDelete.setEnabled(item is not None)
+            self.ui.actionEdit.setEnabled(item is not None)
+            self.ui.actionInsertChild.setEnabled(item is not None)
+            self.ui.actionMoveUp.setEnabled(tab.can_move_up())
+            self.ui.actionMoveDown.setEnabled(tab.can_move_down())
+            self.ui.actionIndent.setEnabled(tab.can_indent())
+            self.ui.actionDedent.setEnabled(tab.can_dedent())
+
+        tab.itemSelected.connect(selection_changed)
+        tab.contentChanged.connect(content_changed)
+        tab.undoTextChanged.connect(lambda text: self.ui.actionUndo.setStatusTip('Undo ' + text))
+        tab.redoTextChanged.connect(lambda text: self.ui.actionRedo.setStatusTip('Redo ' + text))
+        self._index.track(tab)
+        self._monitor.track(tab)
+
+        return tab
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _file_changed(self, tab: TabWidget, change: Change) -> None:
+        """Fires when the file open in a tab has been changed by another program, with the newly parsed document and the
+        plan for merging it.
+        """
+        # Don't throw away any unsaved changes without asking.
+        if tab.document.dirty():
+            message = f'"{os.path.basename(tab.filename)}" has been changed by another program.\n\n'
+            message += 'Reload it and discard your unsaved changes?'
+            result = QtWidgets.QMessageBox.question(self, 'File changed', message)
+            if result != QtWidgets.QMessageBox.Yes:
+                return
+
+        tab.merge(change)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def open(self):
+        """Launch an open file dialog and select a new document to open in a tab."""
+        filters = [
+            'Markdown (*.md *.mkd *.mdwn *.mdown *.markdown *.mdtxt *.mdtext *.workbook)',
+            'XML (*.xml)'
+        ]
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, filter=';;'.join(filters))
+        if filename:
+            self.open_file(filename)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def open_file(self, filename: str) -> TabWidget:
+        """Open the provided file in a new tab, or switch to the existing tab if the file is already open.
+
+        Returns:
+            The TabWidget instance containing the document.
+        """
+        path = os.path.abspath(filename)
+        for idx in range(self.ui.tabs.count()):
+            tab: TabWidget = self.ui.tabs.widget(idx)
+            if tab.filename and os.path.abspath(tab.filename) == path:
+                self.ui.tabs.setCurrentIndex(idx)
+                tab.ensure_loaded()
+                return tab
+
+        tab = self._create_tab()
+        self.ui.tabs.setCurrentWidget(tab)
+        tab.open(filename)
+        settings.add_recent(filename)
+        self._index.set_recent(settings.recent_files)
+        return tab
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def quick_open(self) -> None:
+        """Show the quick-open palette and jump to the item selected by the user."""
+        dialog = PaletteDialog(self, self._index)
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
+            return
+        entry = dialog.selected()
+        if entry is None:
+            return
+
+        if isinstance(entry.source, str):
+            # Entries from files that aren't open only know where the item was, open the file and follow the path.
+            tab = self.open_file(entry.source)
+            tab.select_path(entry.path)
+        elif self.ui.tabs.indexOf(entry.source) >= 0:
+            self.ui.tabs.setCurrentWidget(entry.source)
+            entry.source.select_item(entry.item)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def compare(self) -> None:
+        """Pick a file and show it side by side with the checklist in the current tab, or with another file if there
+        are no tabs open.
+        """
+        filters = [
+            'Markdown (*.md *.mkd *.mdwn *.mdown *.markdown *.mdtxt *.mdtext *.workbook)',
+            'XML (*.xml)'
+        ]
+        tab: TabWidget = self.ui.tabs.currentWidget()
+        if tab is not None:
+            left = tab.document
+            left_name = os.path.basename(tab.filename) if tab.filename else 'untitled'
+        else:
+            filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, 'Compare', filter=';;'.join(filters))
+            if not filename:
+                return
+            left = self._load_for_compare(filename)
+            left_name = os.path.basename(filename)
+            if left is None:
+                return
+
+        caption = f'Compare {left_name} With'
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, caption, filter=';;'.join(filters))
+        if not filename:
+            return
+        right = self._load_for_compare(filename)
+        if right is None:
+            return
+
+        CompareDialog(self, left, left_name, right, os.path.basename(filename)).exec()
+
+
+    def _load_for_compare(self, filename: str) -> DocumentModel:
+        document = DocumentModel()
+        try:
+            document.load(filename, document_cache() if settings.cache_documents else None)
+        except (OSError, UnicodeDecodeError, ValueError) as error:
+            QtWidgets.QMessageBox.warning(self, 'Unable to open', f'Unable to open "{filename}":\n\n{error}')
+            return None
+        return document
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def about(self):
+        """Show an about dialog with information about this tool."""
+        title = 'About Bine Markdown Checklist Editor'
+        info = metadata.metadata('bine')
+        description = info['Summary'] + '\n\n'
+        description += 'Author: ' + info['Author']
+        description += ' <' + info['Author-email'] + '>\n'
+        description += f"Copyright: (c) 2022-{datetime.now().strftime('%Y')} " + info['Author']
+        QtWidgets.QMessageBox.about(self, title, description)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _show_settings(self) -> None:
+        """Updates the settings menu to display the current settings."""
+        self.ui.actionHighlightDuplicates.setChecked(settings.highlight_duplicates)
+        self.ui.actionAutoSort.setChecked(settings.auto_sort)
+        self.ui.actionAutoCheck.setChecked(settings.auto_check)
+        self.ui.actionHideChecked.setChecked(settings.hide_checked)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _settings_changed(self) -> None:
+        sort = self.ui.actionAutoSort.isChecked() and not settings.auto_sort
+        settings.highlight_duplicates = self.ui.actionHighlightDuplicates.isChecked()
+        settings.auto_sort = self.ui.actionAutoSort.isChecked()
+        settings.auto_check = self.ui.actionAutoCheck.isChecked()
+        settings.hide_checked = self.ui.actionHideChecked.isChecked()
+
+        # Turning on auto-sort sorts every open document once, after that the lists are kept in order as they change.
+        # Each tab is then refreshed in a single pass to apply the remaining settings.
+        for idx in range(self.ui.tabs.count()):
+            tab: TabWidget = self.ui.tabs.widget(idx)
+            if sort:
+                tab.sort()
+            tab.refresh()
+
+
+
+# End of File
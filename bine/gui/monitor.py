@@ -0,0 +1,229 @@
+# ======================================================================================================================
+#      File:  /bine/gui/monitor.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Watches the files of the open tabs for changes made outside of Bine, such as by a version control update."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import logging
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from PySide6 import QtCore, QtWidgets
+
+from bine.model.document import DocumentModel
+from bine.model.item import Edit
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Change Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Change(NamedTuple):
+    """A file that was changed by another program, parsed and compared against the tab that has it open.
+
+    Attributes:
+        document: The newly parsed document.
+        unchanged: True if the document matches what the tab has, or what the tab last saved, leaving nothing to merge.
+        digest: The digest of the items of the tab, as they were when the edits were planned.
+        edits: The edits, planned by ItemModel.diff, that bring the items of the tab in line with the document.  The
+            items of the tab are given by their paths, see ItemModel.descendant, as they were planned against a copy.
+    """
+    document: DocumentModel
+    unchanged: bool
+    digest: bytes
+    edits: List[Edit]
+
+
+
+
+# ======================================================================================================================
+# Parse Task Class
+# ----------------------------------------------------------------------------------------------------------------------
+class _ParseTask(QtCore.QRunnable):
+    """Parses the changed file of a tab from a worker thread and plans how to merge it into the tab.
+
+    The document in the tab is still being edited from the GUI thread, it is snapshot there and the edits are planned
+    against a copy made from the snapshot.
+    """
+
+    def __init__(self, monitor: 'FileMonitor', tab: QtWidgets.QWidget, filename: str, generation: int,
+                 snapshot: Tuple, digest: bytes, saved: str):
+        super().__init__()
+        self._monitor = monitor
+        self._tab = tab
+        self._filename = filename
+        self._generation = generation
+        self._snapshot = snapshot
+        self._digest = digest
+        self._saved = saved
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def run(self) -> None:
+        try:
+            document = DocumentModel()
+            document.load(self._filename)
+            change = self._compare(document)
+        except Exception as error:
+            # The file may be caught half written, or have been removed, it'll be picked up again when it settles.
+            change = error
+        self._monitor._parsed.emit(self._tab, self._generation, change)
+
+
+    def _compare(self, document: DocumentModel) -> Change:
+        # Saving from Bine trips the monitor too, as do changes to the file that don't change the content.  Saves are
+        # written in the background, so the tab may have been edited again by the time the monitor reads the file.
+        current = DocumentModel()
+        current.restore(self._snapshot)
+        if document.equals(current) or document.saved_text == self._saved:
+            return Change(document, True, self._digest, [])
+
+        if settings.auto_sort:
+            document.root.sort()
+        edits = []
+        for edit in current.root.diff(document.root):
+            item = edit.item.path if edit.action in ('text', 'check') else edit.item
+            edits.append(edit._replace(parent=edit.parent.path, item=item))
+        return Change(document, False, self._digest, edits)
+
+
+
+
+# ======================================================================================================================
+# File Monitor Class
+# ----------------------------------------------------------------------------------------------------------------------
+class FileMonitor(QtCore.QObject):
+    """Watches the files open in tabs and reports when they've been changed by something else.
+
+    Changes are collected for a short while, as files tend to be written in several steps, and then the file is parsed
+    on a worker thread.  The freshly parsed document is handed back through the changed signal, as a Change, for the
+    owner to merge into the tab.
+    """
+
+    changed = QtCore.Signal(QtWidgets.QWidget, object)
+    _parsed = QtCore.Signal(object, int, object)
+
+    DELAY = 300
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self._paths: Dict[QtWidgets.QWidget, str] = {}
+        self._generations: Dict[QtWidgets.QWidget, int] = {}
+        self._dirty: Set[QtWidgets.QWidget] = set()
+
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._file_changed)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DELAY)
+        self._timer.timeout.connect(self._flush)
+
+        self._parsed.connect(self._store)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def track(self, tab: QtWidgets.QWidget) -> None:
+        """Start watching the file of a tab, following it as the tab is loaded or saved under a new name."""
+        self._paths[tab] = None
+        tab.contentChanged.connect(lambda: self._follow(tab))
+        self._follow(tab)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def forget(self, tab: QtWidgets.QWidget) -> None:
+        """Stop watching the file of a tab that is being closed."""
+        path = self._paths.pop(tab, None)
+        self._generations.pop(tab, None)
+        self._dirty.discard(tab)
+        self._unwatch(path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _follow(self, tab: QtWidgets.QWidget) -> None:
+        """Make sure that the file being watched for the tab is the one that it currently has loaded."""
+        if tab not in self._paths:
+            return
+        path = os.path.abspath(tab.filename) if tab.filename and not tab.deferred else None
+        previous = self._paths[tab]
+        if path == previous:
+            return
+        self._paths[tab] = path
+        self._unwatch(previous)
+        if path and path not in self._watcher.files():
+            self._watcher.addPath(path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _unwatch(self, path: str) -> None:
+        """Stop watching a path, unless it's still open in another tab."""
+        if path and path not in self._paths.values() and path in self._watcher.files():
+            self._watcher.removePath(path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _file_changed(self, path: str) -> None:
+        for tab, watched in self._paths.items():
+            if watched == path:
+                self._dirty.add(tab)
+        self._timer.start()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _flush(self) -> None:
+        """Parse the files that changed, once they've settled down."""
+        # Files that are replaced rather than rewritten drop out of the watcher, pick them up again if they're back.
+        watched = set(self._watcher.files())
+        for path in set(self._paths.values()) - watched:
+            if path and os.path.isfile(path):
+                self._watcher.addPath(path)
+
+        dirty, self._dirty = self._dirty, set()
+        for tab in dirty:
+            path = self._paths.get(tab)
+            if not path or not os.path.isfile(path):
+                continue
+            generation = self._generations.get(tab, 0) + 1
+            self._generations[tab] = generation
+            document = tab.document
+            task = _ParseTask(self, tab, path, generation, document.snapshot(), document.root.digest,
+                              document.saved_text)
+            QtCore.QThreadPool.globalInstance().start(task)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _store(self, tab: QtWidgets.QWidget, generation: int, change: Change) -> None:
+        """Receives the parsed documents back on the GUI thread."""
+        # Ignore results for tabs that have since closed or that were superseded by a newer change.
+        if self._generations.get(tab) != generation:
+            return
+        if isinstance(change, Exception):
+            logging.warning('Unable to reload %s: %s', self._paths.get(tab), change)
+            return
+        if not change.unchanged:
+            self.changed.emit(tab, change)
+
+
+
+
+# End of File
@@ -0,0 +1,278 @@
+# ======================================================================================================================
+#      File:  /bine/gui/palette.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Quick-open palette for jumping to any item in the open tabs or the recently used files."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import logging
+from typing import Any, Dict, List
+
+from PySide6 import QtCore, QtWidgets
+
+from bine.libraries.cache import document_cache
+from bine.libraries.fuzzy import Entry, Matcher, Snapshot, build_index, snapshot
+from bine.model.document import DocumentModel
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Index Task Class
+# ----------------------------------------------------------------------------------------------------------------------
+class _IndexTask(QtCore.QRunnable):
+    """Builds the search entries for a single open document or file from a worker thread.
+
+    Open documents are still being edited from the GUI thread, they are snapshot there and only the snapshot is handed
+    to the task.  Files are loaded by the task itself.
+    """
+
+    def __init__(self, index: 'QuickOpenIndex', key: Any, generation: int, items: List[Snapshot] = None):
+        super().__init__()
+        self._index = index
+        self._key = key
+        self._generation = generation
+        self._items = items
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def run(self) -> None:
+        try:
+            if self._items is not None:
+                entries = build_index(self._items, self._key)
+            else:
+                document = DocumentModel()
+                document.load(self._key, document_cache() if settings.cache_documents else None)
+                entries = build_index(snapshot(document.root, keep_items=False), self._key)
+        except Exception:
+            # A missing or malformed recent file should not take down the palette - it just won't be searchable.
+            logging.debug('Unable to index %s', self._key, exc_info=True)
+            entries = []
+        self._index._indexed.emit(self._key, self._generation, entries)
+
+
+
+
+# ======================================================================================================================
+# Quick Open Index Class
+# ----------------------------------------------------------------------------------------------------------------------
+class QuickOpenIndex(QtCore.QObject):
+    """Keeps a flat, searchable index of the items in every open tab and recently used file.
+
+    Documents are re-indexed on a worker thread shortly after they change so that searching never has to walk the
+    trees itself.
+    """
+
+    updated = QtCore.Signal()
+    _indexed = QtCore.Signal(object, int, list)
+
+    DELAY = 500
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self._tabs: List[QtWidgets.QWidget] = []
+        self._files: List[str] = []
+        self._entries: Dict[Any, List[Entry]] = {}
+        self._generations: Dict[Any, int] = {}
+        self._dirty = set()
+        self._flattened: List[Entry] = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DELAY)
+        self._timer.timeout.connect(self._flush)
+
+        self._indexed.connect(self._store)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def track(self, tab: QtWidgets.QWidget) -> None:
+        """Start indexing an open tab, re-indexing it whenever its content changes."""
+        self._tabs.append(tab)
+        tab.contentChanged.connect(lambda: self.invalidate(tab))
+        self.invalidate(tab)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def forget(self, tab: QtWidgets.QWidget) -> None:
+        """Drop a tab that is being closed from the index."""
+        if tab in self._tabs:
+            self._tabs.remove(tab)
+        self._dirty.discard(tab)
+        self._generations.pop(tab, None)
+        self._entries.pop(tab, None)
+        self._flattened = None
+        self.updated.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def set_recent(self, filenames: List[str]) -> None:
+        """Update the list of recently used files to be indexed, indexing any files that are new to the list."""
+        for filename in self._files:
+            if filename not in filenames:
+                self._generations.pop(filename, None)
+                self._entries.pop(filename, None)
+        for filename in filenames:
+            if filename not in self._files:
+                self._schedule(filename)
+        self._files = list(filenames)
+        self._flattened = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def invalidate(self, key: Any) -> None:
+        """Mark a tab or file as changed so that it gets re-indexed once the changes settle down."""
+        self._dirty.add(key)
+        self._timer.start()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def entries(self) -> List[Entry]:
+        """Return all of the currently indexed entries, excluding recent files that are already open in a tab."""
+        if self._flattened is None:
+            # Tabs restored from the last session that are yet to be loaded are still searched through their files.
+            open_files = {os.path.abspath(tab.filename) for tab in self._tabs if tab.filename and not tab.deferred}
+            flattened = []
+            for tab in self._tabs:
+                flattened.extend(self._entries.get(tab, []))
+            for filename in self._files:
+                if filename not in open_files:
+                    flattened.extend(self._entries.get(filename, []))
+            self._flattened = flattened
+        return self._flattened
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _flush(self) -> None:
+        """Kick off worker tasks for everything that has changed since the last time the timer fired."""
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            self._schedule(key)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _schedule(self, key: Any) -> None:
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        items = snapshot(key.document.root) if key in self._tabs else None
+        QtCore.QThreadPool.globalInstance().start(_IndexTask(self, key, generation, items))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _store(self, key: Any, generation: int, entries: List[Entry]) -> None:
+        """Receives the results from the worker tasks back on the GUI thread."""
+        # Ignore results for tabs that have since closed or that were superseded by a newer request.
+        if self._generations.get(key) != generation:
+            return
+        self._entries[key] = entries
+        self._flattened = None
+        self.updated.emit()
+
+
+
+
+# ======================================================================================================================
+# Palette Dialog Class
+# ----------------------------------------------------------------------------------------------------------------------
+class PaletteDialog(QtWidgets.QDialog):
+    """A popup with a search box that lists the items matching what has been typed, best matches first."""
+
+    LIMIT = 50
+
+    def __init__(self, parent: QtWidgets.QWidget, index: QuickOpenIndex):
+        super().__init__(parent)
+        self.setWindowTitle('Go to Item')
+        self.resize(600, 400)
+
+        self._index = index
+        self._matcher = Matcher()
+        self._matcher.set_entries(index.entries())
+        self._results: List[Entry] = []
+
+        self.search = QtWidgets.QLineEdit(self)
+        self.search.setPlaceholderText('Search items in open tabs and recent files...')
+        self.search.installEventFilter(self)
+        self.results = QtWidgets.QListWidget(self)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(3, 3, 3, 3)
+        layout.addWidget(self.search)
+        layout.addWidget(self.results)
+
+        self.search.textChanged.connect(self._search)
+        self.search.returnPressed.connect(self.accept)
+        self.results.itemActivated.connect(self.accept)
+        index.updated.connect(self._index_updated)
+
+        self._search()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def selected(self) -> Entry:
+        """Return the entry the user picked or None if there were no results."""
+        row = self.results.currentRow()
+        if 0 <= row < len(self._results):
+            return self._results[row]
+        return None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def done(self, result: int) -> None:
+        # The index outlives this dialog, stop listening to it once the dialog is closed.
+        self._index.updated.disconnect(self._index_updated)
+        super().done(result)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        # Allow the results to be navigated with the arrow keys without leaving the search box.
+        if watched is self.search and event.type() == QtCore.QEvent.KeyPress:
+            if event.key() in (QtCore.Qt.Key_Up, QtCore.Qt.Key_Down, QtCore.Qt.Key_PageUp, QtCore.Qt.Key_PageDown):
+                QtWidgets.QApplication.sendEvent(self.results, event)
+                return True
+        return super().eventFilter(watched, event)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _index_updated(self) -> None:
+        self._matcher.set_entries(self._index.entries())
+        self._search()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _search(self) -> None:
+        self._results = self._matcher.search(self.search.text(), self.LIMIT)
+        self.results.clear()
+        for entry in self._results:
+            if isinstance(entry.source, str):
+                location = os.path.basename(entry.source)
+            else:
+                location = os.path.basename(entry.source.filename) if entry.source.filename else 'untitled'
+            if entry.context:
+                location = f'{location}: {entry.context}'
+            self.results.addItem(f'{entry.text}    ({location})')
+        if self._results:
+            self.results.setCurrentRow(0)
+
+
+
+
+# End of File
@@ -0,0 +1,123 @@
+# ======================================================================================================================
+#      File:  /bine/gui/printing.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Builds printable QTextDocuments straight from the item tree.
+
+Rather than generating HTML only for Qt to parse it again, the document is assembled with a QTextCursor using native
+lists with checkbox markers.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from typing import Dict
+
+from PySide6 import QtGui
+
+from bine.libraries.render import INLINE_MARKUP, render_inline
+from bine.model.document import DocumentModel
+
+
+
+
+# ======================================================================================================================
+# Document Builder
+# ----------------------------------------------------------------------------------------------------------------------
+def build_text_document(document: DocumentModel) -> QtGui.QTextDocument:
+    """Create a QTextDocument with the title, description, and checklists from the provided document."""
+    text_document = QtGui.QTextDocument()
+    cursor = QtGui.QTextCursor(text_document)
+
+    if document.title:
+        title = QtGui.QTextCharFormat()
+        title.setFontPointSize(18)
+        title.setFontWeight(QtGui.QFont.Bold)
+        cursor.insertText(document.title, title)
+        cursor.insertBlock(QtGui.QTextBlockFormat(), QtGui.QTextCharFormat())
+
+    if document.description:
+        # The description is the only free-form Markdown in the document, let Qt deal with its HTML.
+        cursor.insertHtml(document.description_html())
+        cursor.insertBlock(QtGui.QTextBlockFormat(), QtGui.QTextCharFormat())
+
+    # Each level of the checklist gets its own list format, indented one step further than the last.
+    formats: Dict[int, QtGui.QTextListFormat] = {}
+    lists: Dict[int, QtGui.QTextList] = {}
+    checked = QtGui.QTextBlockFormat()
+    checked.setMarker(QtGui.QTextBlockFormat.MarkerType.Checked)
+    unchecked = QtGui.QTextBlockFormat()
+    unchecked.setMarker(QtGui.QTextBlockFormat.MarkerType.Unchecked)
+
+    first = True
+    stack = [(iter(document.root.children), 1)]
+    while stack:
+        item = next(stack[-1][0], None)
+        if item is None:
+            stack.pop()
+            continue
+        level = stack[-1][1]
+
+        if first:
+            cursor.setBlockFormat(checked if item.checked else unchecked)
+        else:
+            cursor.insertBlock(checked if item.checked else unchecked)
+
+        # The first item of every run of children starts a new list, the others are added to it.
+        if lists.get(level) is None:
+            if level not in formats:
+                formats[level] = QtGui.QTextListFormat()
+                formats[level].setStyle(QtGui.QTextListFormat.ListDisc)
+                formats[level].setIndent(level)
+            lists[level] = cursor.createList(formats[level])
+        else:
+            lists[level].add(cursor.block())
+        first = False
+
+        text = item.text + (':' if item.children else '')
+        if INLINE_MARKUP.search(text):
+            cursor.insertHtml(render_inline(text))
+        else:
+            cursor.insertText(text)
+
+        if item.children:
+            lists[level + 1] = None
+            stack.append((iter(item.children), level + 1))
+
+    return text_document
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def print_text_document(text_document: QtGui.QTextDocument, printer: QtGui.QPagedPaintDevice) -> None:
+    """Print the document, laying it out for the page size of the printer only when the page size changes.
+
+    A document without a page size is copied and laid out from scratch every time it is printed, which happens for
+    every repaint of a print preview.  Paginating the document itself lets the layout be kept between repaints.
+    """
+    resolution = printer.logicalDpiY()
+    rect = printer.pageLayout().paintRectPixels(resolution)
+    scale = QtGui.QGuiApplication.primaryScreen().logicalDotsPerInch() / resolution
+    size = rect.size().toSizeF() * scale
+    if text_document.pageSize() != size:
+        text_document.setPageSize(size)
+    text_document.print_(printer)
+
+
+
+
+# End of File
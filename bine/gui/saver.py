@@ -0,0 +1,144 @@
+# ======================================================================================================================
+#      File:  /bine/gui/saver.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Writes documents to disk from a worker thread so that saving never holds up editing."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import logging
+from typing import Dict
+
+from PySide6 import QtCore
+
+from bine.libraries import instrument
+from bine.model.document import write_file
+
+
+
+
+# ======================================================================================================================
+# Write Task Class
+# ----------------------------------------------------------------------------------------------------------------------
+class _WriteTask(QtCore.QRunnable):
+    """Writes the text of a document to its file from a worker thread."""
+
+    def __init__(self, saver: 'BackgroundSaver', filename: str, text: str):
+        super().__init__()
+        self._saver = saver
+        self._filename = filename
+        self._text = text
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def run(self) -> None:
+        try:
+            with instrument.span('BackgroundSaver.write'):
+                write_file(self._filename, self._text)
+            message = ''
+        except OSError as error:
+            message = str(error)
+        except Exception as error:
+            # Anything else, such as text that can't be encoded, is still reported as a failed save.  Otherwise the
+            # saver would be left busy forever and waiting for it would hang.
+            logging.exception('Unable to write %s', self._filename)
+            message = f'{type(error).__name__}: {error}'
+        self._saver._written.emit(self._filename, self._text, message)
+
+
+
+
+# ======================================================================================================================
+# Background Saver Class
+# ----------------------------------------------------------------------------------------------------------------------
+class BackgroundSaver(QtCore.QObject):
+    """Saves the text of a document on a worker thread, reporting back once the file has been written.
+
+    The text is a snapshot taken on the GUI thread, so the document can go on being edited while it's written.  Writes
+    run one at a time, in order, and saves requested while a file is being written replace any older save of the same
+    file that is still waiting, so rapid saves cost one more write rather than one each.
+    """
+
+    saved = QtCore.Signal(str, str)
+    failed = QtCore.Signal(str, str)
+    _written = QtCore.Signal(str, str, str)
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._writing = False
+        self._pending: Dict[str, str] = {}
+        self._written.connect(self._finished)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def busy(self) -> bool:
+        """True while a file is being written or waiting to be written."""
+        return self._writing or bool(self._pending)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def save(self, filename: str, text: str) -> None:
+        """Write the provided text to the file, replacing the file only once the new text has been written in full.
+
+        Arguments:
+            filename: The file to be written.
+            text: The complete text of the document, as it was when the save was requested.
+        """
+        if self._writing:
+            if filename in self._pending:
+                instrument.count('BackgroundSaver.coalesced')
+            self._pending[filename] = text
+        else:
+            self._start(filename, text)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def wait(self) -> None:
+        """Block until everything that has been saved is written and the results have been reported."""
+        while self.busy:
+            self._pool.waitForDone()
+            # The results are queued for the GUI thread, deliver them now so that any waiting saves get started.
+            QtCore.QCoreApplication.sendPostedEvents(self, QtCore.QEvent.MetaCall)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _start(self, filename: str, text: str) -> None:
+        self._writing = True
+        self._pool.start(_WriteTask(self, filename, text))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _finished(self, filename: str, text: str, message: str) -> None:
+        """Receives the result of each write back on the GUI thread."""
+        self._writing = False
+        if self._pending:
+            waiting = next(iter(self._pending))
+            self._start(waiting, self._pending.pop(waiting))
+        if message:
+            self.failed.emit(filename, message)
+        else:
+            self.saved.emit(filename, text)
+
+
+
+
+# End of File
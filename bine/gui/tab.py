@@ -1,372 +1,714 @@
-# ======================================================================================================================
-#      File:  /bine/gui/tab.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""Tab container for a single document in the GUI."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-import os
-import pickle
-
-from PySide6 import QtCore, QtGui, QtWidgets, QtPrintSupport
-
-from bine.gui.base.tab import Ui_Tab
-from bine.model.document import DocumentModel, ItemModel
-
-
-
-
-# ======================================================================================================================
-# Tab Widget Class
-# ----------------------------------------------------------------------------------------------------------------------
-class TabWidget(QtWidgets.QWidget):
-    """A tree and editor for a single document within a single tab of the GUI window."""
-
-    contentChanged = QtCore.Signal()
-    itemSelected = QtCore.Signal(ItemModel)
-    undoTextChanged = QtCore.Signal(str)
-    redoTextChanged = QtCore.Signal(str)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.ui = Ui_Tab()
-        self.ui.setupUi(self)
-
-        self.filename = None
-        self.document = DocumentModel()
-        self.clipboard = QtGui.QClipboard()
-        self.undo_stack = QtGui.QUndoStack(self)
-
-        # Connect events.
-        self.ui.group.toggled.connect(self._toggle_details_group)
-
-        # Connect the update event to the top level widget.  This way, any change from an item will update the state of
-        # the entire tree.  This ensures that parents will update children when checked and progress bars get updated
-        # for parents, going the other way.
-        def item_changed():
-            self.ui.lists.update()
-            self.contentChanged.emit()
-        self.ui.lists.contentChanged.connect(item_changed)
-        self.ui.lists.itemSelected.connect(lambda item: self.itemSelected.emit(item))
-        self.ui.title.textChanged.connect(self._title_changed)
-        self.ui.description.textChanged.connect(self._description_changed)
-
-        self.undo_stack.undoTextChanged.connect(lambda text: self.undoTextChanged.emit(text))
-        self.undo_stack.redoTextChanged.connect(lambda text: self.redoTextChanged.emit(text))
-        self.ui.lists.command.connect(lambda command: self.undo_stack.push(command))
-
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _toggle_details_group(self) -> None:
-        if self.ui.group.isChecked():
-            self.show_details()
-        else:
-            self.hide_details()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def show_details(self) -> None:
-        self.ui.group.setChecked(True)
-        self.ui.group.setFixedHeight(self.ui.group.sizeHint().height())
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def hide_details(self) -> None:
-        self.ui.group.setChecked(False)
-        self.ui.group.setFixedHeight(18)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _title_changed(self) -> None:
-        self.document.title = self.ui.title.text()
-        self.contentChanged.emit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _description_changed(self) -> None:
-        self.document.description = self.ui.description.toPlainText()
-        self.contentChanged.emit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def open(self, filename: str) -> None:
-        """Load the specified document in this tab.
-
-        Arguments:
-            filename: The path to the file to be loaded in this tab.
-        """
-        self.filename = filename
-        self.document.load(self.filename)
-
-        self.ui.title.setText(self.document.title)
-        self.ui.description.setPlainText(self.document.description)
-        self.ui.lists.set_item_model(self.document.root)
-        self.ui.lists.set_selection(0)
-
-        # Hide the description if the document doesn't have one.
-        if not self.document.description:
-            self.hide_details()
-
-        self.contentChanged.emit()
-
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def save(self) -> bool:
-        """Called to save a currently open document to the opened filename.
-
-        If no filename is set because this is a new document then revert to a "save as".
-
-        Returns:
-            Boolean True when the document is saved or False if the user cancelled out of the "save as" dialog.
-        """
-        if not self.filename:
-            # If save was selected but this is a new document and filename hasn't been set then we need to pick a
-            # filename now.
-            return self.save_as()
-
-        self.document.dump(self.filename, update_cache=True)
-        self.contentChanged.emit()
-        return True
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _save_dialog(self) -> str:
-        """Launch a save file dialog and return the selected filename.
-
-        Shared for save as and save a copy.
-        """
-        filters = [
-            'Markdown (*.md *.mkd *.mdwn *.mdown *.markdown *.mdtxt *.mdtext *.workbook)',
-            'XML (*.xml)'
-        ]
-        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, filter=';;'.join(filters))
-        return filename
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def save_as(self) -> bool:
-        """Set a new filename for the document and save the contents into that.
-
-        Returns:
-            Boolean True when the document is saved or False if the user cancelled out of the "save as" dialog.
-        """
-        filename = self._save_dialog()
-        if filename:
-            self.filename = filename
-            return self.save()
-        return False
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def save_copy(self) -> None:
-        """Save a copy of the current document and continue editing under the existing filename."""
-        filename = self._save_dialog()
-        if filename:
-            self.document.dump(filename, update_cache=False)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def warn(self) -> bool:
-        """Warn the user that there are unsaved changes and prompt them to save before continuing.
-
-        Returns:
-            True if the user has acknowledged the unsaved changes and processing should continue of False if the user
-            has cancelled and the caller should cease what it was doing.
-        """
-        # No unsaved changes, nothing to warn about.
-        if not self.document.dirty():
-            return True
-
-        # Changes exist, lets prompt the user for an action.
-        flags = QtWidgets.QMessageBox.Discard
-        flags |= QtWidgets.QMessageBox.Save
-        message = 'What would you like to do with your unsaved changes?'
-        result = QtWidgets.QMessageBox.critical(self, 'Unsaved changes', message, flags)
-
-        # If they sad "save" then lets try to save them.
-        if result == QtWidgets.QMessageBox.Save:
-            return self.save()
-
-        # It they said discard then return True indicating the software should proceed anyways.
-        return True
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def refresh(self):
-        self.ui.lists.update()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def undo(self):
-        self.undo_stack.undo()
-        self.contentChanged.emit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def redo(self):
-        self.undo_stack.redo()
-        self.contentChanged.emit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def cut(self) -> None:
-        self.copy()
-        self.delete()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def copy(self) -> None:
-        """Copy the currently selected item and it's children both as plain text and as binary (for internal use)."""
-        widget = self.ui.lists.get_selected_leaf_item()
-        if widget:
-            item = widget.item()
-
-            mime_data = QtCore.QMimeData()
-            mime_data.setText(item.dumps())
-            mime_data.setData('application/vnd-bine-item', pickle.dumps(item))
-
-            self.clipboard.setMimeData(mime_data)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def paste(self) -> None:
-        mime_data = self.clipboard.mimeData()
-        selected = self.ui.lists.get_selected_leaf_list()
-        parent = selected.item()
-
-        # First, see if there is any custom data to be pasted (copied to clipboard already from Bine).
-        data = mime_data.data('application/vnd-bine-item')
-        if data:
-            try:
-                item = pickle.loads(data)
-            except pickle.UnpicklingError:
-                return
-
-            # Successfully unpickled - insert the item and correct the part/child double linkage.
-            item.parent = parent
-            parent.children.append(item)
-            selected.insert(item)
-            self.contentChanged.emit()
-
-        # Otherwise, fall back on trying to do something with plain text.
-        else:
-            text = mime_data.text()
-            if text:
-                for text in text.split('\n'):
-                    item = ItemModel(parent, text.strip())
-                    parent.children.append(item)
-                    selected.insert(item)
-                self.contentChanged.emit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def insert(self) -> None:
-        selected = self.ui.lists.get_selected_leaf_list()
-        selected.add()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def edit(self) -> None:
-        selected = self.ui.lists.get_selected_leaf_item()
-        if selected:
-            selected.edit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def delete(self) -> None:
-        selected = self.ui.lists.get_selected_leaf_parent_list()
-        if selected:
-            selected.delete()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def toggle(self) -> None:
-        selected = self.ui.lists.get_selected_leaf_item()
-        if selected:
-            selected.toggle()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def on_print(self) -> None:
-        """Print the current document."""
-        dialog = QtPrintSupport.QPrintDialog()
-        if dialog.exec() == QtWidgets.QDialog.Accepted:
-            browser = QtWidgets.QTextEdit()
-            browser.setHtml(self.document.to_html())
-            browser.print_(dialog.printer())
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def preview(self) -> None:
-        """Preview the HTML before printing."""
-        browser = QtWidgets.QTextEdit()
-        browser.setHtml(self.document.to_html())
-        dialog = QtPrintSupport.QPrintPreviewDialog()
-        dialog.paintRequested.connect(browser.print_)
-        dialog.exec()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def export_html(self, theme: str) -> None:
-        """Export the current contents of the document to an HTML file.
-
-        Arguments:
-            theme: The name of the css theme to use in the generated HTML document ('white' or 'slate').
-        """
-        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, 'Export HTML', filter='HTML (*.html *.htm)')
-        if filename:
-            assets = os.path.join(os.path.dirname(__file__), '..', 'assets')
-            def style(filename):
-                with open(os.path.join(assets, 'css', filename), 'r', encoding='utf-8') as handle:
-                    return f'<style type="text/css">{handle.read()}</style>'
-            def script(filename):
-                with open(os.path.join(assets, 'js', filename), 'r', encoding='utf-8') as handle:
-                    return f'<script types="text/javascript">{handle.read()}</script>'
-            document = self.document.to_html()
-            html = f"""<html>
-    <head>
-        {style('main.min.css')}
-        {style('palette.min.css')}
-        {script('palette.min.js')}
-    </head>
-    <body dir="ltr" data-md-color-scheme="{theme}">
-        <div class="md-container">
-            <main class="md-main">
-                <div class="md-main__inner md-grid">
-                    <div class="md-content">
-                        <article class="md-content__inner md-typeset">
-                           {document}
-                        </article>
-                    </div>
-                </div>
-            </main>
-        </div>
-    </body>
-</html>"""
-
-            with open(filename, 'w', encoding='utf-8') as handle:
-                handle.write(html)
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/gui/tab.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Tab container for a single document in the GUI."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import pickle
+from typing import Callable, List
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from bine.gui.base.tab import Ui_Tab
+from bine.gui.monitor import Change
+from bine.gui.printing import build_text_document, print_text_document
+from bine.gui.saver import BackgroundSaver
+from bine.libraries import instrument
+from bine.libraries.cache import document_cache
+from bine.libraries.export import write_html
+from bine.libraries.journal import Journal
+from bine.libraries.undo.item import Insert, Restructure
+from bine.model.document import DocumentModel, ItemModel
+from bine.model.item import Step
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Tab Widget Class
+# ----------------------------------------------------------------------------------------------------------------------
+class TabWidget(QtWidgets.QWidget):
+    """A tree and editor for a single document within a single tab of the GUI window."""
+
+    contentChanged = QtCore.Signal()
+    itemSelected = QtCore.Signal(ItemModel)
+    undoTextChanged = QtCore.Signal(str)
+    redoTextChanged = QtCore.Signal(str)
+
+    # Milliseconds that changes are collected for before they are written to the journal together.
+    JOURNAL_DELAY = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ui = Ui_Tab()
+        self.ui.setupUi(self)
+
+        self.filename = None
+        self.document = DocumentModel()
+
+        # Selection path for a tab whose document is still waiting to be loaded, see open_later.
+        self._deferred: List[int] = None
+        self.clipboard = QtGui.QClipboard()
+        self.undo_stack = QtGui.QUndoStack(self)
+
+        # Files are written from a worker thread, the error from the last failed save is kept for save to report.
+        self._saver = BackgroundSaver(self)
+        self._saver.saved.connect(self._saved)
+        self._saver.failed.connect(self._save_failed)
+        self._save_error: str = None
+
+        # Unsaved changes are journaled, so they can be recovered after a crash, in batches once editing pauses.
+        self._journal: Journal = None
+        self._journal_timer = QtCore.QTimer(self)
+        self._journal_timer.setSingleShot(True)
+        self._journal_timer.setInterval(self.JOURNAL_DELAY)
+        self._journal_timer.timeout.connect(self._flush_journal)
+        self.contentChanged.connect(self._journal_timer.start)
+
+        # The document built for printing is kept until the next change to the content.
+        self._printable: QtGui.QTextDocument = None
+        self.contentChanged.connect(self._discard_printable)
+
+        # Connect events.
+        self.ui.group.toggled.connect(self._toggle_details_group)
+
+        # Connect the update event to the top level widget.  This way, any change from an item will update the state of
+        # the entire tree.  This ensures that parents will update children when checked and progress bars get updated
+        # for parents, going the other way.
+        def item_changed():
+            self.ui.lists.update()
+            self.contentChanged.emit()
+        self.ui.lists.contentChanged.connect(item_changed)
+
+        # Changes to check states are more common and more contained - only update the rows that could be affected.
+        def check_changed(item: ItemModel):
+            self.ui.lists.refresh_item(item)
+            self.contentChanged.emit()
+        self.ui.lists.checkChanged.connect(check_changed)
+        self.ui.lists.itemMoved.connect(lambda item: self.contentChanged.emit())
+        self.ui.lists.itemSelected.connect(lambda item: self.itemSelected.emit(item))
+        self.ui.title.textChanged.connect(self._title_changed)
+        self.ui.description.textChanged.connect(self._description_changed)
+
+        self.undo_stack.undoTextChanged.connect(lambda text: self.undoTextChanged.emit(text))
+        self.undo_stack.redoTextChanged.connect(lambda text: self.redoTextChanged.emit(text))
+        self.ui.lists.command.connect(lambda command: self.undo_stack.push(command))
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _toggle_details_group(self) -> None:
+        if self.ui.group.isChecked():
+            self.show_details()
+        else:
+            self.hide_details()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def show_details(self) -> None:
+        self.ui.group.setChecked(True)
+        self.ui.group.setFixedHeight(self.ui.group.sizeHint().height())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def hide_details(self) -> None:
+        self.ui.group.setChecked(False)
+        self.ui.group.setFixedHeight(18)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _title_changed(self) -> None:
+        self.document.title = self.ui.title.text()
+        if self._journal:
+            self._journal.record(('title', self.document.title))
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _description_changed(self) -> None:
+        # The editor also reports changes that are only to the formatting, such as from the spell checker.
+        description = self.ui.description.toPlainText()
+        if self._journal and description != self.document.description:
+            self._journal.record(('description', description))
+        self.document.description = description
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('TabWidget.open')
+    def open(self, filename: str) -> None:
+        """Load the specified document in this tab.
+
+        Arguments:
+            filename: The path to the file to be loaded in this tab.
+        """
+        self.filename = filename
+        self.document.load(self.filename, document_cache() if settings.cache_documents else None)
+        if settings.auto_sort:
+            self.document.root.sort()
+        self._show_document(self._recover())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def new(self, name: str = None) -> bool:
+        """Set this tab up with a new, empty, document that has yet to be given a filename.
+
+        Arguments:
+            name: The name of the journal of an untitled document left behind by a session that didn't end properly.
+                The user is asked if it should be recovered into this tab.
+
+        Returns:
+            False if there was a journal to recover but it was empty or the user chose not to recover it, in which case
+            the tab is of no further use.
+        """
+        journal = self._recover(name)
+        if name is not None and journal is None:
+            return False
+        self._show_document(journal)
+        return True
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _show_document(self, journal: Journal) -> None:
+        """Fill in the widgets from the document once it has been loaded or recovered and start journaling changes."""
+        self.ui.title.setText(self.document.title)
+        self.ui.description.setPlainText(self.document.description)
+        self.ui.lists.set_item_model(self.document.root)
+        self.ui.lists.set_selection(0)
+
+        # Hide the description if the document doesn't have one.
+        if not self.document.description:
+            self.hide_details()
+
+        # Only start journaling once the widgets are filled in, setting them up isn't a change to the document.
+        if journal is not None:
+            journal.start()
+        self._journal = journal
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _recover(self, name: str = None) -> Journal:
+        """Offer to recover the unsaved changes left in the journal by a session that didn't end properly.
+
+        Arguments:
+            name: The name of the journal to recover for an untitled document, see new.
+
+        Returns:
+            The journal for the document, ready to be started, or None if journaling is disabled.  Also None for an
+            untitled journal that wasn't recovered, which is removed.
+        """
+        if not settings.journal_changes:
+            return None
+        journal = Journal(self.filename, self.document, name=name)
+        entries = journal.read()
+        if entries:
+            if self.filename:
+                message = f'"{os.path.basename(self.filename)}" has unsaved changes from a session that didn\'t end '
+                message += 'properly.\n\nRecover them?'
+            else:
+                message = 'An untitled document was left unsaved by a session that didn\'t end properly.\n\nRecover it?'
+            if QtWidgets.QMessageBox.question(self, 'Recover changes', message) == QtWidgets.QMessageBox.Yes:
+                journal.recover(entries)
+                return journal
+        if name:
+            journal.close()
+            return None
+        return journal
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _flush_journal(self) -> None:
+        if self._journal:
+            self._journal.flush()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def close_journal(self) -> None:
+        """Remove the journal of this tab, for when the tab is closed and its changes have been saved or discarded."""
+        self._journal_timer.stop()
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('TabWidget.merge')
+    def merge(self, change: Change) -> None:
+        """Bring this tab in line with a newer copy of its document, such as one changed on disk by another program.
+
+        Only the items that differ are changed, so that the rest of the widgets, the selection and the columns that are
+        showing are left as they were.  The undo history no longer applies afterwards and is cleared.
+
+        Arguments:
+            change: The newer copy of the document, its items are taken over by this tab, along with the edits planned
+                by the FileMonitor to merge it.
+        """
+        document = change.document
+        root = self.document.root
+        if root.digest == change.digest:
+            # The paths in the plan are resolved before any of it is applied, while the rows still line up.
+            edits = []
+            for edit in change.edits:
+                item = root.descendant(edit.item) if edit.action in ('text', 'check') else edit.item
+                edits.append(edit._replace(parent=root.descendant(edit.parent), item=item))
+        else:
+            # The tab was edited while the file was being compared, plan again against what it has now.
+            edits = root.diff(document.root)
+
+        if self._journal:
+            self._journal.stop()
+        self.ui.lists.apply_edits(edits)
+        self.undo_stack.clear()
+
+        # The document now matches the file, as far as Bine can tell, so it's no longer dirty.
+        self.document.title = document.title
+        self.document.description = document.description
+        self.document.adopt(document)
+        self.document.update_cache(document.dumps())
+        if self._journal:
+            self._journal.start()
+        if self.ui.title.text() != document.title:
+            self.ui.title.setText(document.title)
+        if self.ui.description.toPlainText() != document.description:
+            self.ui.description.setPlainText(document.description)
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def open_later(self, filename: str, selection: List[int] = None) -> None:
+        """Associate this tab with a file without loading it yet, as done for the tabs restored from the last session.
+
+        The document is loaded, and the selection restored, by ensure_loaded once the tab is first shown.
+
+        Arguments:
+            filename: The path to the file to be loaded in this tab.
+            selection: Optional path of rows to the item that is to be selected once loaded.
+        """
+        self.filename = filename
+        self._deferred = list(selection or [])
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def deferred(self) -> bool:
+        """True while the file for this tab is yet to be loaded."""
+        return self._deferred is not None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def ensure_loaded(self) -> None:
+        """Load the document for a tab set up with open_later, if that hasn't happened already."""
+        if self._deferred is None:
+            return
+        selection, self._deferred = self._deferred, None
+        self.open(self.filename)
+        if selection:
+            self.select_path(selection)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def selected_path(self) -> List[int]:
+        """Return the rows leading to the selected item, suitable for select_path, or an empty list."""
+        if self._deferred is not None:
+            return list(self._deferred)
+        widget = self.ui.lists.get_selected_leaf_item()
+        if widget is None:
+            return []
+        return [node.row() for node in widget.item().chain[1:]]
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def save(self, wait: bool = False) -> bool:
+        """Called to save a currently open document to the opened filename.
+
+        If no filename is set because this is a new document then revert to a "save as".
+
+        The document is written from a worker thread, so editing can carry on while a large document is written.  It
+        is no longer dirty once the write has finished.
+
+        Arguments:
+            wait: When True, block until the file has been written, such as before closing the tab.
+
+        Returns:
+            Boolean True when the document is saved or False if the user cancelled out of the "save as" dialog.  When
+            waiting, False is also returned if the file couldn't be written.
+        """
+        if not self.filename:
+            # If save was selected but this is a new document and filename hasn't been set then we need to pick a
+            # filename now.
+            return self.save_as(wait)
+
+        self._save_error = None
+        self._saver.save(self.filename, self.document.dumps())
+        if wait:
+            self._saver.wait()
+            return self._save_error is None
+        return True
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def wait_for_save(self) -> None:
+        """Block until any saves that are still being written have finished."""
+        self._saver.wait()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _saved(self, filename: str, text: str) -> None:
+        # A copy, or a save to a name this tab has since moved away from, doesn't change what this tab is based on.
+        if filename == self.filename:
+            self.document.update_cache(text)
+
+            # The journal starts over from the file as saved, keeping any changes made while it was being written.
+            if self._journal and self._journal.filename != os.path.abspath(filename):
+                self.close_journal()
+            if self._journal:
+                self._journal.reset()
+            elif settings.journal_changes:
+                self._journal = Journal(filename, self.document)
+                self._journal.start()
+            self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _save_failed(self, filename: str, message: str) -> None:
+        self._save_error = message
+        message = f'Unable to save "{os.path.basename(filename)}".\n\n{message}'
+        QtWidgets.QMessageBox.warning(self, 'Save failed', message)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _save_dialog(self) -> str:
+        """Launch a save file dialog and return the selected filename.
+
+        Shared for save as and save a copy.
+        """
+        filters = [
+            'Markdown (*.md *.mkd *.mdwn *.mdown *.markdown *.mdtxt *.mdtext *.workbook)',
+            'XML (*.xml)'
+        ]
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, filter=';;'.join(filters))
+        return filename
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def save_as(self, wait: bool = False) -> bool:
+        """Set a new filename for the document and save the contents into that.
+
+        Arguments:
+            wait: When True, block until the file has been written, see save.
+
+        Returns:
+            Boolean True when the document is saved or False if the user cancelled out of the "save as" dialog.
+        """
+        filename = self._save_dialog()
+        if filename:
+            self.filename = filename
+            return self.save(wait)
+        return False
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def save_copy(self) -> None:
+        """Save a copy of the current document and continue editing under the existing filename."""
+        filename = self._save_dialog()
+        if filename:
+            self._saver.save(filename, self.document.dumps())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def warn(self) -> bool:
+        """Warn the user that there are unsaved changes and prompt them to save before continuing.
+
+        Returns:
+            True if the user has acknowledged the unsaved changes and processing should continue of False if the user
+            has cancelled and the caller should cease what it was doing.
+        """
+        # No unsaved changes, nothing to warn about.  Documents that were never loaded can't have any either.
+        self.wait_for_save()
+        if self.deferred or not self.document.dirty():
+            return True
+
+        # Changes exist, lets prompt the user for an action.
+        flags = QtWidgets.QMessageBox.Discard
+        flags |= QtWidgets.QMessageBox.Save
+        message = 'What would you like to do with your unsaved changes?'
+        result = QtWidgets.QMessageBox.critical(self, 'Unsaved changes', message, flags)
+
+        # If they sad "save" then lets try to save them.
+        if result == QtWidgets.QMessageBox.Save:
+            return self.save(wait=True)
+
+        # It they said discard then return True indicating the software should proceed anyways.
+        return True
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def dispose(self) -> None:
+        """Let go of the document and everything built for it when this tab is closed.
+
+        Removing the tab from the window only detaches it, so the caller is expected to delete the tab afterwards.  This
+        cuts the references that would otherwise keep the document and its widget tree alive until then, or forever in
+        the case of the connections that were made to this tab by its owner.
+        """
+        for signal in (self.contentChanged, self.itemSelected, self.undoTextChanged, self.redoTextChanged):
+            try:
+                signal.disconnect()
+            except RuntimeError:
+                pass  # Nothing was connected.
+
+        self.close_journal()
+        self.undo_stack.clear()
+        self.ui.description.highlighter.stop()
+        self.ui.lists.dispose()
+        self._printable = None
+        self.document = DocumentModel()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def refresh(self):
+        self.ui.lists.update()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def sort(self) -> None:
+        """Sort every list in the document, used when auto-sort is first enabled.
+
+        The undo history refers to items by their rows, which no longer hold once every list is reordered, so it is
+        cleared.
+        """
+        self.document.root.sort()
+        self.ui.lists.sort_items()
+        self.undo_stack.clear()
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def undo(self):
+        self.undo_stack.undo()
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def redo(self):
+        self.undo_stack.redo()
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def cut(self) -> None:
+        self.copy()
+        self.delete()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def copy(self) -> None:
+        """Copy the currently selected item and it's children both as plain text and as binary (for internal use)."""
+        widget = self.ui.lists.get_selected_leaf_item()
+        if widget:
+            item = widget.item()
+
+            mime_data = QtCore.QMimeData()
+            mime_data.setText(item.dumps(preserve=False))
+            mime_data.setData('application/vnd-bine-item', pickle.dumps(item))
+
+            self.clipboard.setMimeData(mime_data)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def paste(self) -> None:
+        mime_data = self.clipboard.mimeData()
+        selected = self.ui.lists.get_selected_leaf_list()
+        parent = selected.item()
+
+        # First, see if there is any custom data to be pasted (copied to clipboard already from Bine).
+        data = mime_data.data('application/vnd-bine-item')
+        if data:
+            try:
+                item = pickle.loads(data)
+            except pickle.UnpicklingError:
+                return
+
+            # Successfully unpickled - insert the item, which also corrects the parent/child double linkage.
+            self.undo_stack.push(Insert(self.ui.lists, parent, [item], f'paste "{item.text}"'))
+
+        # Otherwise, fall back on trying to do something with plain text.
+        else:
+            text = mime_data.text()
+            if text:
+                items = [ItemModel(parent, text.strip()) for text in text.split('\n')]
+                self.undo_stack.push(Insert(self.ui.lists, parent, items, 'paste'))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def insert(self) -> None:
+        selected = self.ui.lists.get_selected_leaf_list()
+        selected.add()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def insert_child(self) -> None:
+        """Insert a new item as a child of the selected item."""
+        selected = self.ui.lists.get_selected_leaf_item()
+        if selected:
+            self.ui.lists.list_widget(selected.item()).add()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _plan(self, planner: Callable[[ItemModel, List[int]], List[Step]]) -> List[Step]:
+        """Plan a structural edit of the selected items using one of the planning methods of the ItemModel."""
+        selected = self.ui.lists.get_selected_leaf_parent_list()
+        if selected is None:
+            return []
+        return planner(selected.item(), selected.selected_rows())
+
+
+    def _restructure(self, verb: str, planner: Callable[[ItemModel, List[int]], List[Step]]) -> None:
+        """Apply a structural edit to the selected items as a single undoable command."""
+        steps = self._plan(planner)
+        if not steps:
+            return
+        if len(steps) == 1:
+            description = f'{verb} "{steps[0].source.children[steps[0].row].text}"'
+        else:
+            description = f'{verb} {len(steps)} items'
+        self.undo_stack.push(Restructure(self.ui.lists, description, steps))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def move_up(self) -> None:
+        self._restructure('move up', ItemModel.plan_move_up)
+
+
+    def move_down(self) -> None:
+        self._restructure('move down', ItemModel.plan_move_down)
+
+
+    def indent(self) -> None:
+        self._restructure('indent', ItemModel.plan_indent)
+
+
+    def dedent(self) -> None:
+        self._restructure('dedent', ItemModel.plan_dedent)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def can_move_up(self) -> bool:
+        return bool(self._plan(ItemModel.plan_move_up))
+
+
+    def can_move_down(self) -> bool:
+        return bool(self._plan(ItemModel.plan_move_down))
+
+
+    def can_indent(self) -> bool:
+        return bool(self._plan(ItemModel.plan_indent))
+
+
+    def can_dedent(self) -> bool:
+        return bool(self._plan(ItemModel.plan_dedent))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def edit(self) -> None:
+        selected = self.ui.lists.get_selected_leaf_item()
+        if selected:
+            selected.edit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def delete(self) -> None:
+        selected = self.ui.lists.get_selected_leaf_parent_list()
+        if selected:
+            selected.delete()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def toggle(self) -> None:
+        selected = self.ui.lists.get_selected_leaf_item()
+        if selected:
+            selected.toggle()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def select_path(self, path: List[int]) -> None:
+        """Select the item found by following the provided rows down from the root of the document."""
+        if path:
+            self.ui.lists.select_path(path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def select_item(self, item: ItemModel) -> None:
+        """Select the provided item, if it is still a part of this document."""
+        if item.root is not self.document.root:
+            return
+        self.select_path(list(item.path))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def printable(self) -> QtGui.QTextDocument:
+        """Return the document laid out for printing, building it only if the content has changed since last time."""
+        if self._printable is None:
+            self._printable = build_text_document(self.document)
+        return self._printable
+
+
+    def _discard_printable(self) -> None:
+        self._printable = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def on_print(self) -> None:
+        """Print the current document."""
+        from PySide6 import QtPrintSupport
+        dialog = QtPrintSupport.QPrintDialog()
+        if dialog.exec() == QtWidgets.QDialog.Accepted:
+            print_text_document(self.printable(), dialog.printer())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def preview(self) -> None:
+        """Preview the document before printing."""
+        from PySide6 import QtPrintSupport
+        dialog = QtPrintSupport.QPrintPreviewDialog()
+        dialog.paintRequested.connect(lambda printer: print_text_document(self.printable(), printer))
+        dialog.exec()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def export_html(self, theme: str) -> None:
+        """Export the current contents of the document to an HTML file.
+
+        Arguments:
+            theme: The name of the css theme to use in the generated HTML document ('white' or 'slate').
+        """
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, 'Export HTML', filter='HTML (*.html *.htm)')
+        if filename:
+            with open(filename, 'w', encoding='utf-8') as handle:
+                write_html(self.document, handle, theme)
+
+
+
+
+# End of File
@@ -0,0 +1,147 @@
+# ======================================================================================================================
+#      File:  /bine/gui/watchdog.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Watchdog that reports what the GUI thread was doing whenever the event loop stops responding.
+
+A timer on the GUI thread updates a heartbeat while a background thread keeps an eye on it.  When the heartbeat falls
+more than the threshold behind, the Python stack of the GUI thread is sampled and logged along with the slot that Qt
+called into and the last event that was delivered.  Once the event loop catches up, the total length of the stall is
+logged too.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import time
+import logging
+import threading
+import traceback
+from types import FrameType
+
+from PySide6 import QtCore
+
+
+
+
+# ======================================================================================================================
+# Watchdog Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Watchdog(QtCore.QObject):
+    """Logs a stack trace of the GUI thread whenever the event loop is blocked for longer than the threshold.
+
+    Must be created and started on the GUI thread, after the QApplication, from the function that goes on to run the
+    event loop.
+    """
+
+    def __init__(self, threshold: int = 100, parent: QtCore.QObject = None):
+        """
+        Arguments:
+            threshold: How long, in milliseconds, the event loop may be blocked before the stack is reported.
+            parent: Optional owner of this watchdog.
+        """
+        super().__init__(parent)
+        self._threshold = threshold / 1000
+        self._beat = time.monotonic()
+        self._event = None
+        self._thread_id = threading.get_ident()
+        self._base: FrameType = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(max(10, threshold // 4))
+        self._timer.timeout.connect(self._heartbeat)
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def start(self) -> None:
+        # Anything Qt calls into from the event loop is stacked on top of the frame that runs the event loop.
+        self._base = sys._getframe(1)
+        self._beat = time.monotonic()
+        self._timer.start()
+        QtCore.QCoreApplication.instance().installEventFilter(self)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name='bine-watchdog', daemon=True)
+        self._thread.start()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def stop(self) -> None:
+        self._stop.set()
+        self._timer.stop()
+        QtCore.QCoreApplication.instance().removeEventFilter(self)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        # Remember the last event delivered, cheaply, to help explain what kicked off a stall.
+        self._event = (event.type(), type(watched).__name__)
+        return False
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _heartbeat(self) -> None:
+        now = time.monotonic()
+        stalled = now - self._beat - self._timer.interval() / 1000
+        self._beat = now
+        if stalled > self._threshold:
+            logging.warning('GUI thread was blocked for %.0f ms', stalled * 1000)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _watch(self) -> None:
+        """Runs on the watchdog thread, checking on the heartbeat and reporting once per stall."""
+        reported = None
+        while not self._stop.wait(self._threshold / 4):
+            beat = self._beat
+            stalled = time.monotonic() - beat - self._timer.interval() / 1000
+            if stalled < self._threshold or beat == reported:
+                continue
+            reported = beat
+
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            event, receiver = self._event or (None, None)
+            event = f'{getattr(event, "name", event)} for {receiver}' if event is not None else 'unknown'
+            logging.warning('GUI thread blocked for over %.0f ms in %s (last event: %s)\n%s',
+                            stalled * 1000, self._handler(frame), event, ''.join(traceback.format_stack(frame)))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _handler(self, frame: FrameType) -> str:
+        """Describe the outermost Python function called from the event loop - the slot or event handler that Qt called
+        into.
+        """
+        while frame.f_back is not None and frame.f_back is not self._base:
+            frame = frame.f_back
+        code = frame.f_code
+        name = getattr(code, 'co_qualname', code.co_name)
+        return f'{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+
+
+# End of File
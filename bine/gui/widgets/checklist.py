@@ -1,256 +1,630 @@
-# ======================================================================================================================
-#      File:  /bine/gui/widgets/checklist.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""Glorified extension of a QListWidget to represent a single Checklist node from a document."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-from PySide6 import QtCore, QtGui, QtWidgets
-
-from bine.gui.base.checklist import Ui_ChecklistWidget
-from bine.gui.widgets.item.item import ChecklistItemWidget
-from bine.model.item import ItemModel
-from bine.settings import settings
-
-
-
-
-# ======================================================================================================================
-# Checklist Widget Class
-# ----------------------------------------------------------------------------------------------------------------------
-class ChecklistWidget(QtWidgets.QWidget):
-    """A widget that contains a QListWidget of ItemModel objects to be used in a column view."""
-
-    contentChanged = QtCore.Signal()
-    itemSelected = QtCore.Signal(ItemModel)
-    command = QtCore.Signal(QtGui.QUndoCommand)
-
-    def __init__(self, parent: QtWidgets.QWidget, parent_widget: 'ChecklistWidget' = None):
-        super().__init__(parent)
-        self.ui = Ui_ChecklistWidget()
-        self.ui.setupUi(self)
-
-        self._parent_widget = parent_widget
-        self._mouse_position: QtCore.QPoint = None
-        self._list: ItemModel = None
-
-        self.ui.children.setVisible(False)
-
-        self.popmenu = QtWidgets.QMenu(self)
-        self.popmenu_insert = QtGui.QAction('Insert', self)
-        self.popmenu.addAction(self.popmenu_insert)
-        self.popmenu_delete = QtGui.QAction('Delete', self)
-        # self.popmenu_delete.setEnabled(bool(selected))
-        self.popmenu.addAction(self.popmenu_delete)
-        self.popmenu_insert.triggered.connect(self.add)
-        self.popmenu_delete.triggered.connect(lambda: self.delete())
-
-        self.ui.items.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        self.ui.items.customContextMenuRequested.connect(lambda p: self.popmenu.exec(self.ui.items.mapToGlobal(p)))
-        self.ui.items.itemSelectionChanged.connect(self._selection_changed)
-        self.ui.items.dropEvent = self.dropEvent
-        self.installEventFilter(self)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def item(self) -> ItemModel:
-        return self._list
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def set_item_model(self, list: ItemModel):
-        self._list = list
-        for child in list.children:
-            self.insert(child)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def set_selection(self, index: int = 0) -> None:
-        self.ui.items.setCurrentRow(index)
-        self.ui.items.setFocus()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if event.type() == QtCore.QEvent.KeyPress:
-            if event.key() == QtCore.Qt.Key_Right:
-                # Set the current child list as focused.
-                current: ChecklistWidget = self.ui.children.currentWidget()
-                if current:
-                    current.ui.items.setFocus()
-
-                    # If no items are selected in the child list then select the first one.
-                    if not current.ui.items.selectedItems():
-                        current.ui.items.setCurrentRow(0)
-
-                return True
-
-            if event.key() == QtCore.Qt.Key_Left:
-                if self._parent_widget:
-                    self._parent_widget.ui.items.setFocus()
-                return True
-
-        return super().eventFilter(watched, event)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def update(self):
-        for idx in range(self.ui.items.count()):
-            widget: ChecklistWidget = self.ui.items.item(idx).data(QtCore.Qt.UserRole)
-            widget.update()
-            self.ui.items.setRowHidden(idx, settings.hide_checked and widget._item.checked)
-
-        for idx in range(self.ui.children.count()):
-            widget = self.ui.children.widget(idx)
-            widget.update()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def dropEvent(self, event: QtGui.QDropEvent) -> None:
-        """When an item is dropped in the GUI, sort the parent list according to the GUI indexes.
-
-        This feels like a hack.  Is there a better way to sync the GUI sort order to the model?
-        """
-        QtWidgets.QListWidget.dropEvent(self.ui.items, event)
-        def get_index(item: ItemModel) -> int:
-            for index in range(self.ui.items.count()):
-                widget = self.ui.items.item(index)
-                if widget.data(QtCore.Qt.UserRole).item() is item:
-                    return index
-            return None
-        self._list.children.sort(key=get_index)
-        self.contentChanged.emit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def _selection_changed(self):
-        selected = self.ui.items.selectedIndexes()
-        self.popmenu_delete.setEnabled(len(selected) == 1)
-        if selected:
-            row = selected[0].row()
-            self.ui.children.setCurrentIndex(row)
-            self.ui.children.setVisible(True)
-            item = self.ui.items.item(row).data(QtCore.Qt.UserRole).item()
-            self.itemSelected.emit(item)
-        else:
-            self.ui.children.setVisible(False)
-            self.itemSelected.emit(None)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def get_selected_leaf_item(self) -> ChecklistItemWidget:
-        """Dive the tree to get the child-most currently selected list widget."""
-        selected = self.ui.items.selectedIndexes()
-        if selected:
-            index = selected[0].row()
-            child: ChecklistWidget = self.ui.children.widget(index)
-            item = child.get_selected_leaf_item()
-            if item is None:
-                item = self.ui.items.item(index).data(QtCore.Qt.UserRole)
-            return item
-        else:
-            return None
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def get_selected_leaf_list(self) -> 'ChecklistWidget':
-        selected = self.ui.items.selectedIndexes()
-        if selected:
-            child: ChecklistWidget = self.ui.children.widget(selected[0].row())
-            list = child.get_selected_leaf_list()
-            if list is None:
-                return child
-            return list
-        else:
-            return self
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def get_selected_leaf_parent_list(self) -> 'ChecklistWidget':
-        selected = self.ui.items.selectedIndexes()
-        if selected:
-            child: ChecklistWidget = self.ui.children.widget(selected[0].row())
-            list = child.get_selected_leaf_parent_list()
-            if list is None:
-                return self
-            return list
-        else:
-            return None
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def add(self):
-        item = ItemModel(self._list)
-        self._list.children.append(item)
-        widget = self.insert(item)
-        widget.edit()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def insert(self, item: ItemModel) -> ChecklistItemWidget:
-        """Called to insert a new item into the list at the current selected location.
-
-        If no item in the list is currently selected then insert a new item at the end of the list.
-        """
-        list_item = QtWidgets.QListWidgetItem(self.ui.items)
-        list_item.setData(QtCore.Qt.UserRole, item)
-        self.ui.items.addItem(list_item)
-        item_widget = ChecklistItemWidget(None, item)
-        item_widget.setListWidgetItem(list_item)
-        list_item.setData(QtCore.Qt.UserRole, item_widget)
-        self.ui.items.setItemWidget(list_item, item_widget)
-        item_widget.contentChanged.connect(lambda: self.contentChanged.emit())
-        item_widget.command.connect(lambda command: self.command.emit(command))
-        item_widget.delete.connect(self.delete)
-        item_widget.cascade.connect(self.add)
-
-        # Recursively add children items to the children stack.
-        list_widget = ChecklistWidget(self.ui.children, self)
-        list_widget.set_item_model(item)
-        list_widget.contentChanged.connect(lambda: self.contentChanged.emit())
-        list_widget.command.connect(lambda command: self.command.emit(command))
-        self.ui.children.addWidget(list_widget)
-
-        size_policy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-        size_policy.setHorizontalStretch(item.level)
-        list_widget.setSizePolicy(size_policy)
-
-        return item_widget
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def delete(self, widget: ChecklistItemWidget = None):
-        """Fires to delete the currently selected item from the list."""
-        if widget is None:
-            selected = self.ui.items.selectedIndexes()
-            if not selected:
-                return
-            row = selected[0].row()
-        else:
-            row = self.ui.items.row(widget.listWidgetItem())
-        self.ui.items.takeItem(row)
-        self.ui.children.removeWidget(self.ui.children.widget(row))
-        self._list.children.pop(row)
-        self.contentChanged.emit()
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/gui/widgets/checklist.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Glorified extension of a QListWidget to represent a single Checklist node from a document."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from typing import List
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from bine.gui.base.checklist import Ui_ChecklistWidget
+from bine.gui.widgets.item.item import ChecklistItemWidget
+from bine.libraries import instrument
+from bine.libraries.undo.item import CheckChange, Delete, Insert, Restructure, TextChange
+from bine.model.item import Edit, ItemModel
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Constants
+# ----------------------------------------------------------------------------------------------------------------------
+# Data role of the list entries used to store the ChecklistWidget for the children of the entry.
+CHILD_LIST_ROLE = QtCore.Qt.UserRole + 1
+
+
+
+
+# ======================================================================================================================
+# List Entry Class
+# ----------------------------------------------------------------------------------------------------------------------
+class _ListItem(QtWidgets.QListWidgetItem):
+    """A list entry that sorts by the row of its item in the model, allowing the GUI to be ordered to match."""
+
+    def __lt__(self, other: '_ListItem') -> bool:
+        return self.data(QtCore.Qt.UserRole).item().row() < other.data(QtCore.Qt.UserRole).item().row()
+
+
+
+
+# ======================================================================================================================
+# Checklist Widget Class
+# ----------------------------------------------------------------------------------------------------------------------
+class ChecklistWidget(QtWidgets.QWidget):
+    """A widget that contains a QListWidget of ItemModel objects to be used in a column view."""
+
+    contentChanged = QtCore.Signal()
+    checkChanged = QtCore.Signal(ItemModel)
+    itemMoved = QtCore.Signal(ItemModel)
+    itemSelected = QtCore.Signal(ItemModel)
+    command = QtCore.Signal(QtGui.QUndoCommand)
+
+    def __init__(self, parent: QtWidgets.QWidget, parent_widget: 'ChecklistWidget' = None):
+        super().__init__(parent)
+        self.ui = Ui_ChecklistWidget()
+        self.ui.setupUi(self)
+
+        self._parent_widget = parent_widget
+        self._mouse_position: QtCore.QPoint = None
+        self._list: ItemModel = None
+
+        self.ui.children.setVisible(False)
+
+        self.popmenu = QtWidgets.QMenu(self)
+        self.popmenu_insert = QtGui.QAction('Insert', self)
+        self.popmenu.addAction(self.popmenu_insert)
+        self.popmenu_delete = QtGui.QAction('Delete', self)
+        # self.popmenu_delete.setEnabled(bool(selected))
+        self.popmenu.addAction(self.popmenu_delete)
+        self.popmenu_insert.triggered.connect(self.add)
+        self.popmenu_delete.triggered.connect(lambda: self.delete())
+
+        self.ui.items.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.ui.items.customContextMenuRequested.connect(lambda p: self.popmenu.exec(self.ui.items.mapToGlobal(p)))
+        self.ui.items.itemSelectionChanged.connect(self._selection_changed)
+        self.ui.items.dropEvent = self.dropEvent
+        self.installEventFilter(self)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def item(self) -> ItemModel:
+        return self._list
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def set_item_model(self, list: ItemModel):
+        self._list = list
+        for child in list.children:
+            self.insert(child)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def set_selection(self, index: int = 0) -> None:
+        self.ui.items.setCurrentRow(index)
+        self.ui.items.setFocus()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def select_path(self, path: List[int]) -> None:
+        """Select a nested item by following the provided rows down through the child lists.
+
+        Arguments:
+            path: The row of the item to be selected at each level, starting with this list.
+        """
+        row = path[0]
+        if not 0 <= row < self.ui.items.count():
+            return
+        self.ui.items.setCurrentRow(row)
+        child = self._child_list(row)
+        if len(path) > 1 and child.ui.items.count():
+            child.select_path(path[1:])
+        else:
+            self.ui.items.setFocus()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.KeyPress:
+            if event.key() == QtCore.Qt.Key_Right:
+                # Set the current child list as focused.
+                current: ChecklistWidget = self.ui.children.currentWidget()
+                if current:
+                    current.ui.items.setFocus()
+
+                    # If no items are selected in the child list then select the first one.
+                    if not current.ui.items.selectedItems():
+                        current.ui.items.setCurrentRow(0)
+
+                return True
+
+            if event.key() == QtCore.Qt.Key_Left:
+                if self._parent_widget:
+                    self._parent_widget.ui.items.setFocus()
+                return True
+
+        return super().eventFilter(watched, event)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('ChecklistWidget.update')
+    def update(self):
+        for idx in range(self.ui.items.count()):
+            self._update_row(idx)
+
+        for idx in range(self.ui.children.count()):
+            widget = self.ui.children.widget(idx)
+            widget.update()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _update_row(self, row: int) -> None:
+        """Update the item widget in the specified row and show or hide the row according to its check state."""
+        widget: ChecklistItemWidget = self.ui.items.item(row).data(QtCore.Qt.UserRole)
+        widget.update()
+        self.ui.items.setRowHidden(row, settings.hide_checked and widget.item().checked)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def refresh_item(self, item: ItemModel) -> None:
+        """Update the GUI after the check state of a single item has changed.
+
+        Rather than updating the entire tree, only the rows for the item and for each of its parents are updated (their
+        state and progress may have changed) along with the rows of its children (checks cascade down).  This must be
+        called on the top-level list.
+
+        Arguments:
+            item: The item for which the state has changed.
+        """
+        widget = self
+        for node in item.chain[1:]:
+            row = node.row()
+            widget._update_row(row)
+            widget = widget._child_list(row)
+        if widget is not self:
+            widget.update()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def sort_items(self) -> None:
+        """Re-order the rows of this list, and of all of the child lists, to match the order of the model."""
+        self.ui.items.sortItems()
+        for idx in range(self.ui.children.count()):
+            self.ui.children.widget(idx).sort_items()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def top(self) -> 'ChecklistWidget':
+        """Return the top-level list, the one representing the root of the document."""
+        widget = self
+        while widget._parent_widget is not None:
+            widget = widget._parent_widget
+        return widget
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def list_widget(self, item: ItemModel) -> 'ChecklistWidget':
+        """Find the list representing the children of the provided item.
+
+        The rows of the lists always mirror the rows of the model so the list is found by following the rows of the
+        parents of the item down from this, the top-level, list.
+        """
+        widget = self
+        for node in item.chain[1:]:
+            widget = widget._child_list(node.row())
+        return widget
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def item_widget(self, item: ItemModel) -> ChecklistItemWidget:
+        """Find the widget representing the provided item, searching down from this, the top-level, list."""
+        widget = self.list_widget(item.parent)
+        return widget.ui.items.item(item.row()).data(QtCore.Qt.UserRole)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def insert_items(self, parent: ItemModel, items: List[ItemModel], rows: List[int] = None) -> List[int]:
+        """Insert items into the model and add the widgets for them.  Must be called on the top-level list.
+
+        Arguments:
+            parent: The item under which the items are to be inserted.
+            items: The items to be inserted, along with any children they already have.
+            rows: The final row of each of the items under the parent, as returned from an earlier call, or None to let
+                the parent decide.
+
+        Returns:
+            The row of each of the items once they have all been inserted.
+        """
+        widget = self.list_widget(parent)
+        if rows is None:
+            for item in items:
+                parent.add(item)
+            rows = [item.row() for item in items]
+        else:
+            # Inserting in order of the final rows puts each item straight into its place.
+            for row, item in sorted(zip(rows, items), key=lambda pair: pair[0]):
+                parent.insert(row, item)
+        # The widgets are built once the model is complete, so what they show about the tree is worked out just once.
+        widget.insert_rows(items, rows)
+        self.select_items(items)
+        self.contentChanged.emit()
+        return rows
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def remove_items(self, parent: ItemModel, rows: List[int]) -> None:
+        """Remove items, along with their children, from the model and from the lists.  Must be called on the top-level
+        list.
+
+        Arguments:
+            parent: The item from which the items are to be removed.
+            rows: The rows of the items under the parent.
+        """
+        # The selection is only looked at once the rows are gone, rather than as each selected row is removed.
+        widget = self.list_widget(parent)
+        widget.ui.items.blockSignals(True)
+        for row in sorted(rows, reverse=True):
+            widget.remove_row(row)
+            parent.take(row)
+        widget.ui.items.blockSignals(False)
+        widget._selection_changed()
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def move_item(self, source: ItemModel, row: int, destination: ItemModel, destination_row: int = None) -> ItemModel:
+        """Move an item in the model and update the affected lists to match.  Must be called on the top-level list.
+
+        Arguments:
+            source: The current parent of the item to be moved.
+            row: The current row of the item under the source.
+            destination: The new parent for the item.
+            destination_row: The row of the item within the destination after the move, or None to let the destination
+                decide.
+
+        Returns:
+            The item that was moved.
+        """
+        # Find the lists before changing the model - rows of the parents may change along with the move.
+        source_list = self.list_widget(source)
+        destination_list = self.list_widget(destination)
+        item = source.move(row, destination, destination_row)
+        destination_row = item.row()
+
+        if source_list is destination_list:
+            # Within the same list, the existing widgets are simply moved to the new row.
+            source_list._move_row(row, destination_row)
+        else:
+            # Across lists the widgets are rebuilt for the moved item only.  The item now sits at a new level.
+            source_list.remove_row(row)
+            destination_list.insert(item, destination_row)
+
+        destination_list.set_selection(destination_row)
+        self.refresh_item(item)
+        if source is not destination and source.parent is not None:
+            self.refresh_item(source)
+        self.itemMoved.emit(item)
+        return item
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def apply_edits(self, edits: List[Edit]) -> None:
+        """Apply edits planned by ItemModel.diff to the model, updating only the rows that they affect.  Must be called on
+        the top-level list.
+
+        The widgets for unchanged items are left as they are, along with the selection in each list.
+        """
+        affected = []
+        for edit in edits:
+            # The rows of the parents are found before the change, they stay put within the lists of their own parents.
+            widget = self.list_widget(edit.parent)
+            if edit.action == 'remove':
+                widget.remove_row(edit.row)
+            edit.parent.apply(edit)
+            if edit.action == 'insert':
+                widget.insert(edit.item, edit.row)
+                widget._update_row(edit.row)
+            affected.append(edit.parent if edit.action in ('remove', 'insert') else edit.item)
+
+        # Any change to the texts can change which items are duplicates, anywhere in the document.
+        if settings.highlight_duplicates and any(edit.action != 'check' for edit in edits):
+            self.update()
+            return
+        for item in dict.fromkeys(affected):
+            if item.root is self._list:
+                self.refresh_item(item)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def select_items(self, items: List[ItemModel]) -> None:
+        """Select the provided sibling items, selecting their parents in the lists to the left so that they are shown.
+        Must be called on the top-level list.
+        """
+        widget = self
+        for node in items[0].parent.chain[1:]:
+            widget.ui.items.setCurrentRow(node.row())
+            widget = widget._child_list(node.row())
+
+        # Select all of the items in one go, so that the selection changes only once however many items there are.
+        model = widget.ui.items.model()
+        selection = QtCore.QItemSelection()
+        for item in items:
+            index = model.index(item.row(), 0)
+            selection.select(index, index)
+        widget.ui.items.selectionModel().select(selection, QtCore.QItemSelectionModel.ClearAndSelect)
+        widget.ui.items.setCurrentRow(items[-1].row(), QtCore.QItemSelectionModel.NoUpdate)
+        widget.ui.items.setFocus()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def selected_rows(self) -> List[int]:
+        """Return the rows of all of the selected items in this list, in order."""
+        return sorted(index.row() for index in self.ui.items.selectedIndexes())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _child_list(self, row: int) -> 'ChecklistWidget':
+        """Return the ChecklistWidget holding the children of the item in the specified row."""
+        return self.ui.items.item(row).data(CHILD_LIST_ROLE)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _move_row(self, source: int, destination: int) -> None:
+        """Move a row of the list, along with its item widget, from the source row to the destination row."""
+        target = destination + 1 if destination > source else destination
+        self.ui.items.model().moveRow(QtCore.QModelIndex(), source, QtCore.QModelIndex(), target)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _item_changed(self, item: ItemModel) -> None:
+        """Fires when the text or state of one of the items in this list has been changed."""
+        if settings.auto_sort:
+            # Renamed items get moved straight to their new sorted position rather than re-sorting the whole list.
+            row = item.row()
+            new_row = self._list.reposition(item)
+            if new_row != row:
+                self._move_row(row, new_row)
+        self.contentChanged.emit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def dropEvent(self, event: QtGui.QDropEvent) -> None:
+        """When items are dropped in the GUI, move them in the model as a single undoable command.
+
+        Items may be dragged within a list or from any other list (column) of the same document.  All of the selected
+        items are moved, keeping their order.  The default handling of the QListWidget is bypassed entirely, the
+        Restructure command updates the model and the lists.
+        """
+        source_items = event.source()
+        source_list = source_items.parent() if isinstance(source_items, QtWidgets.QListWidget) else None
+        if not isinstance(source_list, ChecklistWidget) or source_list.top() is not self.top():
+            event.ignore()
+            return
+
+        rows = source_list.selected_rows()
+        if not rows:
+            event.ignore()
+            return
+        source = source_list.item()
+
+        # Work out where the items were dropped, counting the dragged rows as still being in place.
+        index = self.ui.items.indexAt(event.position().toPoint())
+        if not index.isValid():
+            destination_row = self.ui.items.count()
+        elif self.ui.items.dropIndicatorPosition() == QtWidgets.QAbstractItemView.BelowItem:
+            destination_row = index.row() + 1
+        else:
+            destination_row = index.row()
+
+        # Accept the drop as a copy so that the source list doesn't try to remove the dragged rows on its own.
+        event.setDropAction(QtCore.Qt.CopyAction)
+        event.accept()
+
+        steps = source.plan_move_to(rows, self._list, destination_row)
+        if not steps:
+            return
+        if len(rows) == 1:
+            description = f'move "{source.children[rows[0]].text}"'
+        else:
+            description = f'move {len(rows)} items'
+        self.command.emit(Restructure(self.top(), description, steps))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _selection_changed(self):
+        selected = self.selected_rows()
+        self.popmenu_delete.setEnabled(len(selected) == 1)
+        if selected:
+            row = self.ui.items.currentRow()
+            if row not in selected:
+                row = selected[0]
+
+            # The children can only be shown for one item at a time - hide them while several items are selected.
+            self.ui.children.setCurrentWidget(self._child_list(row))
+            self.ui.children.setVisible(len(selected) == 1)
+            item = self.ui.items.item(row).data(QtCore.Qt.UserRole).item()
+            self.itemSelected.emit(item)
+        else:
+            self.ui.children.setVisible(False)
+            self.itemSelected.emit(None)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def get_selected_leaf_item(self) -> ChecklistItemWidget:
+        """Dive the tree to get the child-most currently selected list widget."""
+        selected = self.ui.items.selectedIndexes()
+        if selected:
+            index = selected[0].row()
+            child = self._child_list(index)
+            item = child.get_selected_leaf_item() if len(selected) == 1 else None
+            if item is None:
+                item = self.ui.items.item(index).data(QtCore.Qt.UserRole)
+            return item
+        else:
+            return None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def get_selected_leaf_list(self) -> 'ChecklistWidget':
+        selected = self.ui.items.selectedIndexes()
+        if len(selected) == 1:
+            child = self._child_list(selected[0].row())
+            list = child.get_selected_leaf_list()
+            if list is None:
+                return child
+            return list
+        else:
+            return self
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def get_selected_leaf_parent_list(self) -> 'ChecklistWidget':
+        """Dive the tree to get the child-most list with a selection, stopping at a list with several selected items."""
+        selected = self.ui.items.selectedIndexes()
+        if len(selected) > 1:
+            return self
+        if selected:
+            child = self._child_list(selected[0].row())
+            list = child.get_selected_leaf_parent_list()
+            if list is None:
+                return self
+            return list
+        else:
+            return None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def add(self):
+        """Add a new, empty, item to this list as an undoable command and start editing it."""
+        item = ItemModel(self._list)
+        top = self.top()
+        self.command.emit(Insert(top, self._list, [item]))
+        top.item_widget(item).edit()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def insert(self, item: ItemModel, row: int = None) -> ChecklistItemWidget:
+        """Called to insert the widgets for an item, that is already in the model, into the list.
+
+        Arguments:
+            item: The item to be represented.
+            row: The row at which to insert the item, which should match the row of the item in the model.  If not
+                provided then the item is added to the end of the list.
+        """
+        if row is None:
+            row = self.ui.items.count()
+        list_item = _ListItem()
+        self.ui.items.insertItem(row, list_item)
+        return self._build_row(list_item, item)
+
+
+    def insert_rows(self, items: List[ItemModel], rows: List[int]) -> List[ChecklistItemWidget]:
+        """Insert the widgets for several items, that are already in the model, into the list in one go.
+
+        Arguments:
+            items: The items to be represented.
+            rows: The row of each of the items, matching their rows in the model.
+        """
+        pairs = sorted(zip(rows, items), key=lambda pair: pair[0])
+        if not pairs:
+            return []
+
+        # A visible list moves every one of its item widgets after each inserted row.  That's held off until all of the
+        # rows are in, then done once for the lot.  Inserting in order of the rows puts each one straight into place.
+        list_items = []
+        self.ui.items.rowsInserted = lambda parent, start, end: None
+        try:
+            for row, _ in pairs:
+                list_item = _ListItem()
+                self.ui.items.insertItem(row, list_item)
+                list_items.append(list_item)
+        finally:
+            del self.ui.items.rowsInserted
+        QtWidgets.QListWidget.rowsInserted(self.ui.items, QtCore.QModelIndex(), pairs[0][0], pairs[-1][0])
+
+        return [self._build_row(list_item, item) for list_item, (_, item) in zip(list_items, pairs)]
+
+
+    def _build_row(self, list_item: QtWidgets.QListWidgetItem, item: ItemModel) -> ChecklistItemWidget:
+        """Create the item widget and the list of children for a freshly inserted row of the list."""
+        item_widget = ChecklistItemWidget(None, item)
+        item_widget.setListWidgetItem(list_item)
+        list_item.setData(QtCore.Qt.UserRole, item_widget)
+        self.ui.items.setItemWidget(list_item, item_widget)
+        item_widget.contentChanged.connect(self._item_changed)
+        item_widget.checkChanged.connect(lambda item: self.checkChanged.emit(item))
+        item_widget.textEdited.connect(lambda text: self.command.emit(TextChange(self.top(), item, text)))
+        item_widget.checkToggled.connect(lambda checked: self.command.emit(CheckChange(self.top(), item, checked)))
+        item_widget.delete.connect(self.delete)
+        item_widget.cascade.connect(self.add)
+
+        # Recursively add children items to the children stack.
+        list_widget = ChecklistWidget(self.ui.children, self)
+        list_widget.set_item_model(item)
+        list_widget.contentChanged.connect(lambda: self.contentChanged.emit())
+        list_widget.checkChanged.connect(lambda item: self.checkChanged.emit(item))
+        list_widget.itemSelected.connect(lambda item: self.itemSelected.emit(item))
+        list_widget.command.connect(lambda command: self.command.emit(command))
+        list_item.setData(CHILD_LIST_ROLE, list_widget)
+        self.ui.children.addWidget(list_widget)
+
+        size_policy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        size_policy.setHorizontalStretch(item.level)
+        list_widget.setSizePolicy(size_policy)
+
+        return item_widget
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def delete(self, widget: ChecklistItemWidget = None):
+        """Fires to delete the currently selected item from the list, as an undoable command."""
+        if widget is None:
+            selected = self.ui.items.selectedIndexes()
+            if not selected:
+                return
+            row = selected[0].row()
+        else:
+            row = self.ui.items.row(widget.listWidgetItem())
+        self.command.emit(Delete(self.top(), self._list, row))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def remove_row(self, row: int) -> None:
+        """Remove the widgets for the specified row, without touching the model."""
+        child = self._child_list(row)
+        self.ui.children.removeWidget(child)
+        child.deleteLater()
+        self.ui.items.takeItem(row)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def dispose(self) -> None:
+        """Release the rows of this list, and of all of the child lists, ahead of the list being deleted.
+
+        The widgets of each row are stored in the data of the list entries, where Qt keeps them alive outside of the
+        reach of the garbage collector, and the replaced drop handler refers back to this list.  Both are let go of here
+        so that nothing from the tree outlives the tab it was shown in.  Disposing of a list more than once is harmless.
+        """
+        for row in range(self.ui.items.count()):
+            list_item = self.ui.items.item(row)
+            list_item.data(CHILD_LIST_ROLE).dispose()
+            list_item.data(QtCore.Qt.UserRole).setListWidgetItem(None)
+        self.ui.items.clear()
+        if 'dropEvent' in vars(self.ui.items):
+            del self.ui.items.dropEvent
+        self._parent_widget = None
+        self._list = None
+
+
+
+
+# End of File
@@ -0,0 +1,226 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/cache.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""On-disk cache of parsed documents, so that reopening an unchanged file can skip parsing it.
+
+Entries are keyed by the absolute path of the source file and are only used while the size, modification time and a
+hash of the content of the file still match what was recorded with them.  Anything that can't be read back - a stale,
+truncated or otherwise corrupt entry - is treated as a miss and removed.  The total size of the cache is capped, with the
+least recently used entries evicted first.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import hashlib
+import logging
+import marshal
+import tempfile
+from functools import lru_cache
+from typing import Any
+
+
+
+
+# ======================================================================================================================
+# Constants
+# ----------------------------------------------------------------------------------------------------------------------
+# Bump this whenever the layout of the cached data changes so that old entries are ignored rather than misread.
+VERSION = 2
+
+SUFFIX = '.cache'
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def user_cache_dir() -> str:
+    """Return the conventional per-user cache directory for Bine on this platform."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        return os.path.join(base, 'bine', 'cache')
+    if sys.platform == 'darwin':
+        return os.path.expanduser(os.path.join('~', 'Library', 'Caches', 'bine'))
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'bine')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def digest(content: str) -> bytes:
+    """Hash the content of a document for comparison against the hash stored with its cache entry."""
+    return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+
+
+# ======================================================================================================================
+# Document Cache Class
+# ----------------------------------------------------------------------------------------------------------------------
+class DocumentCache:
+    """A directory of cached, parsed documents with a cap on its total size.
+
+    The cache only stores and validates opaque values, it's up to the caller to decide what the parsed form of a
+    document looks like.  Values must be made from the types supported by the marshal module.
+
+    Attributes:
+        directory: The folder in which the entries are kept, created when the first entry is stored.
+        limit: Maximum combined size, in bytes, of the entries before the least recently used are evicted.
+    """
+
+    def __init__(self, directory: str = None, limit: int = 64 * 1024 * 1024):
+        self.directory = directory or user_cache_dir()
+        self.limit = limit
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _entry(self, filename: str) -> str:
+        name = hashlib.blake2b(os.path.normcase(os.path.abspath(filename)).encode('utf-8', 'surrogatepass'),
+                               digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + SUFFIX)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _discard(self, entry: str) -> None:
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def get(self, filename: str, content: str) -> Any:
+        """Look up the cached value for a file.
+
+        Arguments:
+            filename: The path of the source file.
+            content: The text that was just read from the file, which must match the text the value was stored with.
+
+        Returns:
+            The cached value or None if there is no valid entry for the file as it is now.
+        """
+        entry = self._entry(filename)
+        try:
+            stat = os.stat(filename)
+            with open(entry, 'rb') as handle:
+                version, path, size, mtime, hashed, value = marshal.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or corrupt entries are as good as missing, clear them out so that they get replaced.
+            logging.debug('Discarding unreadable cache entry for %s', filename, exc_info=True)
+            self._discard(entry)
+            return None
+
+        if (version, path, size, mtime) != (VERSION, os.path.abspath(filename), stat.st_size, stat.st_mtime_ns):
+            return None
+        if hashed != digest(content):
+            return None
+
+        # Touch the entry to mark it as recently used for the purposes of eviction.
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return value
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def put(self, filename: str, content: str, value: Any) -> None:
+        """Store the value for a file in the cache, evicting old entries if the cache has grown too large.
+
+        Failures to write are logged and otherwise ignored - the cache is only ever an optimization.
+
+        Arguments:
+            filename: The path of the source file.
+            content: The text that was read from the file to produce the value.
+            value: The parsed form of the file to be returned by get while the file remains unchanged.
+        """
+        entry = self._entry(filename)
+        try:
+            stat = os.stat(filename)
+            data = marshal.dumps((VERSION, os.path.abspath(filename), stat.st_size, stat.st_mtime_ns, digest(content),
+                                  value))
+            if len(data) > self.limit:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+
+            # Write to a temporary file first so that readers never see a partially written entry.
+            handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            try:
+                with os.fdopen(handle, 'wb') as output:
+                    output.write(data)
+                os.replace(temporary, entry)
+            except BaseException:
+                self._discard(temporary)
+                raise
+        except Exception:
+            logging.warning('Unable to cache %s', filename, exc_info=True)
+            return
+
+        self.evict()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits within its size limit."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for item in scan:
+                    if item.name.endswith(SUFFIX):
+                        stat = item.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.limit:
+                break
+            self._discard(path)
+            total -= size
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        limit, self.limit = self.limit, 0
+        self.evict()
+        self.limit = limit
+
+
+
+
+# ======================================================================================================================
+# Shared Instance
+# ----------------------------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def document_cache() -> DocumentCache:
+    """Return the cache in the user's cache directory, shared by everything in this process."""
+    return DocumentCache()
+
+
+
+
+# End of File
@@ -0,0 +1,156 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/compare.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Aligns the items of two checklists, side by side, to show what one has that the other doesn't.
+
+Items are matched by their text amongst the children of items that were themselves matched, using a lookup of the texts
+on one side rather than comparing every pair, so the alignment takes time in proportion to the number of items.  Whole
+subtrees with the same digest are identical and are lined up without matching at all.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+from bine.libraries import instrument
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Aligned Row Class
+# ----------------------------------------------------------------------------------------------------------------------
+@dataclass
+class Row:
+    """A single line of the comparison, with the item from either side that it shows.
+
+    Attributes:
+        left: The item from the left checklist, or None when the item was added on the right.
+        right: The item from the right checklist, or None when the item was removed from the left.
+        level: How deeply the row is nested, zero for the top level items.
+        status: One of "same", "added", "removed" or "changed" - when the check state differs between the two sides.
+        differs: True when this row, or any of the rows below it, is not the same on both sides.
+    """
+    left: ItemModel
+    right: ItemModel
+    level: int
+    status: str
+    differs: bool
+
+
+
+
+# ======================================================================================================================
+# Alignment
+# ----------------------------------------------------------------------------------------------------------------------
+def pair(old: List[ItemModel], new: List[ItemModel]) -> Iterator[Tuple[ItemModel, ItemModel]]:
+    """Match up two lists of sibling items by their text, generating the pairs in the order they are to be shown.
+
+    The pairs follow the order of the new items.  Items only in the old list are shown just before the next item that
+    followed them in the old list, or at the end.  Repeated texts are matched in order.
+
+    Yields:
+        A tuple of the old and new items, either of which is None when the item is only on the other side.
+    """
+    positions: Dict[str, List[int]] = {}
+    for index, item in enumerate(old):
+        positions.setdefault(item.text, []).append(index)
+    for indexes in positions.values():
+        indexes.reverse()
+
+    matches = []
+    used = [False] * len(old)
+    for item in new:
+        indexes = positions.get(item.text)
+        index = indexes.pop() if indexes else None
+        if index is not None:
+            used[index] = True
+        matches.append(index)
+
+    following = 0
+    for item, index in zip(new, matches):
+        if index is not None:
+            # Show the items that were removed from before this one first, so they stay near their old neighbours.
+            while following < index:
+                if not used[following]:
+                    yield old[following], None
+                following += 1
+            following = max(following, index + 1)
+            yield old[index], item
+        else:
+            yield None, item
+    for index in range(following, len(old)):
+        if not used[index]:
+            yield old[index], None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@instrument.timed('compare.align')
+def align(left: ItemModel, right: ItemModel) -> List[Row]:
+    """Line up the descendants of two items, depth first, so that each row shows an item and its counterpart.
+
+    Arguments:
+        left: The root of the first checklist.
+        right: The root of the second checklist.
+
+    Returns:
+        The rows in the order that they are to be shown, each followed by the rows of its children.
+    """
+    rows = []
+
+    # The iterator of the pairs still to come at each level, along with the index of the row that they are under.
+    stack = [(iter(pair(left.children, right.children)), None)]
+    while stack:
+        pairs, parent = stack[-1]
+        try:
+            old, new = next(pairs)
+        except StopIteration:
+            # A row differs if any row below it does, which is only known once all of those rows have been seen.
+            stack.pop()
+            if parent is not None and rows[parent].differs and stack and stack[-1][1] is not None:
+                rows[stack[-1][1]].differs = True
+            continue
+
+        level = len(stack) - 1
+        if old is not None and new is not None:
+            # Only the check state shown matters, the state stored for a branch may well differ from that of its
+            # children, so the digests can't decide this.
+            status = 'same' if old.checked == new.checked else 'changed'
+            rows.append(Row(old, new, level, status, status != 'same'))
+            if old.digest == new.digest:
+                # Identical all of the way down, the children line up exactly as they are.
+                children = iter(zip(old.children, new.children))
+            else:
+                children = pair(old.children, new.children)
+        elif old is not None:
+            rows.append(Row(old, None, level, 'removed', True))
+            children = ((child, None) for child in old.children)
+        else:
+            rows.append(Row(None, new, level, 'added', True))
+            children = ((None, child) for child in new.children)
+        stack.append((children, len(rows) - 1))
+    return rows
+
+
+
+
+# End of File
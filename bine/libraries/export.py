@@ -0,0 +1,155 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/export.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Export of documents to standalone, themed HTML pages.
+
+The page is written to the file as the item tree is rendered rather than being built up in memory first.  Nothing in
+here depends upon Qt so that many documents can be exported at once, headless, from worker processes, as done by
+the export command of bine.cli:
+
+    bine export -o html -t slate lists/*.md
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Iterator, List, TextIO, Tuple
+
+from bine.model.document import DocumentModel
+
+
+
+
+# ======================================================================================================================
+# Constants
+# ----------------------------------------------------------------------------------------------------------------------
+ASSETS = os.path.join(os.path.dirname(__file__), '..', 'assets')
+
+THEMES = ['white', 'slate']
+
+
+
+
+# ======================================================================================================================
+# Page Template
+# ----------------------------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _asset(folder: str, filename: str) -> str:
+    """Read one of the theme assets, only once per process."""
+    with open(os.path.join(ASSETS, folder, filename), 'r', encoding='utf-8') as handle:
+        return handle.read()
+
+
+@lru_cache(maxsize=None)
+def _page(theme: str) -> Tuple[str, str]:
+    """Return the parts of the page that go before and after the document for the named theme."""
+    header = f"""<html>
+    <head>
+        <style type="text/css">{_asset('css', 'main.min.css')}</style>
+        <style type="text/css">{_asset('css', 'palette.min.css')}</style>
+        <script types="text/javascript">{_asset('js', 'palette.min.js')}</script>
+    </head>
+    <body dir="ltr" data-md-color-scheme="{theme}">
+        <div class="md-container">
+            <main class="md-main">
+                <div class="md-main__inner md-grid">
+                    <div class="md-content">
+                        <article class="md-content__inner md-typeset">
+                           """
+    footer = """
+                        </article>
+                    </div>
+                </div>
+            </main>
+        </div>
+    </body>
+</html>"""
+    return header, footer
+
+
+
+
+# ======================================================================================================================
+# Export Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def write_html(document: DocumentModel, handle: TextIO, theme: str) -> None:
+    """Write the document to the open file as a complete HTML page.
+
+    Arguments:
+        document: The document to be exported.
+        handle: An open, writable text file.
+        theme: The name of the css theme to use in the generated HTML document ('white' or 'slate').
+    """
+    header, footer = _page(theme)
+    handle.write(header)
+    for chunk in document.iter_html():
+        handle.write(chunk)
+    handle.write(footer)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def export_file(source: str, destination: str, theme: str) -> str:
+    """Load a document from file and export it to an HTML file.
+
+    Returns:
+        The destination filename, for reporting by the caller.
+    """
+    document = DocumentModel()
+    document.load(source)
+    with open(destination, 'w', encoding='utf-8') as handle:
+        write_html(document, handle, theme)
+    return destination
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def batch_export(sources: List[str],
+                 output: str = None,
+                 theme: str = 'white',
+                 jobs: int = None) -> Iterator[Tuple[str, str, Exception]]:
+    """Export many documents in parallel worker processes.
+
+    Arguments:
+        sources: The Markdown files to be exported.
+        output: The folder to write the HTML files into.  If not provided then each HTML file is written alongside its
+            source file.
+        theme: The name of the css theme to use in the generated HTML documents.
+        jobs: The number of worker processes, defaulting to one per CPU.
+
+    Yields:
+        A tuple of the source filename, the destination filename and the exception raised, if any, as each file
+        finishes - which may not be in the order they were provided.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for source in sources:
+            name = os.path.splitext(os.path.basename(source))[0] + '.html'
+            destination = os.path.join(output or os.path.dirname(source), name)
+            futures[executor.submit(export_file, source, destination, theme)] = (source, destination)
+
+        for future in as_completed(futures):
+            source, destination = futures[future]
+            yield source, destination, future.exception()
+
+
+
+
+# End of File
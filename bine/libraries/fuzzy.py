@@ -0,0 +1,220 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/fuzzy.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Fuzzy text matching used to quickly locate items by loosely typed text.
+
+Queries are split into words and each word must match the candidate text as a subsequence, in any order, so that
+"socks wool" will find "Wool socks".  Word scores are memoized because the same words get re-scored against the same
+texts with every keystroke.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Tuple
+
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Scoring
+# ----------------------------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=65536)
+def score_word(word: str, text: str) -> int:
+    """Score a single (casefolded) query word against a (casefolded) candidate text.
+
+    Returns:
+        Zero when the word does not match the text at all, otherwise a positive score where higher is better.
+    """
+    # Substring matches are the strongest - more so when they land at the start of a word.
+    index = text.find(word)
+    if index >= 0:
+        score = 100 + len(word) * 4
+        if index == 0 or not text[index - 1].isalnum():
+            score += 50
+        return score
+
+    # Otherwise fall back on a subsequence match, rewarding runs of consecutive characters and word starts.
+    score = 0
+    position = 0
+    previous = -2
+    for char in word:
+        index = text.find(char, position)
+        if index < 0:
+            return 0
+        score += 1
+        if index == previous + 1:
+            score += 2
+        if index == 0 or not text[index - 1].isalnum():
+            score += 3
+        previous = index
+        position = index + 1
+    return score
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def score(words: Tuple[str, ...], text: str) -> int:
+    """Score all of the words of a query against the provided text, or return zero if any word fails to match."""
+    total = 0
+    for word in words:
+        result = score_word(word, text)
+        if not result:
+            return 0
+        total += result
+
+    # Prefer shorter candidates when everything else is equal, they are more likely to be what was typed.
+    return total * 1000 - len(text)
+
+
+
+
+# ======================================================================================================================
+# Index Entry Class
+# ----------------------------------------------------------------------------------------------------------------------
+@dataclass
+class Entry:
+    """A single searchable item from a document.
+
+    Attributes:
+        text: The text of the item as displayed to the user.
+        context: Breadcrumb text of the parents of the item, for display along with the text.
+        source: An opaque object identifying where the item lives (an open tab or a filename).
+        path: The row of the item and each of its parents, starting from the root, for locating it again later.
+        item: The ItemModel from an open document, if it is available, or None for unopened files.
+    """
+    text: str
+    context: str
+    source: Any
+    path: Tuple[int, ...]
+    item: ItemModel = None
+
+    def __post_init__(self):
+        self.folded = self.text.casefold()
+
+
+
+
+# ======================================================================================================================
+# Indexing
+# ----------------------------------------------------------------------------------------------------------------------
+class Snapshot(NamedTuple):
+    """The parts of a single item that are needed to index it, copied out of the tree."""
+    text: str
+    context: str
+    path: Tuple[int, ...]
+    item: ItemModel
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def snapshot(root: ItemModel, keep_items: bool = True) -> List[Snapshot]:
+    """Walk the tree under root once and copy out the text and location of every item.
+
+    This is the only part of indexing that reads the tree, so that the rest can be left to a worker thread while the
+    tree carries on changing in the GUI thread.
+
+    Arguments:
+        root: The root ItemModel of the document to be indexed.
+        keep_items: When True the ItemModels will be referenced from the snapshot, otherwise only paths are kept.
+    """
+    items = []
+    stack = [(root, (), '')]
+    while stack:
+        parent, path, context = stack.pop()
+        for row, child in enumerate(parent.children):
+            child_path = path + (row,)
+            items.append(Snapshot(child.text, context, child_path, child if keep_items else None))
+            if child.children:
+                child_context = f'{context} > {child.text}' if context else child.text
+                stack.append((child, child_path, child_context))
+    return items
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def build_index(items: List[Snapshot], source: Any) -> List[Entry]:
+    """Generate a flat list of searchable entries from a snapshot of a document.
+
+    Arguments:
+        items: The snapshot of the document to be indexed, from snapshot.
+        source: Opaque identifier attached to each entry so that the caller can tell where it came from.
+    """
+    return [Entry(item.text, item.context, source, item.path, item.item) for item in items]
+
+
+
+
+# ======================================================================================================================
+# Matcher Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Matcher:
+    """Ranks index entries against a query, narrowing the previous results when the user keeps typing."""
+
+    def __init__(self):
+        self._entries: List[Entry] = []
+        self._query: Tuple[str, ...] = None
+        self._matches: List[Entry] = []
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def set_entries(self, entries: List[Entry]) -> None:
+        """Replace the entries to be searched and drop the narrowing state that was based on the old entries."""
+        self._entries = entries
+        self._query = None
+        self._matches = []
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def search(self, query: str, limit: int = 100) -> List[Entry]:
+        """Return up to limit entries that match the provided query, best matches first."""
+        words = tuple(query.casefold().split())
+        if not words:
+            self._query = None
+            return self._entries[:limit]
+
+        # When the new query only adds to the last one then only the last set of matches can possibly match.
+        candidates = self._entries
+        if self._query is not None and self._refines(words):
+            candidates = self._matches
+
+        scored = []
+        for entry in candidates:
+            result = score(words, entry.folded)
+            if result:
+                scored.append((result, entry))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+
+        self._query = words
+        self._matches = [entry for _, entry in scored]
+        return self._matches[:limit]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _refines(self, words: Tuple[str, ...]) -> bool:
+        """Determine if the words of a new query are strictly narrower than the previous query."""
+        if len(words) < len(self._query):
+            return False
+        return all(new.startswith(old) for old, new in zip(self._query, words))
+
+
+
+
+# End of File
@@ -0,0 +1,213 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/instrument.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Lightweight timing spans and counters for finding out where the time goes.
+
+Instrumentation is off by default and costs no more than a flag check per call while it is off.  Once enabled, every
+span is recorded so that the results can be dumped as a JSON summary or as a Chrome trace (load it at
+chrome://tracing or https://ui.perfetto.dev):
+
+    @instrument.timed('DocumentModel.load')
+    def load(self, filename):
+        ...
+
+    with instrument.span('build index'):
+        ...
+
+    instrument.count('ItemModel.progress.recompute')
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import json
+import threading
+from collections import Counter
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, List, TextIO, Tuple
+
+
+
+
+# ======================================================================================================================
+# State
+# ----------------------------------------------------------------------------------------------------------------------
+# Individual spans are kept for the Chrome trace, up to a limit, the summary statistics are always kept.
+MAX_EVENTS = 1000000
+
+_enabled = False
+_origin = perf_counter()
+_events: List[Tuple[str, float, float, int]] = []
+_stats: Dict[str, List[float]] = {}
+_counters: Counter = Counter()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def enable(enabled: bool = True) -> None:
+    """Turn recording of spans and counters on or off."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """Discard everything that has been recorded so far."""
+    global _origin
+    _origin = perf_counter()
+    _events.clear()
+    _stats.clear()
+    _counters.clear()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def _record(name: str, start: float, end: float) -> None:
+    duration = end - start
+    stats = _stats.get(name)
+    if stats is None:
+        _stats[name] = [1, duration, duration, duration]
+    else:
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = min(stats[2], duration)
+        stats[3] = max(stats[3], duration)
+    if len(_events) < MAX_EVENTS:
+        _events.append((name, start, duration, threading.get_ident()))
+
+
+
+
+# ======================================================================================================================
+# Spans and Counters
+# ----------------------------------------------------------------------------------------------------------------------
+class _Span:
+    """Context manager timing the code within it."""
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        _record(self.name, self.start, perf_counter())
+
+
+class _NullSpan:
+    """Stand-in for a span when instrumentation is disabled."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """Time the code within a with statement under the provided name."""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def timed(name: str = None) -> Callable:
+    """Decorator timing every call to a function as a span, named after the function unless a name is provided."""
+    def decorator(function: Callable) -> Callable:
+        label = name or function.__qualname__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _record(label, start, perf_counter())
+        return wrapper
+    return decorator
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def count(name: str, value: int = 1) -> None:
+    """Add to a named counter."""
+    if _enabled:
+        _counters[name] += value
+
+
+
+
+# ======================================================================================================================
+# Output
+# ----------------------------------------------------------------------------------------------------------------------
+def summary() -> dict:
+    """Return the number of calls and timings, in milliseconds, of each span along with the counters."""
+    spans = {}
+    for name, (calls, total, shortest, longest) in sorted(_stats.items(), key=lambda pair: -pair[1][1]):
+        spans[name] = {
+            'calls': calls,
+            'total_ms': round(total * 1000, 3),
+            'mean_ms': round(total * 1000 / calls, 3),
+            'min_ms': round(shortest * 1000, 3),
+            'max_ms': round(longest * 1000, 3)
+        }
+    return {'spans': spans, 'counters': dict(_counters)}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def dump_json(handle: TextIO) -> None:
+    json.dump(summary(), handle, indent=2)
+
+
+def dump_chrome(handle: TextIO) -> None:
+    """Write the recorded spans in the Chrome trace event format."""
+    pid = os.getpid()
+    events = [{
+        'name': name,
+        'ph': 'X',
+        'ts': round((start - _origin) * 1e6, 1),
+        'dur': round(duration * 1e6, 1),
+        'pid': pid,
+        'tid': tid
+    } for name, start, duration, tid in _events]
+    now = round((perf_counter() - _origin) * 1e6, 1)
+    events.extend({'name': name, 'ph': 'C', 'ts': now, 'pid': pid, 'args': {'value': value}}
+                  for name, value in _counters.items())
+    json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, handle)
+
+
+def dump(filename: str, format: str = 'json') -> None:
+    """Write the results to a file, either as a JSON summary ('json') or as a Chrome trace ('chrome')."""
+    with open(filename, 'w', encoding='utf-8') as handle:
+        if format == 'chrome':
+            dump_chrome(handle)
+        else:
+            dump_json(handle)
+
+
+
+
+# End of File
@@ -0,0 +1,399 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/journal.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Crash recovery journal of the changes made to an open document since it was last saved.
+
+Each change made to the tree of a document is recorded as a line of JSON as it happens and the lines are appended to the
+journal file, in batches, whenever the owner flushes the journal.  Once enough changes have piled up the journal is
+compacted into a snapshot of the document.  After a crash the snapshot, and the changes recorded after it, are replayed
+on top of the file to recover the unsaved changes.
+
+Every journal starts with a hash of the text of the file that it applies to.  If the file has since changed then the
+journal no longer applies and is ignored.  Documents that have yet to be saved get a journal too, under a generated
+name, so that they can be offered for recovery when Bine next starts.
+
+Journals are the only copy of the unsaved changes, so they are kept with Bine's state rather than in the cache, which
+may be cleared at any time.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import uuid
+import logging
+from typing import Any, List, Tuple
+
+from bine.libraries import instrument
+from bine.libraries.cache import digest
+from bine.model.document import DocumentModel
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Constants
+# ----------------------------------------------------------------------------------------------------------------------
+# Bump this whenever the layout of the journal changes so that old journals are ignored rather than misread.
+VERSION = 1
+
+SUFFIX = '.journal'
+
+# Prefix of the journals of the documents that have yet to be saved, which are named rather than found by filename.
+UNTITLED = 'untitled-'
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def user_state_dir() -> str:
+    """Return the conventional per-user directory for the state that Bine needs to keep between sessions."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        return os.path.join(base, 'bine')
+    if sys.platform == 'darwin':
+        return os.path.expanduser(os.path.join('~', 'Library', 'Application Support', 'bine'))
+    base = os.environ.get('XDG_STATE_HOME') or os.path.expanduser(os.path.join('~', '.local', 'state'))
+    return os.path.join(base, 'bine')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def journal_dir() -> str:
+    """Return the folder in which the journals of the open documents are kept."""
+    return os.path.join(user_state_dir(), 'journal')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def untitled(directory: str = None) -> List[str]:
+    """Return the names of the journals left behind by documents that were never saved, oldest first."""
+    directory = directory or journal_dir()
+    try:
+        filenames = [entry for entry in os.scandir(directory) if entry.name.startswith(UNTITLED)]
+    except OSError:
+        return []
+    filenames = [entry for entry in filenames if entry.name.endswith(SUFFIX) and entry.is_file()]
+    filenames.sort(key=lambda entry: entry.stat().st_mtime)
+    return [entry.name[len(UNTITLED):-len(SUFFIX)] for entry in filenames]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def pack(item: ItemModel) -> list:
+    """Convert an item, and its children, into nested lists of the text, stored check state and children."""
+    return [item.text, item._checked, [pack(child) for child in item.children]]
+
+
+def unpack(packed: list) -> ItemModel:
+    """Rebuild an item, and its children, from the nested lists made by pack.
+
+    The item is left without a parent, it must be inserted into a parent only once it's complete so that the counts of
+    the parents aren't updated for children that they don't have yet.
+    """
+    text, checked, children = packed
+    item = ItemModel(None, text, checked)
+    for child in children:
+        item.append(unpack(child))
+    return item
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def find(root: ItemModel, path: List[int]) -> ItemModel:
+    """Return the item found by following the provided rows down from the root."""
+    item = root
+    for row in path:
+        item = item.children[row]
+    return item
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def replay(document: DocumentModel, change: list) -> None:
+    """Make a change, as recorded in a journal, to the provided document."""
+    action = change[0]
+    if action == 'title':
+        document.title = change[1]
+    elif action == 'description':
+        document.description = change[1]
+    elif action == 'text':
+        find(document.root, change[1]).text = change[2]
+    elif action == 'check':
+        find(document.root, change[1]).checked = change[2]
+    elif action == 'insert':
+        find(document.root, change[1]).insert(change[2], unpack(change[3]))
+    elif action == 'remove':
+        find(document.root, change[1]).take(change[2])
+    elif action == 'move':
+        # The destination was recorded as it was found after the move, once the item had been taken from its source.
+        child = find(document.root, change[1]).take(change[2])
+        find(document.root, change[3]).insert(change[4], child)
+    elif action == 'sort':
+        find(document.root, change[1]).sort()
+    else:
+        raise ValueError(f'Unknown change "{action}" in journal.')
+
+
+
+
+# ======================================================================================================================
+# Journal Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Journal:
+    """The journal of the unsaved changes made to a single document.
+
+    Attributes:
+        filename: The absolute path of the file that the document was loaded from, or None for an untitled document.
+        name: The generated name of the journal of an untitled document, or None for a document with a file.
+        document: The document whose changes are recorded.
+        path: The journal file.
+    """
+
+    # Number of changes after which the journal is compacted into a snapshot of the document.
+    COMPACT = 1000
+
+    def __init__(self, filename: str, document: DocumentModel, directory: str = None, name: str = None):
+        """
+        Arguments:
+            filename: The file that the document was loaded from, or None for a document that has yet to be saved.
+            document: The document whose changes are to be recorded.
+            directory: The folder for the journal, defaulting to journal_dir.
+            name: For untitled documents, the name of an existing journal, from untitled, to be picked up again.  A new
+                name is generated if not provided.
+        """
+        self.document = document
+        directory = directory or journal_dir()
+        if filename is None:
+            self.filename = None
+            self.name = name or uuid.uuid4().hex
+            self.path = os.path.join(directory, UNTITLED + self.name + SUFFIX)
+        else:
+            self.filename = os.path.abspath(filename)
+            self.name = None
+            self.path = os.path.join(directory, digest(os.path.normcase(self.filename)).hex() + SUFFIX)
+        self._lines: List[str] = []
+        self._changes = 0
+        self._handle = None
+
+        # The lines that the journal file is to start with while it has yet to be written, see reset.
+        self._pending: List[str] = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def read(self) -> List[Any]:
+        """Return the snapshot and changes left in the journal by an earlier session that ended without saving them.
+
+        Returns:
+            The entries of the journal, for recover, or an empty list if there is no journal for the document as it was
+            loaded from the file.
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                lines = handle.read().split('\n')
+        except FileNotFoundError:
+            return []
+        except OSError:
+            logging.warning('Unable to read journal %s', self.path, exc_info=True)
+            return []
+
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return []
+        expected = {'version': VERSION, 'file': self.filename, 'base': digest(self.document.saved_text).hex()}
+        if header != expected:
+            return []
+
+        entries = []
+        for line in lines[1:]:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break  # The last line may have been cut short by the crash, there's nothing valid after it.
+        return entries
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('Journal.recover')
+    def recover(self, entries: List[Any]) -> None:
+        """Replay the entries read from the journal onto the document, as it was loaded from the file."""
+        try:
+            for entry in entries:
+                if isinstance(entry, dict):
+                    self._restore(entry)
+                else:
+                    replay(self.document, entry)
+        except (LookupError, TypeError, ValueError):
+            # Recover as much as possible, everything up to the first change that doesn't fit is kept.
+            logging.warning('Unable to replay all of journal %s', self.path, exc_info=True)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _restore(self, snapshot: dict) -> None:
+        """Bring the document in line with a snapshot, changing only the items that differ so the rest keep their
+        formatting from the file.
+        """
+        self.document.title = snapshot['title']
+        self.document.description = snapshot['description']
+        root = ItemModel()
+        for packed in snapshot['items']:
+            root.append(unpack(packed))
+        for edit in self.document.root.diff(root):
+            edit.parent.apply(edit)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def start(self) -> None:
+        """Start the journal over from the document as it is now and begin recording the changes made to it."""
+        self.reset()
+        self.document.root.observer = self.record
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def stop(self) -> None:
+        """Stop recording changes, such as while the document is replaced wholesale by a merge."""
+        self.document.root.observer = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def record(self, change: Tuple) -> None:
+        """Add a change to the journal, in the form passed to the observer of the root item.  The change isn't written
+        to disk until the next flush.
+        """
+        if change[0] == 'insert':
+            change = change[:3] + (pack(change[3]),)
+        self._lines.append(json.dumps(change, ensure_ascii=False, separators=(',', ':')))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('Journal.flush')
+    def flush(self) -> None:
+        """Append the changes recorded since the last flush to the journal and make sure that they're on disk."""
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        try:
+            if self._pending is not None:
+                self._replace([self._header()] + self._pending + lines)
+                self._pending = None
+            else:
+                if self._handle is None:
+                    self._handle = open(self.path, 'a', encoding='utf-8')
+                self._handle.write('\n'.join(lines) + '\n')
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+        except OSError:
+            logging.warning('Unable to write to journal %s', self.path, exc_info=True)
+            return
+
+        self._changes += len(lines)
+        if self._changes >= self.COMPACT:
+            instrument.count('Journal.compact')
+            self.reset()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def reset(self) -> None:
+        """Start the journal over from the file as last loaded or saved, with a snapshot of the document if it has
+        changed since.
+
+        An unchanged document has nothing to recover, so any old journal is removed and the new one isn't written until
+        the first changes are flushed.  Opening a file costs nothing on disk until it's edited.
+        """
+        # Anything not yet flushed is part of the snapshot now.
+        self._lines = []
+        self._changes = 0
+        self._close_handle()
+
+        if not self._modified():
+            self._pending = []
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logging.warning('Unable to remove journal %s', self.path, exc_info=True)
+            return
+
+        snapshot = {
+            'title': self.document.title,
+            'description': self.document.description,
+            'items': [pack(child) for child in self.document.root.children]
+        }
+        lines = [json.dumps(snapshot, ensure_ascii=False, separators=(',', ':'))]
+        try:
+            self._replace([self._header()] + lines)
+            self._pending = None
+        except OSError:
+            # The snapshot is tried again along with the next changes.
+            logging.warning('Unable to write journal %s', self.path, exc_info=True)
+            self._pending = lines
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _header(self) -> str:
+        """Return the first line of the journal, identifying the file as last loaded or saved."""
+        return json.dumps({'version': VERSION, 'file': self.filename, 'base': digest(self.document.saved_text).hex()})
+
+
+    def _replace(self, lines: List[str]) -> None:
+        """Replace the journal file with the provided lines, only once they're safely on disk."""
+        temporary = self.path + '.tmp'
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            handle.write('\n'.join(lines) + '\n')
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.path)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _modified(self) -> bool:
+        """Determine if the document has changes worth recovering.
+
+        An untitled document has no file to compare against, only changes from a new, empty, document count.
+        """
+        if self.filename is None:
+            return self.document.dumps() != DocumentModel().dumps()
+        return self.document.dirty()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def close(self) -> None:
+        """Stop recording and remove the journal, for when the document is closed with nothing left to recover."""
+        self.stop()
+        self._lines = []
+        self._close_handle()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+
+
+# End of File
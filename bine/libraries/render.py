@@ -0,0 +1,109 @@
+# ======================================================================================================================
+#      File:  /bine/libraries/render.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Renders documents to HTML directly from the item tree.
+
+Only free-form Markdown, like the description, is handed to Python-Markdown.  Checklists are written out as nested task
+lists in a single pass, matching the output of the `pymdownx.tasklist` extension.
+"""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import re
+import html
+from functools import lru_cache
+from typing import Iterator
+
+from bine.model.item import ItemModel
+
+
+
+
+# ======================================================================================================================
+# Markdown
+# ----------------------------------------------------------------------------------------------------------------------
+EXTENSIONS = [
+    'admonition',
+    'codehilite',
+    'extra',
+    'pymdownx.tasklist'
+]
+
+# Characters that may start inline Markdown (or HTML) in the text of an item.  Text without any of these is escaped
+# rather than sent through Markdown.
+INLINE_MARKUP = re.compile(r'[\\`*_\[!<&~]')
+
+_markdown = None
+
+
+def render_markdown(text: str) -> str:
+    """Convert a block of Markdown text into HTML.
+
+    Markdown, and its extensions, are only imported the first time that something needs to be rendered with them.
+    """
+    global _markdown
+    if _markdown is None:
+        import markdown
+        _markdown = markdown.Markdown(extensions=EXTENSIONS)
+    return _markdown.reset().convert(text)
+
+
+@lru_cache(maxsize=4096)
+def render_inline(text: str) -> str:
+    """Convert a single line of text, such as the text of an item, into inline HTML."""
+    if not INLINE_MARKUP.search(text):
+        return html.escape(text, quote=False)
+    rendered = render_markdown(text)
+    if rendered.startswith('<p>') and rendered.endswith('</p>'):
+        rendered = rendered[3:-4]
+    return rendered
+
+
+
+
+# ======================================================================================================================
+# Checklists
+# ----------------------------------------------------------------------------------------------------------------------
+def render_items(parent: ItemModel) -> Iterator[str]:
+    """Generate the HTML for the children of the provided item as nested task lists, one chunk at a time."""
+    if not parent.children:
+        return
+
+    yield '<ul class="task-list">\n'
+    stack = [iter(parent.children)]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            yield '</ul>\n</li>\n' if stack else '</ul>\n'
+            continue
+
+        checked = ' checked' if item.checked else ''
+        text = render_inline(item.text)
+        if item.children:
+            yield f'<li class="task-list-item"><input type="checkbox" disabled{checked}/> {text}:<ul class="task-list">\n'
+            stack.append(iter(item.children))
+        else:
+            yield f'<li class="task-list-item"><input type="checkbox" disabled{checked}/> {text}</li>\n'
+
+
+
+
+# End of File
@@ -1,223 +1,223 @@
-# ======================================================================================================================
-#      File:  /bine/libraries/undo/item.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""Undo support for tree options."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-from PySide6 import QtCore, QtGui, QtWidgets
-
-from bine.model.item import ItemModel
-
-
-
-
-# ======================================================================================================================
-# Item Text Command
-# ----------------------------------------------------------------------------------------------------------------------
-class TextChange(QtGui.QUndoCommand):
-    """Supports undo/redo for a single item text."""
-    def __init__(self, widget: QtWidgets.QWidget, text: str):
-        super().__init__(f'change "{widget.item().text}" to "{text}"')
-        self._widget = widget
-        self._before = widget.item().text
-        self._after = text
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def redo(self):
-        self._widget.setText(self._after)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def undo(self):
-        self._widget.setText(self._before)
-
-
-
-
-# ======================================================================================================================
-# Item Check State Command
-# ----------------------------------------------------------------------------------------------------------------------
-class CheckChange(QtGui.QUndoCommand):
-    """Supports undo/redo for a single item checkbox state."""
-    def __init__(self, widget: QtWidgets.QWidget, checked: bool):
-        super().__init__(f"{'' if checked else 'un'}check \"{widget.item().text}\"")
-        self._widget = widget
-        self._before = widget.item().checked
-        self._after = checked
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def redo(self):
-        self._widget.setChecked(self._after)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def undo(self):
-        self._widget.setChecked(self._before)
-
-
-
-
-# ======================================================================================================================
-# Delete Item Undo Class
-# ----------------------------------------------------------------------------------------------------------------------
-class Delete(QtGui.QUndoCommand):
-    """Supports deleting an item from a list."""
-    def __init__(self,
-                 widget: QtWidgets.QTreeWidget,
-                 node: QtWidgets.QTreeWidgetItem):
-        item = node.data(0, QtCore.Qt.UserRole)
-        super().__init__(f'delete "{item.text}"')
-        self._widget: QtWidgets.QTreeWidget = widget
-        self._node: QtWidgets.QTreeWidgetItem = node
-        self._parent: QtWidgets.QTreeWidgetItem = node.parent()
-        self._item: ItemModel = item
-        self._index: int = item.row()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def redo(self):
-        self._widget.blockSignals(True)
-        if self._parent:
-            self._parent.removeChild(self._node)
-        else:
-            self._widget.takeTopLevelItem(self._index)
-        self._widget.blockSignals(False)
-        self._item.parent.children.pop(self._index)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def undo(self):
-        self._widget.blockSignals(True)
-        if self._parent:
-            self._parent.insertChild(self._index, self._node)
-        else:
-            self._widget.insertTopLevelItem(self._index, self._node)
-        self._widget.blockSignals(False)
-        self._item.parent.children.insert(self._index, self._item)
-
-
-
-
-# ======================================================================================================================
-# Insert Item Undo Class
-# ----------------------------------------------------------------------------------------------------------------------
-class CommandItemInsert(QtGui.QUndoCommand):
-    """Supports undoing the insertion of an item into the tree."""
-    def __init__(self,
-                 widget: QtWidgets.QTreeWidget,
-                 node: QtWidgets.QTreeWidgetItem,
-                 selected: QtWidgets.QTreeWidgetItem,
-                 root: ItemModel,
-                 sibling: bool):
-        item = node.data(0, QtCore.Qt.UserRole)
-        description = f'insert "{item.text}"'
-        super().__init__(description)
-        self._widget: QtWidgets.QTreeWidget = widget
-        self._node: QtWidgets.QTreeWidgetItem = node
-        self._selected: QtWidgets.QTreeWidgetItem = selected
-        self._root: ItemModel = root
-        self._sibling: bool = sibling
-        self._item: ItemModel = item
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def redo(self):
-        self._widget.blockSignals(True)
-        if not self._selected:
-            self._item.parent = self._root
-            self._root.children.append(self._item)
-            self._widget.addTopLevelItem(self._node)
-        else:
-            selected_node = self._selected
-            selected_item: ItemModel = selected_node.data(0, QtCore.Qt.UserRole)
-            self._item.parent = selected_item
-            if self._sibling:
-                selected_item.parent.children.append(self._item)
-                selected_node.parent().addChild(self._node)
-            else:
-                selected_item.children.append(self._item)
-                selected_node.addChild(self._node)
-                selected_node.setExpanded(True)
-        self._widget.blockSignals(False)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def undo(self):
-        self._widget.blockSignals(True)
-        if not self._selected:
-            self._widget.takeTopLevelItem(self._widget.indexOfTopLevelItem(self._node))
-        else:
-            self._node.parent().removeChild(self._node)
-        self._item.parent.children.pop(self._item.row())
-        self._widget.blockSignals(False)
-
-
-
-
-
-# ======================================================================================================================
-# Move Item Undo Class
-# ----------------------------------------------------------------------------------------------------------------------
-class CommandItemMove(QtGui.QUndoCommand):
-    """Undo command for moving items around the tree."""
-    def __init__(self,
-                 widget: QtWidgets.QTreeWidget,
-                 node: QtWidgets.QTreeWidgetItem):
-        item = node.data(0, QtCore.Qt.UserRole)
-        description = f'delete "{item.text}"'
-        super().__init__(description)
-        self._widget: QtWidgets.QTreeWidget = widget
-        self._node: QtWidgets.QTreeWidgetItem = node
-        self._parent: QtWidgets.QTreeWidgetItem = node.parent()
-        self._item: ItemModel = item
-        self._index: int = item.row()
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def redo(self):
-        self._widget.blockSignals(True)
-        if self._parent:
-            self._parent.removeChild(self._node)
-        else:
-            self._widget.takeTopLevelItem(self._index)
-        self._widget.blockSignals(False)
-        self._item.parent.children.pop(self._index)
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def undo(self):
-        self._widget.blockSignals(True)
-        if self._parent:
-            self._parent.insertChild(self._index, self._node)
-        else:
-            self._widget.insertTopLevelItem(self._index, self._node)
-        self._widget.blockSignals(False)
-        self._item.parent.children.insert(self._index, self._item)
-
-
-
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/libraries/undo/item.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Undo support for tree options."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+from typing import List
+
+from PySide6 import QtGui, QtWidgets
+
+from bine.model.item import ItemModel, Step
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def _attached(item: ItemModel) -> bool:
+    """Determine if an item is still a part of its tree, commands for items that are not can no longer be applied."""
+    return item.parent is not None and item in item.parent.children
+
+
+
+
+# ======================================================================================================================
+# Item Text Command
+# ----------------------------------------------------------------------------------------------------------------------
+class TextChange(QtGui.QUndoCommand):
+    """Supports undo/redo for a single item text.
+
+    The item widget is looked up from the top-level list each time, widgets may be rebuilt as items are moved around.
+    Deleting items is undoable as well, so the item is normally still in the tree, but should the history have gotten
+    out of step with the tree the command is dropped rather than applied to whatever item took its place.
+    """
+    def __init__(self, lists: QtWidgets.QWidget, item: ItemModel, text: str):
+        super().__init__(f'change "{item.text}" to "{text}"')
+        self._lists = lists
+        self._item = item
+        self._before = item.text
+        self._after = text
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def redo(self):
+        if not _attached(self._item):
+            self.setObsolete(True)
+            return
+        self._lists.item_widget(self._item).setText(self._after)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def undo(self):
+        if not _attached(self._item):
+            self.setObsolete(True)
+            return
+        self._lists.item_widget(self._item).setText(self._before)
+
+
+
+
+# ======================================================================================================================
+# Item Check State Command
+# ----------------------------------------------------------------------------------------------------------------------
+class CheckChange(QtGui.QUndoCommand):
+    """Supports undo/redo for a single item checkbox state."""
+    def __init__(self, lists: QtWidgets.QWidget, item: ItemModel, checked: bool):
+        super().__init__(f"{'' if checked else 'un'}check \"{item.text}\"")
+        self._lists = lists
+        self._item = item
+        self._before = item.checked
+        self._after = checked
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def redo(self):
+        if not _attached(self._item):
+            self.setObsolete(True)
+            return
+        self._lists.item_widget(self._item).setChecked(self._after)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def undo(self):
+        if not _attached(self._item):
+            self.setObsolete(True)
+            return
+        self._lists.item_widget(self._item).setChecked(self._before)
+
+
+
+
+# ======================================================================================================================
+# Insert Item Undo Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Insert(QtGui.QUndoCommand):
+    """Supports inserting items, along with any children they already have, into a list.
+
+    The rows are left up to the parent the first time the items are inserted, so that they land in sorted position when
+    auto-sort is enabled, and recorded so that they can be reversed.
+    """
+    ID = 1
+
+    def __init__(self, lists: QtWidgets.QWidget, parent: ItemModel, items: List[ItemModel], description: str = None):
+        super().__init__(description or f'insert "{items[0].text}"')
+        self._lists = lists
+        self._parent: ItemModel = parent
+        self._items: List[ItemModel] = list(items)
+        self._rows: List[int] = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def id(self) -> int:
+        return self.ID
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def mergeWith(self, other: QtGui.QUndoCommand) -> bool:
+        # A new item that is deleted straight away, such as an empty item that was never typed into, cancels out.
+        if isinstance(other, Delete) and self._items == [other._item]:
+            self.setObsolete(True)
+            return True
+        return False
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def redo(self):
+        self._rows = self._lists.insert_items(self._parent, self._items, self._rows)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def undo(self):
+        self._lists.remove_items(self._parent, self._rows)
+
+
+
+
+# ======================================================================================================================
+# Delete Item Undo Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Delete(QtGui.QUndoCommand):
+    """Supports deleting an item, along with all of its children, from a list."""
+    ID = Insert.ID
+
+    def __init__(self, lists: QtWidgets.QWidget, parent: ItemModel, row: int):
+        self._item: ItemModel = parent.children[row]
+        super().__init__(f'delete "{self._item.text}"')
+        self._lists = lists
+        self._parent: ItemModel = parent
+        self._row: int = row
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def id(self) -> int:
+        return self.ID
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def redo(self):
+        self._lists.remove_items(self._parent, [self._row])
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def undo(self):
+        self._lists.insert_items(self._parent, [self._item], [self._row])
+
+
+
+
+# ======================================================================================================================
+# Restructure Undo Class
+# ----------------------------------------------------------------------------------------------------------------------
+class Restructure(QtGui.QUndoCommand):
+    """Supports structural edits of a selection, made of several moves, as a single undo step.
+
+    The steps are planned by the ItemModel.  Any steps that leave the final row up to the destination have it recorded
+    the first time they are applied so that they can be reversed.
+    """
+    def __init__(self, lists: QtWidgets.QWidget, description: str, steps: List[Step]):
+        super().__init__(description)
+        self._lists = lists
+        self._steps: List[Step] = list(steps)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def redo(self):
+        items = []
+        for index, step in enumerate(self._steps):
+            item = self._lists.move_item(*step)
+            self._steps[index] = step._replace(destination_row=item.row())
+            items.append(item)
+        self._lists.select_items(items)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def undo(self):
+        items = []
+        for step in reversed(self._steps):
+            items.append(self._lists.move_item(step.destination, step.destination_row, step.source, step.row))
+        self._lists.select_items(items)
+
+
+
+
+# End of File
@@ -1,66 +1,145 @@
-# ======================================================================================================================
-#      File:  /bine/main.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""Main GUI application creation point."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-import sys
-import logging
-from importlib import metadata
-from argparse import ArgumentParser
-
-from PySide6 import QtWidgets
-import qdarktheme
-
-from bine.gui.main import MainWindow
-
-
-
-
-# ======================================================================================================================
-# Main Function
-# ----------------------------------------------------------------------------------------------------------------------
-def main():
-    # Setup command line inputs.
-    parser = ArgumentParser(description=metadata.metadata('bine')['Summary'])
-    parser.add_argument('files', nargs='*', help='optional file(s) to open in tabs')
-    parser.add_argument('-v', '--verbose', action='count', default=0, help='increase verbosity of terminal output')
-    args = parser.parse_args()
-
-    # Configure logging output.
-    levels = [logging.WARNING, logging.INFO, logging.DEBUG]
-    level = levels[min(2, args.verbose)]
-    logging.basicConfig(level=level)
-
-    # Setup GUI window.
-    sys.argv += ['-platform', 'windows:darkmode=1']
-    app = QtWidgets.QApplication(sys.argv)
-    # qdarktheme.setup_theme('auto', 'sharp')
-    window = MainWindow(args.files)
-    window.show()
-
-    # Run the app.
-    return app.exec_()
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/main.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Main GUI application creation point."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import sys
+import time
+import logging
+from importlib import metadata
+from argparse import ArgumentParser
+from typing import List, Tuple
+
+from bine import cli
+from bine.libraries import instrument
+
+
+
+
+# ======================================================================================================================
+# Startup Profile Class
+# ----------------------------------------------------------------------------------------------------------------------
+class StartupProfile:
+    """Records how long each step of starting up the GUI takes, for the --startup-profile switch."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._marks: List[Tuple[str, float]] = []
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def mark(self, step: str) -> None:
+        """Record that the named step has just finished."""
+        self._marks.append((step, time.perf_counter()))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def report(self) -> str:
+        lines = [f"{'step':<32}{'time (ms)':>12}{'total (ms)':>12}"]
+        previous = self._start
+        for step, when in self._marks:
+            lines.append(f'{step:<32}{(when - previous) * 1000:>12.1f}{(when - self._start) * 1000:>12.1f}')
+            previous = when
+        return '\n'.join(lines)
+
+
+
+
+# ======================================================================================================================
+# Main Function
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    # Headless commands are handed off before Qt is ever imported so that they start quickly and run without a display.
+    if len(sys.argv) > 1 and sys.argv[1] in cli.COMMANDS:
+        return cli.main(sys.argv[1:])
+
+    profile = StartupProfile()
+
+    # Setup command line inputs.
+    epilog = f"headless commands: {', '.join(cli.COMMANDS)} (see bine <command> --help)"
+    parser = ArgumentParser(description=metadata.metadata('bine')['Summary'], epilog=epilog)
+    parser.add_argument('files', nargs='*', help='optional file(s) to open in tabs')
+    parser.add_argument('-v', '--verbose', action='count', default=0, help='increase verbosity of terminal output')
+    parser.add_argument('--startup-profile', action='store_true', help='report the time taken by each startup step')
+    parser.add_argument('--watchdog', metavar='MS', type=int, nargs='?', const=100,
+                        help='log the stack of the GUI thread when it is blocked for longer than MS (default 100)')
+    parser.add_argument('--trace', metavar='FILE', help='record timing spans and counters and write them to FILE on exit')
+    parser.add_argument('--trace-format', choices=['json', 'chrome'], default='json',
+                        help='write the trace as a JSON summary or in the Chrome trace event format')
+    args = parser.parse_args()
+    profile.mark('parse arguments')
+
+    if args.trace:
+        instrument.enable()
+
+    # The GUI is only imported once it's known to be needed.  Anything else that is slow to load (Markdown, the spell
+    # checker, print support) is imported on first use.
+    from PySide6 import QtCore, QtWidgets
+    profile.mark('import PySide6')
+    from bine.gui.main import MainWindow
+    profile.mark('import GUI modules')
+
+    # Configure logging output.
+    levels = [logging.WARNING, logging.INFO, logging.DEBUG]
+    level = levels[min(2, args.verbose)]
+    logging.basicConfig(level=level)
+
+    # Pick up the settings, and the tabs to be restored, from the last session.
+    from bine.settings import settings
+    settings.load()
+    profile.mark('load settings')
+
+    # Setup GUI window.
+    sys.argv += ['-platform', 'windows:darkmode=1']
+    app = QtWidgets.QApplication(sys.argv)
+    # import qdarktheme
+    # qdarktheme.setup_theme('auto', 'sharp')
+    profile.mark('create application')
+    window = MainWindow(args.files)
+    profile.mark('create main window')
+    window.show()
+    profile.mark('show main window')
+
+    # The window opens the first file as soon as the event loop starts - this fires right after that.
+    if args.startup_profile:
+        def report():
+            profile.mark('open first file' if args.files else 'start event loop')
+            print(profile.report(), file=sys.stderr)
+        QtCore.QTimer.singleShot(0, report)
+
+    if args.watchdog:
+        from bine.gui.watchdog import Watchdog
+        watchdog = Watchdog(args.watchdog, app)
+        watchdog.start()
+
+    # Run the app.
+    result = app.exec_()
+    if args.watchdog:
+        watchdog.stop()
+    if args.trace:
+        instrument.dump(args.trace, args.trace_format)
+    return result
+
+
+
+
+# End of File
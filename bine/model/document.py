@@ -1,184 +1,492 @@
-# ======================================================================================================================
-#      File:  /bine/model/document.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2023 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""A Document represents a single Markdown file containing a title, optional description, and a set of checklists."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-import re
-from typing import List
-
-import markdown
-
-from bine.model.item import ItemModel
-
-
-
-
-# ======================================================================================================================
-# Document Model
-# ----------------------------------------------------------------------------------------------------------------------
-class DocumentModel:
-    """A Document is the top-level Markdown file representation of a checklist."""
-
-    def __init__(self):
-        self.title: str = ""
-        self.description: str = ""
-
-        self.root: ItemModel = ItemModel(None, 'root')
-
-        self._cached = ''
-
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def load(self, filename: str) -> None:
-        """Load a document from file."""
-        with open(filename, 'r', encoding='utf-8') as handle:
-            document = handle.read()
-
-        self._cached = document
-
-        # Convert underline headings to pound headings.
-        document = re.sub('(.+)\n===+\n', r'# \1\n', document)
-        document = re.sub('(.+)\n---+\n', r'## \1\n', document)
-
-        # Ensure that the document ends with a newline.
-        document += '\n'
-
-        # Parse out sections using headings as titles.
-        sections = re.split('^#+\s*', document, flags=re.MULTILINE)[1:]
-        if len(sections) != 1:
-            raise ValueError('Provided file does not follow expected checklist conventions.')
-        self.title, body = sections[0].split('\n', 1)
-        try:
-            self.description, item_text = body.split('\n\n-', 1)
-        except ValueError:
-            # A ValueError is thrown if no description was provided - default to empty string.
-            self.description = ''
-            item_text = body
-        else:
-            # The leading dash and trailing newline got stripped by re, hack them back for the parsing below.
-            item_text = '- ' + item_text.strip() + '\n'
-
-        # Generate nested List of Items from the list under the description.
-        parents: List[ItemModel] = [self.root]
-        indentations = [0]
-        items = re.split('^([ \t]*)[-*][ \t]*(?:\[(.)\])?[ \t]*(.*?)$', item_text, flags=re.MULTILINE)
-        for leader, check_text, text in zip(items[1::4], items[2::4], items[3::4]):
-            indent = len(leader)
-
-            # Skip empty items.
-            if not text:
-                continue
-
-            # Decide if we need to change levels.
-            if indent > indentations[-1]:
-                # Indent increased, we are looking at a new child.
-                children = len(parents[-1].children)
-                if children > 0:
-                    # Push the last item added into the part stack.
-                    parents.append(parents[-1].children[children - 1])
-                    # Adjust the indentation to show the new level.
-                    indentations.append(indent)
-            else:
-                # We are moving out of a child - could be more than one step though.
-                while indent < indentations[-1] and len(parents) > 0:
-                    # For each step, pop a parent off the stack.
-                    parents.pop()
-                    indentations.pop()
-
-            # With that sorted, the parent for this list will be the one at the end of the parents stack.
-            parent = parents[-1]
-
-            # Remove colons and periods from the end of the items.  They look good in Markdown, but not in a GUI.
-            text = text.rstrip(':.')
-
-            # Insert the item.
-            checked = bool(check_text is not None and check_text != ' ')
-            parent.children.append(ItemModel(parent, text, checked))
-
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def dump(self, filename: str, update_cache: bool) -> None:
-        """Write the contents of this model to the provided filename.
-
-        Arguments:
-            filename: The path and name of the file to which the contents of this Document are to be dumped.
-            headings: The format to use for the headings in the output file.
-        """
-        document = self.dumps()
-        with open(filename, 'w', encoding='utf-8') as handle:
-            handle.write(document)
-        if update_cache:
-            self._cached = document
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def dumps(self) -> str:
-        """Return the contents of this document as a sting."""
-        text = self.title + '\n'
-        text += ('=' * 120) + '\n'
-        if self.description:
-            text += self.description
-            text += '\n\n'
-        for child in self.root.children:
-            text += child.dumps()
-        return text
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def dirty(self) -> bool:
-        current = self.dumps()
-        return current != self._cached
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def to_html(self) -> str:
-        text = self.dumps()
-        extensions = [
-            'admonition',
-            'codehilite',
-            'extra',
-            'pymdownx.tasklist'
-        ]
-        html = markdown(text, extensions=extensions)
-        return html
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def clear(self):
-        self.root.clear()
-        self._cached = ''
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def __repr__(self) -> str:
-        description = self.description.replace('\n', '\\n')
-        text = f'<Document title="{self.title} description="{description}">\n'
-        text += '\n'.join(item.repr() for item in self.root.children)
-        text += '\n</Document>'
-        return text
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/model/document.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2023 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""A Document represents a single Markdown file containing a title, optional description, and a set of checklists."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import re
+import shutil
+from array import array
+from typing import Iterator, List, Tuple
+
+from bine.libraries import instrument
+from bine.libraries.cache import DocumentCache
+from bine.libraries.render import render_inline, render_items, render_markdown
+from bine.model.item import ItemModel
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Constants
+# ----------------------------------------------------------------------------------------------------------------------
+# A single line of a list, the same pattern used to parse the items.
+ITEM_LINE = re.compile(r'^([ \t]*)[-*][ \t]*(?:\[(.)\])?[ \t]*(.*?)$', re.MULTILINE)
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def write_file(filename: str, document: str) -> None:
+    """Write the text of a document to file, replacing the file only once the new text is safely on disk.
+
+    The text is written to a temporary file beside the original which is then renamed over it, so the file is never
+    left half written.  The permissions of the original file are kept and links are followed to the real file.
+    """
+    filename = os.path.realpath(filename)
+    folder, name = os.path.split(filename)
+    temporary = os.path.join(folder, f'.{name}.tmp')
+    try:
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            handle.write(document)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if os.path.exists(filename):
+            shutil.copymode(filename, temporary)
+        os.replace(temporary, filename)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+
+
+# ======================================================================================================================
+# Document Model
+# ----------------------------------------------------------------------------------------------------------------------
+class DocumentModel:
+    """A Document is the top-level Markdown file representation of a checklist."""
+
+    def __init__(self):
+        self.title: str = ""
+        self.description: str = ""
+
+        self.root: ItemModel = ItemModel(None, 'root')
+
+        self._cached = ''
+
+        # The text of the file before the first item, along with the title and description it was parsed as, and after
+        # the last item.  With the sources of the items these allow unchanged parts of the file to be saved as they were.
+        self._header: Tuple[str, str, str] = None
+        self._trailer = ''
+        self._indent = '    '
+
+        # The content of the document when it was last checked against the file along with the result, see dirty.
+        self._dirty: Tuple[Tuple, bool] = None
+
+        # The rendered description is kept until the description changes, it's the only part that needs Markdown.
+        self._description_source: str = None
+        self._description_html: str = ''
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('DocumentModel.load')
+    def load(self, filename: str, cache: DocumentCache = None) -> None:
+        """Load a document from file.
+
+        Arguments:
+            filename: The path to the Markdown file to be loaded.
+            cache: Optional cache of parsed documents.  When it holds the file, as it is now, the parsing is skipped,
+                otherwise the freshly parsed document is stored in it for next time.
+        """
+        with open(filename, 'r', encoding='utf-8') as handle:
+            document = handle.read()
+
+        self._cached = document
+        self._dirty = None
+
+        if cache is not None:
+            flattened = cache.get(filename, document)
+            if flattened is not None:
+                try:
+                    items, spans = self._unflatten(flattened)
+                    self._attach_sources(document, spans, items)
+                    self.root.settle(items, self._indent)
+                    instrument.count('DocumentModel.cache_hit')
+                    return
+                except Exception:
+                    # Anything malformed is reparsed from the file below, which replaces the bad entry.
+                    self.title = self.description = ''
+                    self.root.clear()
+                    instrument.count('DocumentModel.cache_error')
+
+        items = self._parse(document)
+        spans = self._scan(document, len(items))
+        self._attach_sources(document, spans, items)
+        self.root.settle(items, self._indent)
+        if cache is not None:
+            try:
+                cache.put(filename, document, self._flatten(spans, items))
+            except (ValueError, OverflowError):
+                pass  # Nested too deeply (or too large) for the compact form, it'll just be parsed every time.
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _parse(self, document: str) -> List[Tuple[ItemModel, int]]:
+        """Populate this model from the Markdown text of a checklist.
+
+        Returns:
+            Each of the items along with its level, in the order of the document.
+        """
+        # Convert underline headings to pound headings.
+        document = re.sub('(.+)\n===+\n', r'# \1\n', document)
+        document = re.sub('(.+)\n---+\n', r'## \1\n', document)
+
+        # Ensure that the document ends with a newline.
+        document += '\n'
+
+        # Parse out sections using headings as titles.
+        sections = re.split('^#+\s*', document, flags=re.MULTILINE)[1:]
+        if len(sections) != 1:
+            raise ValueError('Provided file does not follow expected checklist conventions.')
+        self.title, body = sections[0].split('\n', 1)
+        try:
+            self.description, item_text = body.split('\n\n-', 1)
+        except ValueError:
+            # A ValueError is thrown if no description was provided - default to empty string.
+            self.description = ''
+            item_text = body
+        else:
+            # The leading dash and trailing newline got stripped by re, hack them back for the parsing below.
+            item_text = '- ' + item_text.strip() + '\n'
+
+        # Generate nested List of Items from the list under the description.
+        parsed = []
+        parents: List[ItemModel] = [self.root]
+        indentations = [0]
+        items = re.split('^([ \t]*)[-*][ \t]*(?:\[(.)\])?[ \t]*(.*?)$', item_text, flags=re.MULTILINE)
+        for leader, check_text, text in zip(items[1::4], items[2::4], items[3::4]):
+            indent = len(leader)
+
+            # Skip empty items.
+            if not text:
+                continue
+
+            # Decide if we need to change levels.
+            if indent > indentations[-1]:
+                # Indent increased, we are looking at a new child.
+                children = len(parents[-1].children)
+                if children > 0:
+                    # Push the last item added into the part stack.
+                    parents.append(parents[-1].children[children - 1])
+                    # Adjust the indentation to show the new level.
+                    indentations.append(indent)
+            else:
+                # We are moving out of a child - could be more than one step though.
+                while indent < indentations[-1] and len(parents) > 0:
+                    # For each step, pop a parent off the stack.
+                    parents.pop()
+                    indentations.pop()
+
+            # With that sorted, the parent for this list will be the one at the end of the parents stack.
+            parent = parents[-1]
+
+            # Remove colons and periods from the end of the items.  They look good in Markdown, but not in a GUI.
+            text = text.rstrip(':.')
+
+            # Insert the item.  The tree is settled in one go once it's complete, see load.
+            checked = bool(check_text is not None and check_text != ' ')
+            item = ItemModel(parent, text, checked)
+            parent._attach(item)
+            parsed.append((item, len(parents) - 1))
+
+        return parsed
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _scan(self, document: str, items: int) -> List[int]:
+        """Find where the line of each of the parsed items starts and ends in the original text of the file.
+
+        The items are always the last of the lines that look like items, anything above them belongs to the
+        description.
+
+        Arguments:
+            document: The original text of the file.
+            items: The number of items that were parsed from it.
+
+        Returns:
+            The start and end offsets of each line, one after the other in the order of the items, or an empty list if
+            the lines can't be matched up to the items.
+        """
+        spans = []
+        for match in ITEM_LINE.finditer(document):
+            if match.group(3):
+                spans.append(match.start())
+                spans.append(match.end())
+        if len(spans) < items * 2:
+            return []
+        return spans[len(spans) - items * 2:]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _walk(self) -> Iterator[Tuple[ItemModel, int]]:
+        """Generate each item of the document, depth first, along with its level."""
+        stack = [(child, 0) for child in reversed(self.root.children)]
+        while stack:
+            item, level = stack.pop()
+            yield item, level
+            stack.extend((child, level + 1) for child in reversed(item.children))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _attach_sources(self, document: str, spans: List[int], items: List[Tuple[ItemModel, int]]) -> None:
+        """Record the original text of the file against each item, so that unchanged items are saved as they were.
+
+        Arguments:
+            document: The original text of the file.
+            spans: The start and end offsets of the line of each item in the text, see _scan.
+            items: Each of the items along with its level, in the order of the document.
+        """
+        self._header = None
+        self._trailer = ''
+        self._indent = '    '
+        if not spans:
+            if not self.root.children:
+                self._header = (document, self.title, self.description)
+            return
+
+        sources = []
+        previous = None
+        for index, (item, level) in enumerate(items):
+            start, end = spans[index * 2], spans[index * 2 + 1]
+            line = document[start:end]
+            # Check that the lines still line up with the items, if not then fall back on the canonical format.
+            if item.text.strip() not in line:
+                return
+            prefix = document[previous + 1:start] if previous is not None else ''
+            sources.append((item, (prefix, line, item.text, item._checked, level)))
+            if level == 1 and self._indent == '    ':
+                self._indent = line[:len(line) - len(line.lstrip(' \t'))] or self._indent
+            previous = end
+
+        for item, source in sources:
+            item._source = source
+        self._header = (document[:spans[0]], self.title, self.description)
+        self._trailer = document[previous + 1:]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _flatten(self, spans: List[int], items: List[Tuple[ItemModel, int]]) -> Tuple:
+        """Return the parsed content of this document in the compact form kept in the document cache.
+
+        The tree is stored depth first, the order of the provided items, as parallel sequences of levels, check states
+        and texts, along with the offsets of the line of each item in the original file.
+        """
+        levels = bytes(level for _, level in items)
+        checks = bytes(item._checked for item, _ in items)
+        texts = tuple(item.text for item, _ in items)
+        return (self.title, self.description, levels, checks, texts, array('L', spans).tobytes())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _unflatten(self, flattened: Tuple) -> Tuple[List[Tuple[ItemModel, int]], List[int]]:
+        """Populate this model from the compact form produced by _flatten.
+
+        Returns:
+            Each of the items along with its level, in the order of the document, and the offsets of the line of each
+            item in the original file.
+        """
+        title, description, levels, checks, texts, offsets = flattened
+        spans = array('L')
+        spans.frombytes(offsets)
+        if not len(levels) == len(checks) == len(texts) or len(spans) not in (0, len(texts) * 2):
+            raise ValueError('Cached document is inconsistent.')
+        self.title = title
+        self.description = description
+        items = []
+        parents = [self.root]
+        for level, checked, text in zip(levels, checks, texts):
+            del parents[level + 1:]
+            parent = parents[level]
+            item = ItemModel(parent, text, bool(checked))
+            parent._attach(item)
+            parents.append(item)
+            items.append((item, level))
+        return items, spans
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def snapshot(self) -> Tuple:
+        """Return a copy of the content of this document, in the compact form kept in the document cache, that can be
+        handed to a worker thread while this document carries on being edited.
+        """
+        return self._flatten([], list(self._walk()))
+
+
+    def restore(self, snapshot: Tuple) -> None:
+        """Populate this, empty, model from a copy of another document taken with snapshot."""
+        items, _ = self._unflatten(snapshot)
+        self.root.settle(items, self._indent)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def dump(self, filename: str, update_cache: bool, preserve: bool = True) -> None:
+        """Write the contents of this model to the provided filename.
+
+        Arguments:
+            filename: The path and name of the file to which the contents of this Document are to be dumped.
+            update_cache: When True, the written text becomes the reference for checking if the document is dirty.
+            preserve: Keep the formatting of the unchanged parts of the file, see dumps.
+        """
+        document = self.dumps(preserve)
+        write_file(filename, document)
+        if update_cache:
+            self._cached = document
+            self._dirty = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('DocumentModel.dumps')
+    def dumps(self, preserve: bool = True) -> str:
+        """Return the contents of this document as a sting.
+
+        Arguments:
+            preserve: When True, everything that hasn't changed since the file was loaded is written exactly as it was
+                in the file so that saving a lightly edited file changes only the edited lines.  When False the whole
+                document is written in the canonical format.
+        """
+        header = self._header if preserve else None
+        if header is not None and header[1] == self.title and header[2] == self.description:
+            text = header[0]
+        else:
+            text = self.title + '\n'
+            text += ('=' * 120) + '\n'
+            if self.description:
+                text += self.description
+                text += '\n\n'
+        indent = self._indent if preserve else '    '
+        text += ''.join([child.dumps(0, indent, preserve) for child in self.root.children])
+        if preserve:
+            text += self._trailer
+        return text
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def canonical(self) -> bool:
+        """Return True if the text last loaded or saved is exactly what the canonical format would produce."""
+        return self.dumps(preserve=False) == self._cached
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def update_cache(self, document: str) -> None:
+        """Replace the text that this document is compared against to decide if it is dirty, for when this document has
+        been brought in line with the file by other means than loading or dumping it.
+        """
+        self._cached = document
+        self._dirty = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def adopt(self, other: 'DocumentModel') -> None:
+        """Take on the formatting of the file that another copy of this document was loaded from.
+
+        The items of both documents are expected to match, such as after merging the other document into this one.  Any
+        item that doesn't match keeps its own formatting.
+        """
+        for (item, level), (theirs, their_level) in zip(self._walk(), other._walk()):
+            if item.text == theirs.text and level == their_level:
+                item._source = theirs._source
+            else:
+                item._source = None
+            item._fragment = None
+        self._header = other._header
+        self._trailer = other._trailer
+        self._indent = other._indent
+        self._dirty = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @instrument.timed('DocumentModel.dirty')
+    def dirty(self) -> bool:
+        # The answer only changes with the content, which the digest of the root covers, so it's kept until then.
+        state = (self.title, self.description, self.root.digest, settings.auto_check)
+        if self._dirty is None or self._dirty[0] != state:
+            instrument.count('DocumentModel.dirty.recompute')
+            self._dirty = (state, self.dumps() != self._cached)
+        return self._dirty[1]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def saved_text(self) -> str:
+        """The text of the file as this document was last loaded from, or saved to, it."""
+        return self._cached
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def equals(self, other: 'DocumentModel') -> bool:
+        """Return True if the other document has the same title, description and items as this one."""
+        return (self.title == other.title and self.description == other.description
+                and self.root.digest == other.root.digest)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def description_html(self) -> str:
+        """Return the description rendered to HTML, rendering it again only if it has changed since the last call."""
+        if self.description != self._description_source:
+            self._description_html = render_markdown(self.description) if self.description else ''
+            self._description_source = self.description
+        return self._description_html
+
+
+    def iter_html(self) -> Iterator[str]:
+        """Generate the HTML for this document one chunk at a time, walking the tree of items once."""
+        if self.title:
+            yield f'<h1>{render_inline(self.title)}</h1>\n'
+        if self.description:
+            yield self.description_html() + '\n'
+        yield from render_items(self.root)
+
+
+    def to_html(self) -> str:
+        """Return the contents of this document as an HTML fragment."""
+        return ''.join(self.iter_html())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def clear(self):
+        self.root.clear()
+        self._cached = ''
+        self._dirty = None
+        self._header = None
+        self._trailer = ''
+        self._indent = '    '
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        description = self.description.replace('\n', '\\n')
+        text = f'<Document title="{self.title} description="{description}">\n'
+        text += '\n'.join(item.repr() for item in self.root.children)
+        text += '\n</Document>'
+        return text
+
+
+
+
+# End of File
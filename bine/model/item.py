@@ -1,151 +1,743 @@
-# ======================================================================================================================
-#      File:  /bine/model/item.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""A checklist contains Items (with checkboxes) and optionally more children Items."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-from typing import List
-
-from bine.settings import settings
-
-
-
-
-# ======================================================================================================================
-# Item Model
-# ----------------------------------------------------------------------------------------------------------------------
-class ItemModel:
-    """Represents an "item" in the document tree containing checklist items with optional lists.
-
-    Attributes:
-        parent: Parent Checklist of this Checklist or None in the case of root list.
-        text: Text for this item in the checklist.
-        checked: Boolean indicating if this item is checked.  Calculated for non-leaf nodes.
-        children: List of Items under this item - may be empty in the case of leaves.
-    """
-    def __init__(self, parent: 'ItemModel' = None, text: str = '', checked: bool = False):
-        self.parent = parent
-        self.text = text
-        self._checked = checked
-        self.children: List['ItemModel'] = []
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    @property
-    def checked(self) -> bool:
-        if not self.children or not settings.auto_check:
-            return self._checked
-        return all([child.checked for child in self.children])
-
-    @checked.setter
-    def checked(self, value: bool):
-        self._checked = value
-        if self.children:
-            for child in self.children:
-                child.checked = value
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    @property
-    def root(self):
-        if self.parent is None:
-            return self
-        return self.parent.root
-
-
-    @property
-    def duplicate(self) -> bool:
-        def items(list) -> List[str]:
-            texts = []
-            for child in list.children:
-                texts.append(child.text)
-                texts.extend(items(child))
-            return texts
-        return items(self.root).count(self.text) > 1
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    @property
-    def chain(self) -> List['ItemModel']:
-        if self.parent:
-            return self.parent.chain + [self]
-        return [self]
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    @property
-    def level(self) -> int:
-        return len(self.chain) - 1
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    @property
-    def progress(self) -> int:
-        """Return the percent completed of the children of this item on a scale of 0 to 100."""
-        if not self.children:
-            # Without children, the percentage is based upon the check state and it's all or nothing.
-            return 100 if self.checked else 0
-
-        # If this item has children then return the average.
-        return sum([child.progress for child in self.children]) / len(self.children)
-
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def clear(self) -> None:
-        self.children = []
-        self.text = ''
-        self.checked = False
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def dumps(self, level: int = 0) -> str:
-        indent = ' ' * (level * 4)
-        text = f"{indent}- [{'x' if self.checked else ' '}] {self.text}"
-        if self.children:
-            text += ':'
-        text += '\n'
-
-        for child in self.children:
-            text += child.dumps(level + 1)
-
-        return text
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def repr(self, level: int = 1) -> str:
-        indent = '  ' * level
-        text = f"{indent}<ItemModel checked={self.checked} text=\"{self.text}\"{'/' if not self.children else ''}>"
-        if self.children:
-            text += '\n'
-            text += f'\n'.join(child.repr(level + 1) for child in self.children)
-            text += f'\n{indent}</ItemModel>'
-        return text
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-    def __repr__(self) -> str:
-        return self.repr()
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/model/item.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""A checklist contains Items (with checkboxes) and optionally more children Items."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import re
+from bisect import bisect_right
+from hashlib import blake2b
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Any, Callable, List, NamedTuple, Tuple
+
+from bine.libraries import instrument
+from bine.settings import settings
+
+
+
+
+# ======================================================================================================================
+# Collation
+# ----------------------------------------------------------------------------------------------------------------------
+def collation_key(text: str) -> Tuple:
+    """Generate a key to sort text without regard to case and with runs of digits ordered by their numeric value.
+
+    For example, "Item 2" sorts before "item 10".  The key alternates between text and integer parts, always starting
+    with text, so that any two keys can be compared part-by-part.
+    """
+    parts = re.split(r'(\d+)', text.casefold())
+    return tuple(int(part) if index % 2 else part for index, part in enumerate(parts))
+
+
+
+
+# ======================================================================================================================
+# Structural Edit Step
+# ----------------------------------------------------------------------------------------------------------------------
+class Step(NamedTuple):
+    """A single move of an item, one of the steps planned for a structural edit such as indenting a selection.
+
+    Attributes:
+        source: The parent of the item before the move.
+        row: The row of the item within the source.
+        destination: The parent of the item after the move.
+        destination_row: The row of the item within the destination after the move, or None to let the destination
+            decide (sorted position with auto-sort enabled, otherwise the end).
+    """
+    source: 'ItemModel'
+    row: int
+    destination: 'ItemModel'
+    destination_row: int
+
+
+
+
+# ======================================================================================================================
+# Tree Difference Edit
+# ----------------------------------------------------------------------------------------------------------------------
+class Edit(NamedTuple):
+    """A single change needed to bring one tree of items in line with another, as planned by ItemModel.diff.
+
+    Attributes:
+        action: One of "remove", "insert", "text" or "check".
+        parent: The item whose children are changed.
+        row: The row of the child to be removed or inserted - text and check edits follow the item instead.
+        item: The item to be inserted, or the item whose text or check state is to change.
+        value: The new text or check state.
+    """
+    action: str
+    parent: 'ItemModel'
+    row: int
+    item: 'ItemModel' = None
+    value: Any = None
+
+
+
+
+# ======================================================================================================================
+# Item Model
+# ----------------------------------------------------------------------------------------------------------------------
+class ItemModel:
+    """Represents an "item" in the document tree containing checklist items with optional lists.
+
+    Attributes:
+        parent: Parent Checklist of this Checklist or None in the case of root list.
+        text: Text for this item in the checklist.
+        checked: Boolean indicating if this item is checked.  Calculated for non-leaf nodes.
+        children: List of Items under this item - may be empty in the case of leaves.
+        observer: Optional callable, set on the root item, that is called with a tuple describing each change made to
+            the tree under it, such as ('text', path, text).  See bine.libraries.journal.
+    """
+    def __init__(self, parent: 'ItemModel' = None, text: str = '', checked: bool = False):
+        self.parent = parent
+        self._text = text
+        self._key: Tuple = None
+        self._row = 0
+        self._checked = checked
+        self.children: List['ItemModel'] = []
+        self.observer: Callable[[Tuple], None] = None
+
+        # Where this item came from in the file it was loaded from, see DocumentModel.load.  A tuple of the lines before
+        # it that weren't items, its own line and the text, check mark and level that line was parsed as.
+        self._source: Tuple[str, str, str, bool, int] = None
+
+        # Cached aggregates of the children, kept so that the state of large trees can be read without walking them.
+        self._unchecked = 0
+        self._progress: float = None
+        self._texts: Counter = None
+
+        # The Markdown for this item and all of its children, along with the arguments it was dumped with.  Dropped from
+        # this item and all of its parents whenever it changes so that dumping only formats the changed subtrees.
+        self._fragment: Tuple[Tuple, str] = None
+
+        # A hash of the content of this item and all of its children, see digest.
+        self._digest: bytes = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        root = self.root
+        if root._texts is not None and self.parent is not None:
+            root._texts[self._text] -= 1
+            root._texts[value] += 1
+        self._text = value
+        self._key = None
+        self._invalidate()
+        if root.observer is not None:
+            root.observer(('text', self.path, value))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def key(self) -> Tuple:
+        """The collation key used to sort this item amongst its siblings, cached until the text changes."""
+        if self._key is None:
+            self._key = collation_key(self._text)
+        return self._key
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def row(self) -> int:
+        """Return the index of this item within the children of its parent.
+
+        Rows are cached on the items.  When the cached row turns out to be stale, because siblings were inserted or
+        removed, the rows of all of the siblings are refreshed at once so that subsequent lookups are constant time.
+        """
+        if self.parent is None:
+            return 0
+        siblings = self.parent.children
+        if self._row >= len(siblings) or siblings[self._row] is not self:
+            for row, sibling in enumerate(siblings):
+                sibling._row = row
+        return self._row
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def checked(self) -> bool:
+        if not self.children or not settings.auto_check:
+            return self._checked
+        return self._unchecked == 0
+
+    @checked.setter
+    def checked(self, value: bool):
+        before = self._state()
+
+        # Cascade the new state down through all of the children, resetting their counters along the way.
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            item._checked = value
+            item._unchecked = 0 if value else len(item.children)
+            item._progress = None
+            item._fragment = None
+            item._digest = None
+            stack.extend(item.children)
+
+        self._changed(before)
+        observer = self._observer()
+        if observer is not None:
+            observer(('check', self.path, value))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def _state(self) -> bool:
+        """Return the automatic check state of this item - the check of a leaf or if all children of a branch are
+        checked.
+
+        Each item keeps a count of the children that are not checked, in this sense, so that it never needs to look at
+        its children to determine its own state.
+        """
+        if not self.children:
+            return self._checked
+        return self._unchecked == 0
+
+
+    def _changed(self, before: bool) -> None:
+        """Update the cached aggregates of the parents of this item after it, or its children, have been changed.
+
+        Arguments:
+            before: The automatic check state of this item from before the change.
+        """
+        item = self
+        while item is not None:
+            item._progress = None
+            item._fragment = None
+            item._digest = None
+            after = item._state()
+            parent = item.parent
+            if parent is not None and after != before:
+                before = parent._state()
+                parent._unchecked += -1 if after else 1
+            else:
+                # With the state settled, only the progress of the remaining parents needs to be invalidated.
+                before = parent._state() if parent is not None else None
+            item = parent
+
+
+    def _observer(self) -> Callable[[Tuple], None]:
+        """Return the observer of the root item, to be told about a change to the tree, or None if there isn't one."""
+        return self.root.observer
+
+
+    def _invalidate(self) -> None:
+        """Drop the dumped Markdown and digests of this item and of its parents after this item has changed."""
+        item = self
+        while item is not None:
+            item._fragment = None
+            item._digest = None
+            item = item.parent
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def digest(self) -> bytes:
+        """A hash of the text and check state of this item and, in turn, of the digests of its children.
+
+        Two items with the same digest have the same content all of the way down, so whole trees and subtrees can be
+        compared without walking them.  Digests are cached and, when an item changes, only it and its parents need to be
+        hashed again.
+        """
+        if self._digest is None:
+            instrument.count('ItemModel.digest.recompute')
+            self._digest = self._hash()
+        return self._digest
+
+
+    def _hash(self) -> bytes:
+        """Hash the text and check state of this item along with the digests of its children."""
+        text = self._text.encode('utf-8', 'surrogatepass')
+        hasher = blake2b(len(text).to_bytes(8, 'little'), digest_size=16)
+        hasher.update(text)
+        hasher.update(b'x' if self._checked else b' ')
+        for child in self.children:
+            hasher.update(child.digest)
+        return hasher.digest()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def root(self):
+        if self.parent is None:
+            return self
+        return self.parent.root
+
+
+    @property
+    @instrument.timed('ItemModel.duplicate')
+    def duplicate(self) -> bool:
+        """Indicates if another item in the document has the same text as this one.
+
+        The count of each text is kept on the root item.  It's counted in full the first time it's needed and from then
+        on it is updated as texts change and subtrees are inserted or taken, see _count.
+        """
+        root = self.root
+        if root._texts is None:
+            instrument.count('ItemModel.duplicate.recount')
+            texts = Counter()
+            stack = [root]
+            while stack:
+                item = stack.pop()
+                texts.update(child._text for child in item.children)
+                stack.extend(item.children)
+            root._texts = texts
+        return root._texts[self._text] > 1
+
+
+    def _count(self, child: 'ItemModel', sign: int) -> None:
+        """Add the texts of a child, and all of its children, to the duplicate counts of the root of this item - or
+        with a sign of -1, remove them again.
+        """
+        texts = self.root._texts
+        if texts is None:
+            return
+        stack = [child]
+        while stack:
+            item = stack.pop()
+            texts[item._text] += sign
+            stack.extend(item.children)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def chain(self) -> List['ItemModel']:
+        if self.parent:
+            return self.parent.chain + [self]
+        return [self]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def path(self) -> Tuple[int, ...]:
+        """The row of this item and of each of its parents, starting from the children of the root."""
+        rows = []
+        item = self
+        while item.parent is not None:
+            rows.append(item.row())
+            item = item.parent
+        return tuple(reversed(rows))
+
+
+    def descendant(self, path: Tuple[int, ...]) -> 'ItemModel':
+        """Return the item found by following the rows of path down from this item, the reverse of path."""
+        item = self
+        for row in path:
+            item = item.children[row]
+        return item
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    def level(self) -> int:
+        return len(self.chain) - 1
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    @property
+    @instrument.timed('ItemModel.progress')
+    def progress(self) -> int:
+        """Return the percent completed of the children of this item on a scale of 0 to 100.
+
+        The result is cached until this item, or one of its children, changes.
+        """
+        if self._progress is None:
+            instrument.count('ItemModel.progress.recompute')
+            if not self.children:
+                # Without children, the percentage is based upon the check state and it's all or nothing.
+                self._progress = 100 if self.checked else 0
+            else:
+                # If this item has children then return the average.
+                self._progress = sum([child.progress for child in self.children]) / len(self.children)
+        return self._progress
+
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def insert(self, row: int, child: 'ItemModel') -> int:
+        """Insert the provided item as a child of this item at the specified row."""
+        self._insert(row, child)
+        observer = self._observer()
+        if observer is not None:
+            observer(('insert', self.path, row, child))
+        return row
+
+
+    def _insert(self, row: int, child: 'ItemModel') -> None:
+        before = self._state()
+        child.parent = self
+        child._row = row
+        self.children.insert(row, child)
+        if not child._state():
+            self._unchecked += 1
+        self._count(child, 1)
+        self._changed(before)
+
+
+    def _attach(self, child: 'ItemModel') -> None:
+        """Append a child while a loader is building a tree that nothing is observing yet.
+
+        Nothing else is updated along the way, once the tree is complete the aggregates are worked out with settle.
+        """
+        child.parent = self
+        child._row = len(self.children)
+        self.children.append(child)
+
+
+    def settle(self, items: List[Tuple['ItemModel', int]], indent: str = '    ') -> None:
+        """Work out the cached aggregates of all of the items under this, the root, once a loader has built the tree.
+
+        A single pass from the leaves up counts the unchecked children of each item, hashes its digest and dumps its
+        Markdown, each of them making use of what was just worked out for its children.
+
+        Arguments:
+            items: Every item under this one along with its level, depth first in the order of the document - the order
+                in which the loaders build them.
+            indent: The indentation that the document is dumped with, see dumps.
+        """
+        auto_check = settings.auto_check
+        for item, level in reversed(items):
+            children = item.children
+            item._unchecked = sum(1 for child in children if not child._state()) if children else 0
+            item._progress = None
+            item._digest = item._hash()
+            text = item._line(level, indent, True)
+            if children:
+                text += ''.join([child._fragment[1] for child in children])
+            item._fragment = ((level, indent, True, auto_check), text)
+        self._unchecked = sum(1 for child in self.children if not child._state())
+        self._progress = self._fragment = None
+        self._digest = self._hash()
+
+
+    def append(self, child: 'ItemModel') -> int:
+        """Insert the provided item at the end of the children of this item."""
+        return self.insert(len(self.children), child)
+
+
+    def add(self, child: 'ItemModel') -> int:
+        """Insert the provided item as a child of this item, in sorted position when auto-sort is enabled.
+
+        Returns:
+            The row at which the child was inserted.
+        """
+        if settings.auto_sort:
+            return self.insert(self.sorted_row(child), child)
+        return self.append(child)
+
+
+    def take(self, row: int) -> 'ItemModel':
+        """Remove and return the child at the specified row."""
+        child = self._take(row)
+        observer = self._observer()
+        if observer is not None:
+            observer(('remove', self.path, row))
+        return child
+
+
+    def _take(self, row: int) -> 'ItemModel':
+        before = self._state()
+        child = self.children.pop(row)
+        if not child._state():
+            self._unchecked -= 1
+        self._count(child, -1)
+        self._changed(before)
+        return child
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def move(self, row: int, destination: 'ItemModel', destination_row: int = None) -> 'ItemModel':
+        """Move one of the children of this item to a new row, possibly under a different parent.
+
+        Arguments:
+            row: The current row of the child to be moved.
+            destination: The new parent for the child, which may be this same item.
+            destination_row: The row of the child within the destination after the move is complete.  If None then the
+                child is added as with the add method.
+
+        Returns:
+            The child that was moved.
+        """
+        child = self.children[row]
+        if destination is child or child in destination.chain:
+            raise ValueError('An item cannot be moved into its own children.')
+        # Where the child came from has to be noted before it goes, the row of its old parent may change with the move.
+        observer = self._observer()
+        source = self.path if observer is not None else None
+        self._take(row)
+        if destination_row is None:
+            destination_row = destination.sorted_row(child) if settings.auto_sort else len(destination.children)
+        destination._insert(destination_row, child)
+        if observer is not None:
+            observer(('move', source, row, destination.path, destination_row))
+        return child
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def plan_move_up(self, rows: List[int]) -> List[Step]:
+        """Plan the steps to move the children in the provided rows up by one row each.
+
+        Each of the planning methods returns the individual moves, to be applied in order, that make up the edit.  The
+        rows of each step already account for the steps before it.  An empty plan means the edit isn't possible.
+        """
+        rows = sorted(rows)
+        if not rows or rows[0] == 0 or settings.auto_sort:
+            return []
+        return [Step(self, row, self, row - 1) for row in rows]
+
+
+    def plan_move_down(self, rows: List[int]) -> List[Step]:
+        """Plan the steps to move the children in the provided rows down by one row each."""
+        rows = sorted(rows, reverse=True)
+        if not rows or rows[0] >= len(self.children) - 1 or settings.auto_sort:
+            return []
+        return [Step(self, row, self, row + 1) for row in rows]
+
+
+    def plan_indent(self, rows: List[int]) -> List[Step]:
+        """Plan the steps to make the children in the provided rows into children of the sibling above them."""
+        rows = sorted(rows)
+        if not rows or rows[0] == 0:
+            return []
+        target = self.children[rows[0] - 1]
+        end = len(target.children)
+        return [Step(self, row - index, target, None if settings.auto_sort else end + index)
+                for index, row in enumerate(rows)]
+
+
+    def plan_dedent(self, rows: List[int]) -> List[Step]:
+        """Plan the steps to move the children in the provided rows out to follow this item in its own parent."""
+        rows = sorted(rows)
+        if not rows or self.parent is None:
+            return []
+        after = self.row() + 1
+        return [Step(self, row - index, self.parent, None if settings.auto_sort else after + index)
+                for index, row in enumerate(rows)]
+
+
+    def plan_move_to(self, rows: List[int], destination: 'ItemModel', destination_row: int) -> List[Step]:
+        """Plan the steps to move the children in the provided rows, keeping their order, to a new place such as where
+        they were dropped.
+
+        Arguments:
+            rows: The rows of the children to be moved.
+            destination: The new parent for the children, which may be this same item.
+            destination_row: Where the children are to go amongst the children of the destination, counted with the
+                moving children still in place.  Ignored with auto-sort enabled, the children go in sorted position.
+        """
+        rows = sorted(rows)
+        if not rows or any(self.children[row] in destination.chain for row in rows):
+            return []
+        if destination is not self:
+            return [Step(self, row - index, destination, None if settings.auto_sort else destination_row + index)
+                    for index, row in enumerate(rows)]
+        if settings.auto_sort:
+            return []
+
+        # Within the same list the rows shift as each child is moved.  Children from above the drop are moved down from
+        # the last one up, then those from below are moved up from the first one down, so that no move disturbs a child
+        # that is already in place.  The order of the children is followed along to find the current row of each one.
+        target = destination_row - sum(1 for row in rows if row < destination_row)
+        moves = list(enumerate(rows))
+        above = [move for move in moves if move[1] < destination_row]
+        below = [move for move in moves if move[1] >= destination_row]
+        order = list(range(len(self.children)))
+        steps = []
+        for index, row in above[::-1] + below:
+            current = order.index(row)
+            if current != target + index:
+                order.insert(target + index, order.pop(current))
+                steps.append(Step(self, current, self, target + index))
+        return steps
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def diff(self, other: 'ItemModel') -> List[Edit]:
+        """Plan the edits that would turn the descendants of this item into copies of the descendants of other.
+
+        Siblings are matched up by their text so that unchanged items, and everything below them, are left alone.  Runs
+        of the same number of renamed items are treated as renames, keeping their children, while anything else that
+        differs is removed and inserted.  Inserted items are taken from the other tree as they are.
+
+        The edits are to be applied in order, with apply.  Within each list they run from the last row to the first so
+        that the rows of the remaining edits are not disturbed.
+        """
+        edits = []
+        stack = [(self, other)] if self.digest != other.digest else []
+        while stack:
+            before, after = stack.pop()
+            old, new = before.children, after.children
+            texts = [child.text for child in old], [child.text for child in new]
+            matcher = SequenceMatcher(None, *texts, autojunk=False)
+            for tag, start, end, new_start, new_end in reversed(matcher.get_opcodes()):
+                if tag == 'equal' or (tag == 'replace' and end - start == new_end - new_start):
+                    for offset in reversed(range(end - start)):
+                        item, replacement = old[start + offset], new[new_start + offset]
+                        if item.digest == replacement.digest:
+                            continue  # Identical all the way down, there's nothing to be done below this item.
+                        if item.text != replacement.text:
+                            edits.append(Edit('text', before, None, item, replacement.text))
+                        if item._checked != replacement._checked:
+                            edits.append(Edit('check', before, None, item, replacement._checked))
+                        if item.children or replacement.children:
+                            stack.append((item, replacement))
+                else:
+                    edits.extend(Edit('remove', before, row) for row in reversed(range(start, end)))
+                    edits.extend(Edit('insert', before, start + offset, new[new_start + offset])
+                                 for offset in range(new_end - new_start))
+        return edits
+
+
+    def apply(self, edit: Edit) -> None:
+        """Apply one of the edits planned by diff to the children of this item, the parent of the edit."""
+        if edit.action == 'remove':
+            self.take(edit.row)
+        elif edit.action == 'insert':
+            self.insert(edit.row, edit.item)
+        elif edit.action == 'text':
+            edit.item.text = edit.value
+        elif edit.action == 'check':
+            if edit.item.children:
+                # The state of a branch is worked out from its children, only its own stored state is being updated.
+                edit.item._checked = edit.value
+                edit.item._invalidate()
+            else:
+                edit.item.checked = edit.value
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def sorted_row(self, child: 'ItemModel') -> int:
+        """Binary search for the row where the provided item belongs amongst the (already sorted) children."""
+        return bisect_right(self.children, child.key, key=lambda sibling: sibling.key)
+
+
+    def reposition(self, child: 'ItemModel') -> int:
+        """Move a child whose text has changed back into sorted order.
+
+        Returns:
+            The new row of the child, which may be the same as its old row.
+        """
+        old_row = child.row()
+        self.children.pop(old_row)
+        row = self.sorted_row(child)
+        self.children.insert(row, child)
+        child._row = row
+        self._invalidate()
+        observer = self._observer()
+        if observer is not None:
+            observer(('move', self.path, old_row, self.path, row))
+        return row
+
+
+    def sort(self) -> None:
+        """Sort the children of this item and of all of its descendants using their collation keys."""
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if item.children:
+                item.children.sort(key=lambda child: child.key)
+                item._fragment = None
+                item._digest = None
+                stack.extend(item.children)
+        self._invalidate()
+        observer = self._observer()
+        if observer is not None:
+            observer(('sort', self.path))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def clear(self) -> None:
+        self.children = []
+        self.text = ''
+        self.checked = False
+        self._texts = None
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def dumps(self, level: int = 0, indent: str = '    ', preserve: bool = True) -> str:
+        """Return this item, and its children, as Markdown list items.
+
+        Arguments:
+            level: The level of this item in the list, determining how far it is indented.
+            indent: The indentation to use for each level.
+            preserve: When True the items that are unchanged since they were loaded are written exactly as they were in
+                the file, along with any lines in between them that weren't items.  Otherwise the canonical format is
+                used throughout.
+        """
+        # The check states of branches depend upon the auto-check setting, so it's part of what the fragment is for.
+        arguments = (level, indent, preserve, settings.auto_check)
+        if self._fragment is not None and self._fragment[0] == arguments:
+            return self._fragment[1]
+        instrument.count('ItemModel.dumps.render')
+
+        text = self._line(level, indent, preserve)
+        text += ''.join([child.dumps(level + 1, indent, preserve) for child in self.children])
+
+        self._fragment = (arguments, text)
+        return text
+
+
+    def _line(self, level: int, indent: str, preserve: bool) -> str:
+        """Return the Markdown for this item alone, without its children, see dumps."""
+        source = self._source if preserve else None
+        if source is not None and source[2] == self._text and source[3] == self.checked and source[4] == level:
+            return source[0] + source[1] + '\n'
+        text = source[0] if source is not None else ''
+        text += f"{indent * level}- [{'x' if self.checked else ' '}] {self.text}"
+        if self.children:
+            text += ':'
+        return text + '\n'
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def repr(self, level: int = 1) -> str:
+        indent = '  ' * level
+        text = f"{indent}<ItemModel checked={self.checked} text=\"{self.text}\"{'/' if not self.children else ''}>"
+        if self.children:
+            text += '\n'
+            text += f'\n'.join(child.repr(level + 1) for child in self.children)
+            text += f'\n{indent}</ItemModel>'
+        return text
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return self.repr()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+    def __getstate__(self) -> dict:
+        # A copy pasted elsewhere didn't come from the file, so it mustn't drag the lines around its original along.
+        state = self.__dict__.copy()
+        state['_source'] = None
+        state['_fragment'] = None
+        state['observer'] = None
+        return state
+
+
+
+
+# End of File
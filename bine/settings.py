@@ -1,54 +1,138 @@
-# ======================================================================================================================
-#      File:  /bine/settings.py
-#   Project:  Bine
-#    Author:  Jared Julien <jaredjulien@exsystems.net>
-# Copyright:  (c) 2022 Jared Julien, eX Systems
-# ---------------------------------------------------------------------------------------------------------------------
-# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
-# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
-# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
-# permit persons to whom the Software is furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
-# Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
-# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
-# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
-# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-# ----------------------------------------------------------------------------------------------------------------------
-"""Container for Bine's settings."""
-
-# ======================================================================================================================
-# Imports
-# ----------------------------------------------------------------------------------------------------------------------
-from dataclasses import dataclass
-
-
-
-
-# ======================================================================================================================
-# Settings Class
-# ----------------------------------------------------------------------------------------------------------------------
-@dataclass
-class Settings:
-    highlight_duplicates: bool = True
-    auto_check: bool = True
-    auto_sort: bool = False
-    hide_checked: bool = False
-
-    # TODO: Add a load function to load these settings from file.
-    # TODO: Add a save function to store these settings to file.
-
-
-
-
-# ======================================================================================================================
-# Settings Singleton
-# ----------------------------------------------------------------------------------------------------------------------
-settings = Settings()
-
-
-
-
-# End of File
+# ======================================================================================================================
+#      File:  /bine/settings.py
+#   Project:  Bine
+#    Author:  Jared Julien <jaredjulien@exsystems.net>
+# Copyright:  (c) 2022 Jared Julien, eX Systems
+# ---------------------------------------------------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+# OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ----------------------------------------------------------------------------------------------------------------------
+"""Container for Bine's settings."""
+
+# ======================================================================================================================
+# Imports
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import logging
+import tempfile
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List
+
+
+
+
+# ======================================================================================================================
+# Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def user_config_dir() -> str:
+    """Return the conventional per-user configuration directory for Bine on this platform."""
+    if sys.platform == 'win32':
+        base = os.environ.get('APPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Roaming'))
+        return os.path.join(base, 'bine')
+    if sys.platform == 'darwin':
+        return os.path.expanduser(os.path.join('~', 'Library', 'Application Support', 'bine'))
+    base = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser(os.path.join('~', '.config'))
+    return os.path.join(base, 'bine')
+
+
+
+
+# ======================================================================================================================
+# Settings Class
+# ----------------------------------------------------------------------------------------------------------------------
+@dataclass
+class Settings:
+    highlight_duplicates: bool = True
+    auto_check: bool = True
+    auto_sort: bool = False
+    hide_checked: bool = False
+    cache_documents: bool = True
+    journal_changes: bool = True
+    restore_session: bool = True
+    recent_files: List[str] = field(default_factory=list)
+
+    # The tabs that were open at the end of the last session, each a dictionary with the "filename" and the "selection"
+    # path of rows to the selected item, along with the index of the tab that was active.
+    session: List[Dict[str, Any]] = field(default_factory=list)
+    session_active: int = 0
+
+    RECENT_LIMIT = 10
+    FILENAME = 'settings.json'
+
+    def add_recent(self, filename: str) -> None:
+        """Move the provided file to the top of the recently used files list."""
+        filename = os.path.abspath(filename)
+        if filename in self.recent_files:
+            self.recent_files.remove(filename)
+        self.recent_files.insert(0, filename)
+        del self.recent_files[self.RECENT_LIMIT:]
+
+    def load(self, filename: str = None) -> None:
+        """Load the settings from file, keeping the current values of any that are missing or invalid.
+
+        Arguments:
+            filename: The file to read, defaulting to the settings file in the user's configuration directory.
+        """
+        filename = filename or os.path.join(user_config_dir(), self.FILENAME)
+        try:
+            with open(filename, 'r', encoding='utf-8') as handle:
+                stored = json.load(handle)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logging.warning('Unable to read settings from %s', filename, exc_info=True)
+            return
+
+        if not isinstance(stored, dict):
+            logging.warning('Ignoring malformed settings in %s', filename)
+            return
+        for setting in fields(self):
+            value = stored.get(setting.name)
+            if value is not None and type(value) is type(getattr(self, setting.name)):
+                setattr(self, setting.name, value)
+
+    def save(self, filename: str = None) -> None:
+        """Store the settings to file, replacing the previous file only once the new one has been written in full.
+
+        Arguments:
+            filename: The file to write, defaulting to the settings file in the user's configuration directory.
+        """
+        filename = filename or os.path.join(user_config_dir(), self.FILENAME)
+        folder = os.path.dirname(os.path.abspath(filename))
+        try:
+            os.makedirs(folder, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=folder)
+            try:
+                with os.fdopen(handle, 'w', encoding='utf-8') as output:
+                    json.dump(asdict(self), output, indent=4)
+                os.replace(temporary, filename)
+            except BaseException:
+                os.remove(temporary)
+                raise
+        except OSError:
+            logging.warning('Unable to save settings to %s', filename, exc_info=True)
+
+
+
+
+# ======================================================================================================================
+# Settings Singleton
+# ----------------------------------------------------------------------------------------------------------------------
+settings = Settings()
+
+
+
+
+# End of File